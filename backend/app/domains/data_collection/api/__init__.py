@@ -0,0 +1,5 @@
+"""
+Data Collection API Endpoints
+
+API endpoints for triggering and monitoring data ingestion.
+"""
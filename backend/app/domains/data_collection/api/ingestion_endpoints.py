@@ -0,0 +1,149 @@
+"""
+Ingestion API Endpoints
+
+Bulk ingestion runs as a background job: the request returns a job id
+immediately and the job's progress is polled separately.
+"""
+
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict
+
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Path, Request, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
+
+from ..models.market_data import BatchConcurrencyRequest, BulkIngestionRequest
+from ..services import get_data_collection_service
+from app.shared.response_models import APIResponse, IngestionResponse, create_success_response
+from app.shared.validation_utils import normalize_tickers
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Job state lives in-process; it is lost on restart and not shared between workers
+_jobs: Dict[str, Dict[str, Any]] = {}
+# Finished job ids in completion order, with their monotonic completion time
+_finished_jobs: "OrderedDict[str, float]" = OrderedDict()
+# Finished jobs are kept this long, and at most this many, for polling
+_FINISHED_JOB_TTL_SECONDS = 3600.0
+_MAX_FINISHED_JOBS = 1000
+
+def _evict_finished_jobs() -> None:
+    """Forgets finished jobs past the TTL, then the oldest beyond the cap."""
+    expires_before = time.monotonic() - _FINISHED_JOB_TTL_SECONDS
+    while _finished_jobs:
+        job_id, finished_at = next(iter(_finished_jobs.items()))
+        if finished_at >= expires_before and len(_finished_jobs) <= _MAX_FINISHED_JOBS:
+            break
+        _finished_jobs.popitem(last=False)
+        _jobs.pop(job_id, None)
+
+async def _run_bulk_ingestion(job_id: str, request: BulkIngestionRequest, tickers: list[str]):
+    job = _jobs[job_id]
+    job["status"] = "running"
+    try:
+        service = get_data_collection_service()
+        if request.data_type == "fundamentals":
+            summary = await service.collect_fundamentals_for_tickers(
+                tickers, max_concurrent=request.max_concurrent, label=f"job {job_id}"
+            )
+        else:
+            summary = await service.collect_daily_prices_for_tickers(
+                tickers, max_concurrent=request.max_concurrent, label=f"job {job_id}"
+            )
+        job.update(status="completed", result=summary)
+    except Exception as e:
+        logger.error(f"Bulk ingestion job {job_id} failed: {e}")
+        job.update(status="failed", error=str(e))
+    finally:
+        _finished_jobs[job_id] = time.monotonic()
+        _evict_finished_jobs()
+
+@router.post(
+    "/bulk",
+    response_model=IngestionResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    openapi_extra={"requestBody": {
+        "required": True,
+        "content": {"application/json": {"schema": BulkIngestionRequest.model_json_schema()}}
+    }}
+)
+async def ingest_bulk_tickers(http_request: Request, background_tasks: BackgroundTasks):
+    """
+    Starts ingesting prices or fundamentals for a list of tickers.
+    
+    Returns ``202 Accepted`` with an ingestion id as soon as the job is queued;
+    poll ``/ingest/jobs/{ingestion_id}`` for its status and results.
+    """
+    # Ticker lists can be long: validate straight from the raw bytes in pydantic's
+    # core instead of decoding to Python objects first and validating those.
+    try:
+        request = BulkIngestionRequest.model_validate_json(await http_request.body())
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+    
+    tickers = normalize_tickers(request.tickers)
+    if not tickers:
+        raise HTTPException(status_code=400, detail="At least one ticker is required.")
+    
+    _evict_finished_jobs()
+    job_id = uuid.uuid4().hex
+    _jobs[job_id] = {"status": "pending", "data_type": request.data_type, "tickers": tickers}
+    background_tasks.add_task(_run_bulk_ingestion, job_id, request, tickers)
+    
+    return IngestionResponse(
+        status="pending",
+        message=f"Queued {request.data_type} ingestion for {len(tickers)} tickers",
+        ingestion_id=job_id
+    )
+
+@router.get("/jobs/{job_id}", response_model=IngestionResponse)
+async def get_ingestion_job(job_id: str = Path(..., description="Ingestion id returned by /ingest/bulk")):
+    """
+    Returns the status of a bulk ingestion job, with its summary once finished.
+
+    While the job is unfinished, ``queued_batch_jobs`` reports how many batch
+    jobs in this process are waiting for a slot, this one possibly among them.
+    A finished job's summary is returned by the first poll that sees it and
+    then dropped; the job's status stays available for an hour.
+    """
+    _evict_finished_jobs()
+    job = _jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Ingestion job {job_id} not found")
+    
+    data = job
+    if job["status"] in ("pending", "running"):
+        data = {**job, "queued_batch_jobs": get_data_collection_service().batch_job_queue_depth}
+    elif "result" in job:
+        # Per-ticker summaries can be large; hand them out once instead of holding them
+        data = {**job}
+        job.pop("result")
+        job["result_delivered"] = True
+    
+    return IngestionResponse(
+        status=job["status"],
+        message=job.get("error"),
+        data=data,
+        ingestion_id=job_id
+    )
+
+@router.put("/concurrency", response_model=APIResponse)
+async def set_batch_concurrency(request: BatchConcurrencyRequest):
+    """
+    Changes the concurrency limit of every batch ingestion currently running.
+
+    Throttles or widens in-flight jobs without restarting them; jobs queued
+    later still use the ``max_concurrent`` they were submitted with.
+    """
+    resized = await get_data_collection_service().set_max_concurrent(request.max_concurrent)
+    return create_success_response(
+        data={"max_concurrent": request.max_concurrent, "running_batches": resized},
+        message=f"Concurrency limit set to {request.max_concurrent} for {resized} running batches"
+    )
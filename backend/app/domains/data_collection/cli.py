@@ -1,34 +1,82 @@
 import asyncio
 import click
 from dotenv import load_dotenv
-from .services import get_data_collection_service
-from .services.financial_statements_service import get_financial_statements_service
-from .services.sentiment_ingestion_service import get_sentiment_ingestion_service
-from .config.ticker_config import TickerGroup, get_ticker_config
 
 # Load environment variables from .env file
 load_dotenv()
 
+# Services, clients and pyarrow are imported inside the commands that use them,
+# so --help and shell completion don't pay for loading the whole domain.
+
+def _run(main):
+    """
+    Runs a command's coroutine on a fresh event loop.
+
+    The pooled API sessions are closed on that same loop before it shuts down,
+    so the keep-alive connections shared by every request in the command are
+    released cleanly instead of being left bound to a dead loop.
+    """
+    from .clients.tiingo_client import close_tiingo_client
+    from .clients.fmp_client import close_fmp_client
+    from .clients.alpha_vantage_client import close_alpha_vantage_client
+
+    async def runner():
+        try:
+            await main()
+        finally:
+            await asyncio.gather(close_tiingo_client(), close_fmp_client(), close_alpha_vantage_client())
+
+    asyncio.run(runner())
+
+def _format_price_rows(batch: "pa.RecordBatch") -> "pa.Array":
+    """
+    Formats a batch of date/close/volume rows as aligned text lines.
+
+    Every step is an Arrow compute kernel, so no per-cell Python formatting
+    happens however many rows are printed. Closes go through a two-place
+    decimal so they always show cents.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    dates = batch.column('date')
+    if pa.types.is_timestamp(dates.type):
+        dates = pc.cast(dates, pa.date32())
+    closes = pc.cast(pc.round(batch.column('close'), 2), pa.decimal128(18, 2), safe=False)
+    volumes = pc.cast(batch.column('volume'), pa.int64(), safe=False)
+    columns = [
+        pc.cast(dates, pa.string()),
+        pc.utf8_lpad(pc.fill_null(pc.cast(closes, pa.string()), ""), 12),
+        pc.utf8_lpad(pc.fill_null(pc.cast(volumes, pa.string()), ""), 14),
+    ]
+    return pc.binary_join_element_wise(*columns, "  ", null_handling='replace')
+
+def _echo_lines(lines):
+    """Writes a multi-line report with a single echo instead of one write per line."""
+    click.echo("\n".join(lines))
+
 @click.group()
 def data_collection_cli():
     """CLI for managing the data collection domain."""
     pass
 
 @data_collection_cli.command()
-def fetch_key_indicators():
+@click.option('--full-refresh', is_flag=True, help="Refetch each series' full history instead of only its latest stored year onwards.")
+def fetch_key_indicators(full_refresh: bool):
     """
     Fetches a predefined list of key macroeconomic indicators from FRED 
     and stores them in S3.
     """
     click.echo("Fetching key macroeconomic indicators from FRED...")
+    from .services import get_data_collection_service
     service = get_data_collection_service()
     
     async def main():
-        result = await service.collect_key_macro_indicators()
+        result = await service.collect_key_macro_indicators(full_refresh=full_refresh)
         click.echo("Collection process completed.")
         click.echo(f"Summary: {result}")
 
-    asyncio.run(main())
+    _run(main)
 
 @data_collection_cli.command()
 @click.argument('ticker')
@@ -38,6 +86,7 @@ def fetch_daily_prices(ticker: str):
     TICKER: The stock ticker symbol (e.g., 'AAPL').
     """
     click.echo(f"Fetching daily prices for ticker: {ticker.upper()}")
+    from .services import get_data_collection_service
     service = get_data_collection_service()
     
     async def main():
@@ -45,7 +94,95 @@ def fetch_daily_prices(ticker: str):
         click.echo("Collection process completed.")
         click.echo(f"Summary: {result}")
 
-    asyncio.run(main())
+    _run(main)
+
+@data_collection_cli.command()
+@click.argument('ticker')
+@click.option('--start-date', type=click.DateTime(formats=['%Y-%m-%d']), default=None, help='First date to show (YYYY-MM-DD)')
+@click.option('--end-date', type=click.DateTime(formats=['%Y-%m-%d']), default=None, help='Last date to show (YYYY-MM-DD)')
+@click.option('--limit', type=int, default=None, help='Maximum number of rows to show')
+def query_prices(ticker: str, start_date, end_date, limit: int):
+    """
+    Prints stored daily prices for a stock ticker, oldest first.
+    TICKER: The stock ticker symbol (e.g., 'AAPL').
+    """
+    from .storage.s3_storage_service import get_s3_storage_service
+    storage = get_s3_storage_service()
+
+    async def main():
+        reader = await storage.open_price_reader(
+            ticker.upper(),
+            columns=['date', 'close', 'volume'],
+            start_date=start_date.date() if start_date else None,
+            end_date=end_date.date() if end_date else None
+        )
+        if reader is None:
+            click.echo(f"No price data stored for {ticker.upper()}.")
+            return
+
+        # Rows are formatted straight from the Arrow batches as they stream in,
+        # and reading stops once the limit is reached
+        remaining = limit
+        for batch in reader:
+            if remaining is not None:
+                batch = batch.slice(0, remaining)
+                remaining -= batch.num_rows
+            if batch.num_rows:
+                click.echo("\n".join(_format_price_rows(batch).to_pylist()))
+            if remaining == 0:
+                break
+
+    _run(main)
+
+@data_collection_cli.command()
+@click.argument('ticker')
+@click.argument('output_path', type=click.Path(dir_okay=False, writable=True))
+@click.option('--format', 'output_format', type=click.Choice(['parquet', 'csv', 'json']), default='parquet', help='Output file format (default: parquet)')
+@click.option('--start-date', type=click.DateTime(formats=['%Y-%m-%d']), default=None, help='First date to export (YYYY-MM-DD)')
+@click.option('--end-date', type=click.DateTime(formats=['%Y-%m-%d']), default=None, help='Last date to export (YYYY-MM-DD)')
+def export_prices(ticker: str, output_path: str, output_format: str, start_date, end_date):
+    """
+    Exports stored daily prices for a stock ticker to a local file.
+    TICKER: The stock ticker symbol (e.g., 'AAPL').
+    OUTPUT_PATH: The file to write.
+    """
+    from .storage.s3_storage_service import get_s3_storage_service
+    storage = get_s3_storage_service()
+
+    async def main():
+        import pyarrow.csv as pa_csv
+        import pyarrow.parquet as pq
+        from ...shared.response_utils import record_batch_to_ndjson
+
+        reader = await storage.open_price_reader(
+            ticker.upper(),
+            start_date=start_date.date() if start_date else None,
+            end_date=end_date.date() if end_date else None
+        )
+        if reader is None:
+            click.echo(f"No price data stored for {ticker.upper()}.")
+            return
+
+        # Batches go straight from the S3 scan to the file writer, never through pandas
+        rows = 0
+        if output_format == 'json':
+            # Newline-delimited records, serialized one batch at a time
+            with open(output_path, 'wb') as f:
+                for batch in reader:
+                    f.write(record_batch_to_ndjson(batch))
+                    rows += batch.num_rows
+        else:
+            if output_format == 'parquet':
+                writer = pq.ParquetWriter(output_path, reader.schema, compression='zstd')
+            else:
+                writer = pa_csv.CSVWriter(output_path, reader.schema)
+            with writer:
+                for batch in reader:
+                    writer.write_batch(batch)
+                    rows += batch.num_rows
+        click.echo(f"Exported {rows:,} rows for {ticker.upper()} to {output_path}")
+
+    _run(main)
 
 @data_collection_cli.command()
 @click.argument('tickers', nargs=-1)
@@ -58,19 +195,22 @@ def fetch_fundamentals(tickers: tuple[str]):
         click.echo("Please provide at least one ticker.")
         return
 
+    from ...shared.validation_utils import normalize_tickers
+    tickers = normalize_tickers(tickers)
     click.echo(f"Starting fundamental data collection for: {', '.join(tickers)}")
+    from .services import get_data_collection_service
     service = get_data_collection_service()
 
     async def main():
-        tasks = [service.collect_fundamentals(ticker.upper()) for ticker in tickers]
-        results = await asyncio.gather(*tasks)
+        summary = await service.collect_fundamentals_for_tickers(tickers)
         
-        click.echo("\n--- Bulk Ingestion Summary ---")
-        for result in results:
-            click.echo(f"  - {result.get('ticker')}: {result.get('status')}, Records: {result.get('records_added', 0)}")
-        click.echo("---------------------------------")
+        lines = ["\n--- Bulk Ingestion Summary ---"]
+        for result in summary["results"]:
+            lines.append(f"  - {result.get('ticker')}: {result.get('status')}, Records: {result.get('records_added', 0)}")
+        lines.append("---------------------------------")
+        _echo_lines(lines)
 
-    asyncio.run(main())
+    _run(main)
 
 @data_collection_cli.command()
 @click.argument('tickers', nargs=-1)
@@ -83,19 +223,22 @@ def fetch_financial_statements(tickers: tuple[str]):
         click.echo("Please provide at least one ticker.")
         return
 
+    from ...shared.validation_utils import normalize_tickers
+    tickers = normalize_tickers(tickers)
     click.echo(f"Starting financial statement collection for: {', '.join(tickers)}")
+    from .services.financial_statements_service import get_financial_statements_service
     service = get_financial_statements_service()
 
     async def main():
         for ticker in tickers:
-            click.echo(f"Fetching statements for {ticker.upper()}...")
-            await service.ingest_financial_statements_for_ticker(ticker.upper())
-            click.echo(f"Completed {ticker.upper()}. Waiting 15 seconds before next ticker...")
+            click.echo(f"Fetching statements for {ticker}...")
+            await service.ingest_financial_statements_for_ticker(ticker)
+            click.echo(f"Completed {ticker}. Waiting 15 seconds before next ticker...")
             await asyncio.sleep(15) # Add a delay to avoid rate-limiting
 
         click.echo("\n--- Financial Statement Ingestion Complete ---")
 
-    asyncio.run(main())
+    _run(main)
 
 @data_collection_cli.command()
 @click.argument('tickers', nargs=-1)
@@ -108,14 +251,17 @@ def fetch_sentiment(tickers: tuple[str]):
         click.echo("Please provide at least one ticker.")
         return
 
+    from ...shared.validation_utils import normalize_tickers
+    tickers = normalize_tickers(tickers)
     click.echo(f"Starting sentiment data collection for: {', '.join(tickers)}")
+    from .services.sentiment_ingestion_service import get_sentiment_ingestion_service
     service = get_sentiment_ingestion_service()
 
     async def main():
-        await service.ingest_sentiment_for_tickers(list(tickers))
+        await service.ingest_sentiment_for_tickers(tickers)
         click.echo("\n--- Sentiment Ingestion Complete ---")
 
-    asyncio.run(main())
+    _run(main)
 
 
 # New Batch Processing Commands with Ticker Groups
@@ -128,7 +274,11 @@ def fetch_sentiment(tickers: tuple[str]):
 @click.option('--max-concurrent', 
               default=5, 
               help='Maximum concurrent API calls (default: 5)')
-def fetch_prices_batch(group: str, max_concurrent: int):
+@click.option('--rps', 
+              type=float, 
+              default=None, 
+              help='Maximum Tiingo requests per second (default: from config)')
+def fetch_prices_batch(group: str, max_concurrent: int, rps: float):
     """
     Fetch daily prices for all tickers in a specified group.
     
@@ -138,6 +288,8 @@ def fetch_prices_batch(group: str, max_concurrent: int):
     click.echo(f"Fetching daily prices for {group.upper()} ticker group...")
     click.echo(f"Max concurrent requests: {max_concurrent}")
     
+    from .config.ticker_config import TickerGroup, get_ticker_config
+    from .services import get_data_collection_service
     service = get_data_collection_service()
     ticker_group = TickerGroup(group)
     
@@ -147,25 +299,28 @@ def fetch_prices_batch(group: str, max_concurrent: int):
         tickers = config.get_tickers_by_group(ticker_group)
         click.echo(f"Processing {len(tickers)} tickers...")
         
-        result = await service.collect_daily_prices_batch(ticker_group, max_concurrent)
+        result = await service.collect_daily_prices_batch(ticker_group, max_concurrent, rps)
         
-        click.echo(f"\n--- Batch Price Collection Summary ---")
-        click.echo(f"Group: {result['group'].upper()}")
-        click.echo(f"Total Tickers: {result['total_tickers']}")
-        click.echo(f"✅ Successful: {result['successful']}")
-        click.echo(f"📅 Up to Date: {result['up_to_date']}")
-        click.echo(f"❌ Failed: {result['failed']}")
-        click.echo(f"📭 No New Data: {result['no_new_data']}")
-        click.echo("----------------------------------------")
+        lines = [
+            f"\n--- Batch Price Collection Summary ---",
+            f"Group: {result['group'].upper()}",
+            f"Total Tickers: {result['total_tickers']}",
+            f"✅ Successful: {result['successful']}",
+            f"📅 Up to Date: {result['up_to_date']}",
+            f"❌ Failed: {result['failed']}",
+            f"📭 No New Data: {result['no_new_data']}",
+            "----------------------------------------",
+        ]
         
         # Show failed tickers if any
         if result['failed'] > 0:
             failed_tickers = [r['ticker'] for r in result['results'] if r.get('status') == 'error']
-            click.echo(f"Failed tickers: {', '.join(failed_tickers[:10])}")
+            lines.append(f"Failed tickers: {', '.join(failed_tickers[:10])}")
             if len(failed_tickers) > 10:
-                click.echo(f"... and {len(failed_tickers) - 10} more")
+                lines.append(f"... and {len(failed_tickers) - 10} more")
+        _echo_lines(lines)
 
-    asyncio.run(main())
+    _run(main)
 
 
 @data_collection_cli.command()
@@ -179,7 +334,11 @@ def fetch_prices_batch(group: str, max_concurrent: int):
 @click.option('--limit', 
               default=5, 
               help='Number of years of data to fetch (default: 5)')
-def fetch_fundamentals_batch(group: str, max_concurrent: int, limit: int):
+@click.option('--rps', 
+              type=float, 
+              default=None, 
+              help='Maximum FMP requests per second (default: from config)')
+def fetch_fundamentals_batch(group: str, max_concurrent: int, limit: int, rps: float):
     """
     Fetch fundamental data for all tickers in a specified group.
     
@@ -190,6 +349,8 @@ def fetch_fundamentals_batch(group: str, max_concurrent: int, limit: int):
     click.echo(f"Max concurrent requests: {max_concurrent}")
     click.echo(f"Years of data: {limit}")
     
+    from .config.ticker_config import TickerGroup, get_ticker_config
+    from .services import get_data_collection_service
     service = get_data_collection_service()
     ticker_group = TickerGroup(group)
     
@@ -199,24 +360,27 @@ def fetch_fundamentals_batch(group: str, max_concurrent: int, limit: int):
         tickers = config.get_tickers_by_group(ticker_group)
         click.echo(f"Processing {len(tickers)} tickers...")
         
-        result = await service.collect_fundamentals_batch(ticker_group, max_concurrent, limit)
+        result = await service.collect_fundamentals_batch(ticker_group, max_concurrent, limit, rps)
         
-        click.echo(f"\n--- Batch Fundamentals Collection Summary ---")
-        click.echo(f"Group: {result['group'].upper()}")
-        click.echo(f"Total Tickers: {result['total_tickers']}")
-        click.echo(f"✅ Successful: {result['successful']}")
-        click.echo(f"❌ Failed: {result['failed']}")
-        click.echo(f"📭 No New Data: {result['no_new_data']}")
-        click.echo("---------------------------------------------")
+        lines = [
+            f"\n--- Batch Fundamentals Collection Summary ---",
+            f"Group: {result['group'].upper()}",
+            f"Total Tickers: {result['total_tickers']}",
+            f"✅ Successful: {result['successful']}",
+            f"❌ Failed: {result['failed']}",
+            f"📭 No New Data: {result['no_new_data']}",
+            "---------------------------------------------",
+        ]
         
         # Show failed tickers if any
         if result['failed'] > 0:
             failed_tickers = [r['ticker'] for r in result['results'] if r.get('status') == 'error']
-            click.echo(f"Failed tickers: {', '.join(failed_tickers[:10])}")
+            lines.append(f"Failed tickers: {', '.join(failed_tickers[:10])}")
             if len(failed_tickers) > 10:
-                click.echo(f"... and {len(failed_tickers) - 10} more")
+                lines.append(f"... and {len(failed_tickers) - 10} more")
+        _echo_lines(lines)
 
-    asyncio.run(main())
+    _run(main)
 
 
 @data_collection_cli.command()
@@ -240,6 +404,8 @@ def fetch_comprehensive_batch(group: str, include_fundamentals: bool):
     else:
         click.echo("Including: Daily prices only")
     
+    from .config.ticker_config import TickerGroup, get_ticker_config
+    from .services import get_data_collection_service
     service = get_data_collection_service()
     ticker_group = TickerGroup(group)
     
@@ -251,26 +417,67 @@ def fetch_comprehensive_batch(group: str, include_fundamentals: bool):
         
         result = await service.collect_comprehensive_batch(ticker_group, include_fundamentals)
         
-        click.echo(f"\n--- Comprehensive Collection Summary ---")
-        click.echo(f"Group: {result['group'].upper()}")
+        lines = [f"\n--- Comprehensive Collection Summary ---", f"Group: {result['group'].upper()}"]
         
         # Price collection summary
         price_result = result['price_collection']
-        click.echo(f"\n📈 PRICE COLLECTION:")
-        click.echo(f"  ✅ Successful: {price_result['successful']}")
-        click.echo(f"  📅 Up to Date: {price_result['up_to_date']}")
-        click.echo(f"  ❌ Failed: {price_result['failed']}")
+        lines += [
+            f"\n📈 PRICE COLLECTION:",
+            f"  ✅ Successful: {price_result['successful']}",
+            f"  📅 Up to Date: {price_result['up_to_date']}",
+            f"  ❌ Failed: {price_result['failed']}",
+        ]
         
         # Fundamentals collection summary (if included)
         if include_fundamentals and 'fundamentals_collection' in result:
             fund_result = result['fundamentals_collection']
-            click.echo(f"\n📊 FUNDAMENTALS COLLECTION:")
-            click.echo(f"  ✅ Successful: {fund_result['successful']}")
-            click.echo(f"  ❌ Failed: {fund_result['failed']}")
+            lines += [
+                f"\n📊 FUNDAMENTALS COLLECTION:",
+                f"  ✅ Successful: {fund_result['successful']}",
+                f"  ❌ Failed: {fund_result['failed']}",
+            ]
         
-        click.echo("----------------------------------------")
+        lines.append("----------------------------------------")
+        _echo_lines(lines)
+
+    _run(main)
 
-    asyncio.run(main())
+
+@data_collection_cli.command()
+@click.option('--group', 
+              type=click.Choice(['dow', 'sp500', 'nasdaq', 'russell2000', 'top_etfs']), 
+              required=True,
+              help='Ticker group to process')
+@click.option('--force-refresh', is_flag=True, help='Rebuild tickers that already have valid merged data stored.')
+def build_merged_data(group: str, force_refresh: bool):
+    """
+    Build the merged price, macro and indicator datasets for a ticker group.
+    
+    Tickers are rebuilt together: one price scan, one load of the macro
+    series and one batched indicator pass for the whole group.
+    """
+    from .config.ticker_config import TickerGroup, get_ticker_config
+    from .services.data_merging_service import data_merging_service
+    tickers = get_ticker_config().get_tickers_by_group(TickerGroup(group))
+    click.echo(f"Building merged data for {len(tickers)} {group.upper()} tickers...")
+    
+    async def main():
+        results = await data_merging_service.get_merged_data_for_tickers(tickers, force_refresh=force_refresh)
+        missing = [ticker for ticker, merged_df in results.items() if merged_df is None]
+        lines = [
+            f"\n--- Merged Data Summary ---",
+            f"Group: {group.upper()}",
+            f"✅ Built or up to date: {len(results) - len(missing)}",
+            f"❌ No valid data: {len(missing)}",
+            "----------------------------------------",
+        ]
+        if missing:
+            lines.append(f"Tickers without data: {', '.join(missing[:10])}")
+            if len(missing) > 10:
+                lines.append(f"... and {len(missing) - 10} more")
+        _echo_lines(lines)
+
+    _run(main)
 
 
 @data_collection_cli.command()
@@ -281,23 +488,29 @@ def list_ticker_groups():
     Shows the available groups, ticker counts, and sample tickers
     for planning batch data collection operations.
     """
-    click.echo("Available Ticker Groups:")
-    click.echo("=" * 50)
+    lines = ["Available Ticker Groups:", "=" * 50]
     
+    from .services import get_data_collection_service
     service = get_data_collection_service()
     groups_info = service.get_available_ticker_groups()
     
     for group_info in groups_info:
-        click.echo(f"\n📊 {group_info['group'].upper()}")
-        click.echo(f"   Description: {group_info['description']}")
-        click.echo(f"   Ticker Count: {group_info['ticker_count']}")
-        click.echo(f"   Sample: {', '.join(group_info['sample_tickers'])}")
+        lines += [
+            f"\n📊 {group_info['group'].upper()}",
+            f"   Description: {group_info['description']}",
+            f"   Ticker Count: {group_info['ticker_count']}",
+            f"   Sample: {', '.join(group_info['sample_tickers'])}",
+        ]
     
-    click.echo("\n" + "=" * 50)
-    click.echo("Usage Examples:")
-    click.echo("  python -m app.domains.data_collection.cli fetch-prices-batch --group dow")
-    click.echo("  python -m app.domains.data_collection.cli fetch-fundamentals-batch --group sp500")
-    click.echo("  python -m app.domains.data_collection.cli fetch-comprehensive-batch --group nasdaq")
+    lines += [
+        "\n" + "=" * 50,
+        "Usage Examples:",
+        "  python -m app.domains.data_collection.cli fetch-prices-batch --group dow",
+        "  python -m app.domains.data_collection.cli fetch-fundamentals-batch --group sp500",
+        "  python -m app.domains.data_collection.cli fetch-comprehensive-batch --group nasdaq",
+        "  python -m app.domains.data_collection.cli build-merged-data --group dow",
+    ]
+    _echo_lines(lines)
 
 
 @data_collection_cli.command()
@@ -308,19 +521,20 @@ def show_group_tickers(group: str):
     
     GROUP: The ticker group to display (dow, sp500, nasdaq, russell2000, top_etfs)
     """
+    from .config.ticker_config import TickerGroup, get_ticker_config
     config = get_ticker_config()
     ticker_group = TickerGroup(group)
     tickers = config.get_tickers_by_group(ticker_group)
     
-    click.echo(f"\n{group.upper()} Tickers ({len(tickers)} total):")
-    click.echo("=" * 40)
+    lines = [f"\n{group.upper()} Tickers ({len(tickers)} total):", "=" * 40]
     
     # Display in columns of 10
     for i in range(0, len(tickers), 10):
         row = tickers[i:i+10]
-        click.echo("  ".join(f"{ticker:6}" for ticker in row))
+        lines.append("  ".join(f"{ticker:6}" for ticker in row))
     
-    click.echo("=" * 40)
+    lines.append("=" * 40)
+    _echo_lines(lines)
 
 
 if __name__ == '__main__':
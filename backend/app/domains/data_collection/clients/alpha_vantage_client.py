@@ -10,6 +10,7 @@ from pydantic import parse_obj_as, ValidationError, TypeAdapter, BaseModel
 
 # App imports
 from ..config import get_data_collection_config
+from .http_limits import get_http_limits
 
 logger = logging.getLogger(__name__)
 
@@ -24,7 +25,7 @@ class AlphaVantageClient:
         if not self.api_key:
             raise ValueError("Alpha Vantage API key is required. Set ALPHA_VANTAGE_API_KEY environment variable.")
         self.base_url = base_url.rstrip('/')
-        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=30.0)
+        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=30.0, limits=get_http_limits(self.config))
 
     async def close(self):
         """Closes the underlying httpx client."""
@@ -70,8 +71,20 @@ class AlphaVantageClient:
         
         return await self._make_request(params=params)
 
+from app.shared.singleton import get_singleton, pop_singleton
+
 def get_alpha_vantage_client() -> "AlphaVantageClient":
-    """Returns a singleton instance of the AlphaVantageClient."""
-    # This is a simple implementation. For a more robust solution,
-    # consider a more sophisticated singleton pattern or dependency injection.
-    return AlphaVantageClient() 
\ No newline at end of file
+    """
+    Returns a singleton instance of the AlphaVantageClient.
+
+    Every caller shares the one client, and with it the httpx connection pool,
+    instead of opening a new pool per call.
+    """
+    return get_singleton(AlphaVantageClient)
+
+
+async def close_alpha_vantage_client():
+    """Closes the shared AlphaVantageClient's connection pool, if one was created."""
+    client = pop_singleton(AlphaVantageClient)
+    if client is not None:
+        await client.close()
@@ -10,10 +10,12 @@ from typing import Optional, List, Dict, Any, Union
 import httpx
 from pydantic import parse_obj_as, ValidationError, TypeAdapter, BaseModel
 from decimal import Decimal
+import numpy as np
 import pandas as pd
 
 # App imports
 from ..config import get_data_collection_config
+from .http_limits import get_http_limits
 from ..models.financials import (
     IncomeStatementEntry,
     BalanceSheetEntry,
@@ -29,6 +31,64 @@ logger = logging.getLogger(__name__)
 
 FMP_API_BASE_URL = "https://financialmodelingprep.com/api"
 
+# FMPFundamentalsDataPoint field -> column of the merged ratios/key-metrics frame
+_FUNDAMENTALS_FIELD_SOURCES: Dict[str, str] = {
+    "pe_ratio": "priceEarningsRatio",
+    "pb_ratio": "priceToBookRatio",
+    "ps_ratio": "priceToSalesRatio",
+    "pcf_ratio": "priceCashFlowRatio",
+    "peg_ratio": "priceEarningsToGrowthRatio",
+    "ev_to_sales": "evToSales",
+    "ev_to_ebitda": "enterpriseValueOverEBITDA",
+    "market_cap": "marketCap",
+    "enterprise_value": "enterpriseValue",
+    "net_profit_margin": "netProfitMargin",
+    "return_on_assets": "returnOnAssets",
+    "return_on_equity": "returnOnEquity",
+    "return_on_capital_employed": "returnOnCapitalEmployed",
+    "current_ratio": "currentRatio_metric",
+    "quick_ratio": "quickRatio",
+    "cash_ratio": "cashRatio",
+    "operating_cash_flow_per_share": "operatingCashFlowPerShare",
+    "free_cash_flow_per_share": "freeCashFlowPerShare",
+    "debt_to_equity": "debtToEquity_metric",
+    "debt_to_assets": "debtToAssets_metric",
+    "net_debt_to_ebitda": "netDebtToEBITDA_metric",
+    "interest_coverage": "interestCoverage_metric",
+    "asset_turnover": "assetTurnover",
+    "inventory_turnover": "inventoryTurnover_metric",
+    "receivables_turnover": "receivablesTurnover_metric",
+    "days_of_sales_outstanding": "daysOfSalesOutstanding",
+    "days_of_inventory_outstanding": "daysOfInventoryOutstanding",
+    "days_of_payables_outstanding": "daysOfPayablesOutstanding",
+    "cash_conversion_cycle": "cashConversionCycle",
+    "revenue_growth": "revenue_growth",
+    "epsgrowth": "eps_growth",
+    "operating_income_growth": "operating_income_growth",
+    "free_cash_flow_growth": "free_cash_flow_growth",
+    "book_value_per_share": "bookValuePerShare",
+    "tangible_book_value_per_share": "tangibleBookValuePerShare",
+    "shareholders_equity_per_share": "shareholdersEquityPerShare",
+    "dividend_yield": "dividendYield_metric",
+    "dividend_payout_ratio": "payoutRatio_metric",
+    "shares_outstanding": "shares_outstanding",
+    "weighted_average_shares_outstanding": "weighted_average_shares_outstanding",
+    "earnings_per_share": "eps",
+    "working_capital": "workingCapital",
+}
+
+
+def _finite_decimals(column: pd.Series) -> List[Optional[Decimal]]:
+    """
+    Converts a column to Decimals, mapping missing, non-numeric and infinite values to None.
+
+    Finiteness is checked with one vectorized mask rather than per value, and an
+    infinite ratio no longer fails validation of the whole datapoint.
+    """
+    finite = np.isfinite(pd.to_numeric(column, errors="coerce").to_numpy(dtype=np.float64))
+    return [Decimal(str(value)) if ok else None for value, ok in zip(column.tolist(), finite)]
+
+
 class FMPClient:
     _client: httpx.AsyncClient
 
@@ -38,7 +98,7 @@ class FMPClient:
         if not self.api_key:
             raise ValueError("FMP API key is required. Set FMP_API_KEY environment variable.")
         self.base_url = base_url.rstrip('/')
-        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=15.0)
+        self._client = httpx.AsyncClient(base_url=self.base_url, timeout=15.0, limits=get_http_limits(self.config))
         self.ratios_endpoint = "v3/ratios"
         self.key_metrics_endpoint = "v3/key-metrics"
 
@@ -206,63 +266,21 @@ class FMPClient:
     ) -> List[FMPFundamentalsDataPoint]:
         
         datapoints = []
-        
-        def safe_decimal(value, default=None):
-            if value is None or pd.isna(value):
-                return default
-            try:
-                return Decimal(str(value))
-            except (ValueError, TypeError):
-                return default
-
-        for _, row in df.iterrows():
-            datapoint_data = {
-                "ticker": ticker,
-                "date": row.get("date"),
-                "period": row.get("period"),
-                "pe_ratio": safe_decimal(row.get('priceEarningsRatio')),
-                "pb_ratio": safe_decimal(row.get('priceToBookRatio')),
-                "ps_ratio": safe_decimal(row.get('priceToSalesRatio')),
-                "pcf_ratio": safe_decimal(row.get('priceCashFlowRatio')),
-                "peg_ratio": safe_decimal(row.get('priceEarningsToGrowthRatio')),
-                "ev_to_sales": safe_decimal(row.get('evToSales')),
-                "ev_to_ebitda": safe_decimal(row.get('enterpriseValueOverEBITDA')),
-                "market_cap": safe_decimal(row.get('marketCap')),
-                "enterprise_value": safe_decimal(row.get('enterpriseValue')),
-                "net_profit_margin": safe_decimal(row.get('netProfitMargin')),
-                "return_on_assets": safe_decimal(row.get('returnOnAssets')),
-                "return_on_equity": safe_decimal(row.get('returnOnEquity')),
-                "return_on_capital_employed": safe_decimal(row.get('returnOnCapitalEmployed')),
-                "current_ratio": safe_decimal(row.get('currentRatio_metric')),
-                "quick_ratio": safe_decimal(row.get('quickRatio')),
-                "cash_ratio": safe_decimal(row.get('cashRatio')),
-                "operating_cash_flow_per_share": safe_decimal(row.get('operatingCashFlowPerShare')),
-                "free_cash_flow_per_share": safe_decimal(row.get('freeCashFlowPerShare')),
-                "debt_to_equity": safe_decimal(row.get('debtToEquity_metric')),
-                "debt_to_assets": safe_decimal(row.get('debtToAssets_metric')),
-                "net_debt_to_ebitda": safe_decimal(row.get('netDebtToEBITDA_metric')),
-                "interest_coverage": safe_decimal(row.get('interestCoverage_metric')),
-                "asset_turnover": safe_decimal(row.get('assetTurnover')),
-                "inventory_turnover": safe_decimal(row.get('inventoryTurnover_metric')),
-                "receivables_turnover": safe_decimal(row.get('receivablesTurnover_metric')),
-                "days_of_sales_outstanding": safe_decimal(row.get('daysOfSalesOutstanding')),
-                "days_of_inventory_outstanding": safe_decimal(row.get('daysOfInventoryOutstanding')),
-                "days_of_payables_outstanding": safe_decimal(row.get('daysOfPayablesOutstanding')),
-                "cash_conversion_cycle": safe_decimal(row.get('cashConversionCycle')),
-                "revenue_growth": safe_decimal(row.get('revenue_growth')),
-                "epsgrowth": safe_decimal(row.get('eps_growth')),
-                "operating_income_growth": safe_decimal(row.get('operating_income_growth')),
-                "free_cash_flow_growth": safe_decimal(row.get('free_cash_flow_growth')),
-                "book_value_per_share": safe_decimal(row.get('bookValuePerShare')),
-                "tangible_book_value_per_share": safe_decimal(row.get('tangibleBookValuePerShare')),
-                "shareholders_equity_per_share": safe_decimal(row.get('shareholdersEquityPerShare')),
-                "dividend_yield": safe_decimal(row.get('dividendYield_metric')),
-                "dividend_payout_ratio": safe_decimal(row.get('payoutRatio_metric')),
-                "shares_outstanding": safe_decimal(row.get('shares_outstanding')),
-                "weighted_average_shares_outstanding": safe_decimal(row.get('weighted_average_shares_outstanding')),
-                "earnings_per_share": safe_decimal(row.get('eps')),
-                "working_capital": safe_decimal(row.get('workingCapital')),
-            }
+
+        # Convert column by column instead of boxing every row into a Series
+        row_count = len(df)
+        columns: Dict[str, List[Any]] = {
+            "date": df["date"].tolist() if "date" in df.columns else [None] * row_count,
+            "period": df["period"].tolist() if "period" in df.columns else [None] * row_count,
+        }
+        for field, source in _FUNDAMENTALS_FIELD_SOURCES.items():
+            if source in df.columns:
+                columns[field] = _finite_decimals(df[source])
+            else:
+                columns[field] = [None] * row_count
+
+        for row_values in zip(*columns.values()):
+            datapoint_data = {"ticker": ticker, **dict(zip(columns.keys(), row_values))}
             try:
                 datapoints.append(FMPFundamentalsDataPoint(**datapoint_data))
             except ValidationError as e:
@@ -309,10 +327,17 @@ class FMPClient:
         except Exception as e:
             return False
 
-from app.shared.singleton import get_singleton
+from app.shared.singleton import get_singleton, pop_singleton
 
 def get_fmp_client() -> "FMPClient":
     """Provides a singleton instance of the FMPClient."""
     return get_singleton(FMPClient)
 
+
+async def close_fmp_client():
+    """Closes the shared FMPClient's connection pool, if one was created."""
+    client = pop_singleton(FMPClient)
+    if client is not None:
+        await client.close()
+
  
\ No newline at end of file
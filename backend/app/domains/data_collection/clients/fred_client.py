@@ -1,4 +1,7 @@
 import os
+from datetime import date
+from typing import Optional
+
 from fredapi import Fred
 import pandas as pd
 
@@ -12,17 +15,18 @@ class FredClient:
             raise ValueError("FRED_API_KEY environment variable not set.")
         self.fred = Fred(api_key=self.api_key)
 
-    def get_series(self, series_id: str) -> pd.DataFrame:
+    def get_series(self, series_id: str, observation_start: Optional[date] = None) -> pd.DataFrame:
         """
         Fetches a time series from FRED.
 
         Args:
             series_id: The ID of the series to fetch (e.g., 'GDP').
+            observation_start: Earliest observation to fetch; the full history when omitted.
 
         Returns:
             A pandas DataFrame containing the time series data.
         """
-        series_data = self.fred.get_series(series_id)
+        series_data = self.fred.get_series(series_id, observation_start=observation_start)
         df = pd.DataFrame({series_id: series_data})
         df.index.name = 'date'
         return df
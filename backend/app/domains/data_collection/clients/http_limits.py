@@ -0,0 +1,12 @@
+import httpx
+
+from ..config.settings import DataCollectionSettings
+
+
+def get_http_limits(config: DataCollectionSettings) -> httpx.Limits:
+    """Builds the httpx connection pool limits shared by the API clients."""
+    return httpx.Limits(
+        max_connections=config.http_max_connections,
+        max_keepalive_connections=config.http_max_keepalive_connections,
+        keepalive_expiry=config.http_keepalive_expiry,
+    )
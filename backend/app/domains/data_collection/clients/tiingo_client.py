@@ -10,20 +10,87 @@ import asyncio
 import json
 import logging
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Optional, Union, Any
+from typing import AsyncIterator, Dict, List, Optional, Union, Any
 
 # Third-party imports
 import aiohttp
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 from decimal import Decimal
 from pydantic import ValidationError
+from pydantic.alias_generators import to_camel
 
 # Domain imports (relative)
 from ..config import get_data_collection_config
-from ..models.market_data import PriceDataPoint, TickerInfo, TiingoDataResponse
+from ....shared.concurrency import TokenBucket
+from ..models.market_data import PriceDataPoint, TickerInfo
 
 logger = logging.getLogger(__name__)
 
+# Tiingo field names that are not the camelCase form of the stored column
+_TIINGO_FIELD_ALIASES = {"dividend_cash": "divCash"}
+# Tiingo column -> stored price column, derived from (and in the order of) the
+# PriceDataPoint fields after ticker and date
+_CSV_PRICE_COLUMNS = {
+    _TIINGO_FIELD_ALIASES.get(name, to_camel(name)): name
+    for name in PriceDataPoint.model_fields if name not in ("ticker", "date")
+}
+_CSV_VOLUME_COLUMNS = {
+    csv_column for csv_column, column in _CSV_PRICE_COLUMNS.items()
+    if PriceDataPoint.model_fields[column].annotation == Optional[int]
+}
+_CSV_CONVERT_OPTIONS = pa_csv.ConvertOptions(
+    column_types={"date": pa.string(), **{column: pa.float64() for column in _CSV_PRICE_COLUMNS}},
+    include_columns=["date", *_CSV_PRICE_COLUMNS],
+    include_missing_columns=True
+)
+# Rows with the wrong number of fields are skipped rather than failing the batch
+_CSV_PARSE_OPTIONS = pa_csv.ParseOptions(invalid_row_handler=lambda row: "skip")
+
+
+def _parse_csv_price_chunk(ticker: str, csv_chunk: bytes) -> pa.Table:
+    """
+    Parses a chunk of Tiingo CSV (header line included) into a price table.
+
+    Columns and types match the records ``PriceDataPoint.model_dump()`` produced,
+    with prices as float64 rather than Decimal; zero values become null.
+    """
+    raw = pa_csv.read_csv(
+        pa.BufferReader(csv_chunk), parse_options=_CSV_PARSE_OPTIONS, convert_options=_CSV_CONVERT_OPTIONS
+    )
+    # Dates may carry a time suffix ("2024-01-02T00:00:00.000Z"); only the day is kept
+    dates = pc.cast(pc.utf8_slice_codeunits(raw["date"], 0, 10), pa.date32())
+    columns = {"ticker": pa.repeat(ticker, raw.num_rows), "date": dates}
+    for csv_column, column in _CSV_PRICE_COLUMNS.items():
+        values = raw[csv_column]
+        values = pc.if_else(pc.equal(values, 0), pa.scalar(None, pa.float64()), values)
+        if csv_column in _CSV_VOLUME_COLUMNS:
+            values = pc.cast(values, pa.int64(), safe=False)
+        columns[column] = values
+    return pa.table(columns)
+
+
+def _parse_json_price_point(ticker: str, point: Dict[str, Any]) -> PriceDataPoint:
+    """Converts one Tiingo JSON price row into a PriceDataPoint; zero or missing values become None."""
+    def _decimal(field: str) -> Optional[Decimal]:
+        value = point.get(field)
+        return Decimal(str(value)) if value else None
+
+    def _integer(field: str) -> Optional[int]:
+        value = point.get(field)
+        return int(value) if value else None
+
+    return PriceDataPoint(
+        ticker=ticker,
+        date=datetime.fromisoformat(point["date"].replace("Z", "+00:00")).date(),
+        **{
+            column: (_integer if field in _CSV_VOLUME_COLUMNS else _decimal)(field)
+            for field, column in _CSV_PRICE_COLUMNS.items()
+        }
+    )
+
 
 class TiingoClient:
     """Client for Tiingo API."""
@@ -33,28 +100,64 @@ class TiingoClient:
         self.api_key = api_key or self.config.tiingo_api_key
         self.base_url = self.config.tiingo_base_url
         self.session: Optional[aiohttp.ClientSession] = None
+        self._session_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.rate_limiter: Optional[TokenBucket] = None
         
         if not self.api_key:
             raise ValueError("Tiingo API key is required. Set TIINGO_API_KEY environment variable.")
     
     async def _get_session(self) -> aiohttp.ClientSession:
-        if self.session is None or self.session.closed:
+        """
+        Returns the client's pooled session, creating it on first use.
+
+        The session is kept for the client's lifetime so every request reuses
+        keep-alive connections instead of paying a new TLS handshake. A session
+        left over from a previous event loop (e.g. a finished asyncio.run) is replaced.
+        """
+        loop = asyncio.get_running_loop()
+        if self.session is None or self.session.closed or self._session_loop is not loop:
             self.session = aiohttp.ClientSession(
                 headers={
                     "Content-Type": "application/json",
                     "Authorization": f"Token {self.api_key}"
                 },
-                timeout=aiohttp.ClientTimeout(total=30)
+                timeout=aiohttp.ClientTimeout(total=30),
+                connector=aiohttp.TCPConnector(
+                    limit=self.config.http_max_connections,
+                    limit_per_host=self.config.http_max_keepalive_connections,
+                    keepalive_timeout=self.config.http_keepalive_expiry,
+                    ttl_dns_cache=300
+                )
             )
+            # The bucket's lock belongs to the loop too, so it is rebuilt alongside the session
+            self.rate_limiter = TokenBucket(self.config.tiingo_requests_per_second)
+            self._session_loop = loop
         return self.session
 
+    async def _throttled_session(self) -> aiohttp.ClientSession:
+        """
+        Returns the pooled session after taking a token from the client's rate limiter.
+
+        Every API request goes through here, so callers outside the batch jobs
+        (endpoints, the CLI) are paced against the same Tiingo quota.
+        """
+        session = await self._get_session()
+        await self.rate_limiter.acquire()
+        return session
+
+    async def close(self):
+        """Close the pooled session."""
+        if self.session and not self.session.closed:
+            await self.session.close()
+        self.session = None
+        self._session_loop = None
+
     async def __aenter__(self):
         self.session = await self._get_session()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self.session:
-            await self.session.close()
+        await self.close()
     
     async def get_ticker_metadata(self, ticker: str) -> Optional[TickerInfo]:
         """
@@ -69,7 +172,7 @@ class TiingoClient:
         try:
             url = f"{self.base_url}/daily/{ticker}"
             
-            session = await self._get_session()
+            session = await self._throttled_session()
             async with session.get(url) as response:
                 if response.status == 200:
                     data = await response.json()
@@ -110,6 +213,29 @@ class TiingoClient:
         Returns:
             List of PriceDataPoint objects or None if error
         """
+        data = await self._get_price_json(ticker, start_date, end_date, frequency)
+        if data is None:
+            return None
+        
+        price_points = []
+        for point in data:
+            if not point:  # Add a check for None here
+                continue
+            try:
+                price_points.append(_parse_json_price_point(ticker, point))
+            except Exception:
+                continue
+        
+        return price_points
+
+    async def _get_price_json(
+        self,
+        ticker: str,
+        start_date: Optional[Union[str, date]],
+        end_date: Optional[Union[str, date]],
+        frequency: str
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Fetches raw Tiingo price rows; None on a missing ticker or a non-transient error."""
         try:
             # Format dates
             if end_date is None:
@@ -131,53 +257,103 @@ class TiingoClient:
                     start_date = start_date.isoformat()
                 params["startDate"] = start_date
             
-            session = await self._get_session()
+            session = await self._throttled_session()
             async with session.get(url, params=params) as response:
                 if response.status == 200:
-                    data = await response.json()
-                    
-                    if not data:
-                        return []
-                    
-                    price_points = []
-                    for point in data:
-                        if not point:  # Add a check for None here
-                            continue
-                        try:
-                            price_point = PriceDataPoint(
-                                ticker=ticker,
-                                date=datetime.fromisoformat(point["date"].replace("Z", "+00:00")).date(),
-                                open=Decimal(str(point.get("open", 0))) if point.get("open") else None,
-                                high=Decimal(str(point.get("high", 0))) if point.get("high") else None,
-                                low=Decimal(str(point.get("low", 0))) if point.get("low") else None,
-                                close=Decimal(str(point.get("close", 0))) if point.get("close") else None,
-                                volume=int(point.get("volume", 0)) if point.get("volume") else None,
-                                adj_close=Decimal(str(point.get("adjClose", 0))) if point.get("adjClose") else None,
-                                adj_open=Decimal(str(point.get("adjOpen", 0))) if point.get("adjOpen") else None,
-                                adj_high=Decimal(str(point.get("adjHigh", 0))) if point.get("adjHigh") else None,
-                                adj_low=Decimal(str(point.get("adjLow", 0))) if point.get("adjLow") else None,
-                                adj_volume=int(point.get("adjVolume", 0)) if point.get("adjVolume") else None,
-                                dividend_cash=Decimal(str(point.get("divCash", 0))) if point.get("divCash") else None,
-                                split_factor=Decimal(str(point.get("splitFactor", 1))) if point.get("splitFactor") else None
-                            )
-                            price_points.append(price_point)
-                        except Exception as point_error:
-                            continue
-                    
-                    return price_points
-                    
+                    return await response.json() or []
                 elif response.status == 404:
                     return None
-                elif response.status == 429:
-                    return None
+                elif response.status == 429 or response.status >= 500:
+                    # Throttling and upstream outages are transient; let callers retry them
+                    response.raise_for_status()
                 else:
                     logger.error(f"Error fetching data for {ticker}: {response.status}")
                     return None
                     
+        except aiohttp.ClientResponseError:
+            raise
         except Exception as e:
             logger.error(f"Exception getting historical data for {ticker}: {e}")
             return None
     
+    async def iter_historical_price_batches(
+        self,
+        ticker: str,
+        start_date: Optional[Union[str, date]] = None,
+        end_date: Optional[Union[str, date]] = None,
+        frequency: str = "daily",
+        batch_size: int = 10_000
+    ) -> AsyncIterator[pa.Table]:
+        """
+        Stream historical price data for a ticker in batches of Arrow tables.
+        
+        Reads Tiingo's CSV response line by line, so memory is bounded by
+        ``batch_size`` rather than the full history. Each batch of raw lines is
+        parsed by Arrow's CSV reader in one call, instead of building a dict of
+        Decimals per row. Tables have the fields of ``PriceDataPoint``.
+        
+        Args:
+            ticker: Stock symbol
+            start_date: Start date (YYYY-MM-DD format or date object)
+            end_date: End date (YYYY-MM-DD format or date object)
+            frequency: Data frequency (daily, weekly, monthly)
+            batch_size: Maximum number of records per yielded batch
+            
+        Yields:
+            Tables of price rows, oldest first
+        """
+        if end_date is None:
+            end_date = date.today().isoformat()
+        elif isinstance(end_date, date):
+            end_date = end_date.isoformat()
+        
+        url = f"{self.base_url}/daily/{ticker}/prices"
+        params = {
+            "endDate": end_date,
+            "format": "csv",
+            "resampleFreq": frequency
+        }
+        
+        # Only add startDate if specified - omitting it gets ALL available data
+        if start_date is not None:
+            if isinstance(start_date, date):
+                start_date = start_date.isoformat()
+            params["startDate"] = start_date
+        
+        try:
+            session = await self._throttled_session()
+            async with session.get(url, params=params) as response:
+                if response.status == 404:
+                    return
+                if response.status == 429 or response.status >= 500:
+                    # Throttling and upstream outages are transient; let callers retry them
+                    response.raise_for_status()
+                if response.status != 200:
+                    logger.error(f"Error fetching data for {ticker}: {response.status}")
+                    return
+                
+                header: Optional[bytes] = None
+                lines: List[bytes] = []
+                async for raw_line in response.content:
+                    line = raw_line.strip()
+                    if not line:
+                        continue
+                    if header is None:
+                        header = line
+                        continue
+                    lines.append(line)
+                    if len(lines) >= batch_size:
+                        yield _parse_csv_price_chunk(ticker, b"\n".join([header, *lines]))
+                        lines = []
+                if lines:
+                    yield _parse_csv_price_chunk(ticker, b"\n".join([header, *lines]))
+                    
+        except aiohttp.ClientResponseError:
+            raise
+        except aiohttp.ClientError as e:
+            logger.error(f"Exception streaming historical data for {ticker}: {e}")
+            return
+    
     async def get_latest_price(self, ticker: str) -> Optional[PriceDataPoint]:
         """
         Get the latest price for a ticker.
@@ -193,14 +369,13 @@ class TiingoClient:
             end_date = date.today()
             start_date = end_date - timedelta(days=7)  # Get last week to be safe
             
-            prices = await self.get_historical_prices(
-                ticker=ticker,
-                start_date=start_date,
-                end_date=end_date
-            )
+            data = await self._get_price_json(ticker, start_date, end_date, "daily")
             
-            if prices:
-                return max(prices, key=lambda x: x.date)  # Return most recent
+            # Tiingo dates are ISO strings, so the newest row can be picked before
+            # converting; only that one row becomes a PriceDataPoint.
+            points = [point for point in data or [] if point and point.get("date")]
+            if points:
+                return _parse_json_price_point(ticker, max(points, key=lambda point: point["date"]))
             return None
             
         except Exception as e:
@@ -234,7 +409,7 @@ class TiingoClient:
         try:
             url = f"{self.base_url}/daily"
             
-            session = await self._get_session()
+            session = await self._throttled_session()
             async with session.get(url) as response:
                 if response.status == 200:
                     data = await response.json()
@@ -252,11 +427,14 @@ class TiingoClient:
         tickers: List[str],
         start_date: Optional[Union[str, date]] = None,
         end_date: Optional[Union[str, date]] = None,
-        max_concurrent: Optional[int] = None
-    ) -> Dict[str, List[PriceDataPoint]]:
+        max_concurrent: int = 5
+    ) -> Dict[str, Optional[List[PriceDataPoint]]]:
         """
         Bulk fetch historical data for multiple tickers concurrently.
         
+        Requests are paced by the client's rate limiter, so the semaphore only
+        bounds how many are in flight.
+        
         Args:
             tickers: List of stock symbols
             start_date: Start date for historical data
@@ -264,37 +442,26 @@ class TiingoClient:
             max_concurrent: Max concurrent requests
             
         Returns:
-            Dictionary mapping ticker to list of price data points
+            Dictionary mapping ticker to list of price data points (None on failure)
         """
-        if max_concurrent is None:
-            max_concurrent = self.config.max_concurrent_requests
-        
         semaphore = asyncio.Semaphore(max_concurrent)
-        results = {}
+        completed = 0
         
-        async def fetch_single_ticker(ticker: str):
+        async def fetch_single_ticker(ticker: str) -> Optional[List[PriceDataPoint]]:
+            nonlocal completed
             async with semaphore:
                 try:
-                    await asyncio.sleep(self.config.request_delay_seconds)  # Rate limiting
-                    data = await self.get_historical_prices(ticker, start_date, end_date)
-                    return ticker, data
+                    return await self.get_historical_prices(ticker, start_date, end_date)
                 except Exception as e:
                     logger.error(f"Error fetching data for {ticker}: {e}")
-                    return ticker, None
-        
-        # Create tasks for all tickers
-        tasks = [fetch_single_ticker(ticker) for ticker in tickers]
-        
-        # Execute with progress logging
-        completed = 0
-        for task in asyncio.as_completed(tasks):
-            ticker, data = await task
-            results[ticker] = data
-            completed += 1
-            
-        
+                    return None
+                finally:
+                    completed += 1
+                    if completed % 10 == 0 or completed == len(tickers):
+                        logger.info(f"Fetched historical data for {completed}/{len(tickers)} tickers")
         
-        return results
+        results = await asyncio.gather(*(fetch_single_ticker(ticker) for ticker in tickers))
+        return dict(zip(tickers, results))
 
 _tiingo_client = None
 
@@ -303,4 +470,10 @@ def get_tiingo_client() -> "TiingoClient":
     global _tiingo_client
     if _tiingo_client is None:
         _tiingo_client = TiingoClient()
-    return _tiingo_client 
\ No newline at end of file
+    return _tiingo_client 
+
+
+async def close_tiingo_client():
+    """Closes the shared TiingoClient's session, if one was created."""
+    if _tiingo_client is not None:
+        await _tiingo_client.close()
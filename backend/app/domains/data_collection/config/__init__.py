@@ -5,6 +5,7 @@ This package contains centralized configuration for data collection,
 including ticker management and API settings.
 """
 
+from .settings import DataCollectionSettings, get_data_collection_config, get_key_macro_series_ids
 from .ticker_config import (
     TickerGroup,
     TickerConfig,
@@ -18,6 +19,9 @@ from .ticker_config import (
 )
 
 __all__ = [
+    "DataCollectionSettings",
+    "get_data_collection_config",
+    "get_key_macro_series_ids",
     "TickerGroup",
     "TickerConfig", 
     "get_ticker_config",
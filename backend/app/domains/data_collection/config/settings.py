@@ -14,6 +14,17 @@ class DataCollectionSettings(BaseSettings):
     sec_api_user_agent: Optional[str] = None
     s3_bucket_name: Optional[str] = None
     s3_bucket: Optional[str] = None  # Alternative field name
+    tiingo_requests_per_second: float = 5.0
+    fmp_requests_per_second: float = 2.0
+    alpha_vantage_requests_per_second: float = 1 / 15  # free tier is 5 calls per minute
+    max_concurrent_batch_jobs: int = 2
+    hot_price_cache_tickers: int = 32
+    s3_io_max_workers: Optional[int] = None  # defaults to a multiple of the CPU count
+    # Connection pool shared by each API client; idle connections are kept
+    # warm between sporadic requests
+    http_max_connections: int = 50
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry: float = 60.0
 
     model_config = SettingsConfigDict(
         env_file='.env',
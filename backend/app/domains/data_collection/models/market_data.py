@@ -4,10 +4,10 @@ Market Data Models for Data Collection
 Data models used for handling data within the data_collection domain.
 """
 
-from typing import Optional, List
+from typing import Literal, Optional, List
 from datetime import date
 from decimal import Decimal
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 # Pydantic Models for API responses
 class TickerInfo(BaseModel):
@@ -37,10 +37,21 @@ class PriceDataPoint(BaseModel):
     dividend_cash: Optional[Decimal] = None
     split_factor: Optional[Decimal] = None
 
-class TiingoDataResponse(BaseModel):
-    """Response from Tiingo API."""
-    ticker: str
-    start_date: date
-    end_date: date
-    frequency: str
-    data: List[PriceDataPoint] 
\ No newline at end of file
+# Pydantic Models for API requests
+class BulkIngestionRequest(BaseModel):
+    """Request to ingest data for a list of tickers."""
+    tickers: List[str]
+    data_type: Literal["prices", "fundamentals"] = "prices"
+    # Each concurrent ticker holds an upstream connection; keep well inside the client pools
+    max_concurrent: int = Field(default=3, ge=1, le=20)
+
+class BatchConcurrencyRequest(BaseModel):
+    """New concurrency limit for the batch ingestions currently running."""
+    max_concurrent: int = Field(..., ge=1, le=20)
+
+class BatchPriceHistoryRequest(BaseModel):
+    """Request for stored daily prices of several tickers at once."""
+    tickers: List[str] = Field(..., min_length=1, max_length=500)
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    columns: Optional[List[str]] = None
@@ -3,7 +3,7 @@ Service for merging price data with macroeconomic indicators and calculating tec
 """
 import logging
 import pandas as pd
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import date
 import asyncio
 
@@ -34,16 +34,12 @@ class DataMergingService:
         """
         Retrieves a merged dataset for a ticker, containing price, macro, and technical data.
         It attempts to load from S3 first and regenerates the data if it's not found or invalid.
+        Price-scaled indicator columns are float32; volume-scaled ones (obv, volume_sma_20) are float64.
         """
         if not force_refresh:
-            try:
-                existing_data = await self._get_existing_merged_data(ticker, start_date, end_date)
-                if existing_data is not None:
-                    is_valid, _ = self._validate_merged_data(existing_data)
-                    if is_valid:
-                        return existing_data
-            except Exception:
-                pass
+            existing_data = await self._get_valid_existing_merged_data(ticker, start_date, end_date)
+            if existing_data is not None:
+                return existing_data
 
         merged_df = await self._generate_merged_dataset(ticker, start_date, end_date)
 
@@ -57,40 +53,116 @@ class DataMergingService:
 
         return None
 
+    async def get_merged_data_for_tickers(
+        self,
+        tickers: List[str],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        force_refresh: bool = False
+    ) -> Dict[str, Optional[pd.DataFrame]]:
+        """
+        Like ``get_merged_data`` for several tickers, keyed by ticker.
+
+        Tickers without valid stored merged data are regenerated together: their
+        prices come from one storage scan, the macro series are loaded once, and
+        their indicators are computed in one batched pass.
+        """
+        results: Dict[str, Optional[pd.DataFrame]] = dict.fromkeys(tickers)
+        missing = list(results)
+        if not force_refresh:
+            existing = await asyncio.gather(*(
+                self._get_valid_existing_merged_data(ticker, start_date, end_date) for ticker in missing
+            ))
+            results.update(zip(missing, existing))
+            missing = [ticker for ticker in missing if results[ticker] is None]
+        if not missing:
+            return results
+
+        merged = await self._generate_merged_datasets(missing, start_date, end_date)
+        valid = {ticker: df for ticker, df in merged.items() if self._validate_merged_data(df)[0]}
+        await asyncio.gather(*(self._save_merged_data(df, ticker) for ticker, df in valid.items()))
+        results.update(valid)
+        return results
+
+    async def _get_valid_existing_merged_data(
+        self,
+        ticker: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Optional[pd.DataFrame]:
+        try:
+            existing_data = await self._get_existing_merged_data(ticker, start_date, end_date)
+        except Exception:
+            return None
+        if existing_data is not None and self._validate_merged_data(existing_data)[0]:
+            return existing_data
+        return None
+
     async def _generate_merged_dataset(
         self,
         ticker: str,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None
     ) -> Optional[pd.DataFrame]:
-        price_df = await self.s3_storage.get_price_data(ticker)
+        # The date range is applied in the storage scan rather than on the loaded frame
+        price_df = await self.s3_storage.get_price_data(ticker, start_date=start_date, end_date=end_date)
         if price_df is None or price_df.empty:
             return None
 
-        price_df['date'] = pd.to_datetime(price_df['date'])
-        price_df = price_df.sort_values('date').set_index('date')
+        merged_df = self._join_macro_data(price_df, await self._get_combined_macro_data())
 
-        if start_date:
-            price_df = price_df[price_df.index.date >= start_date]
-        if end_date:
-            price_df = price_df[price_df.index.date <= end_date]
-        
-        if price_df.empty:
-            return None
+        # One ticker's indicators are computed in a worker thread so the event loop stays free
+        indicator_features = await self.technical_indicators.generate_features_async(merged_df.reset_index())
+        return self._attach_features(merged_df, indicator_features)
 
+    async def _generate_merged_datasets(
+        self,
+        tickers: List[str],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Dict[str, pd.DataFrame]:
+        price_table = await self.s3_storage.get_price_table_for_tickers(
+            tickers, start_date=start_date, end_date=end_date
+        )
+        if price_table is None or price_table.num_rows == 0:
+            return {}
+
+        price_df = await asyncio.to_thread(price_table.to_pandas)
+        macro_df = await self._get_combined_macro_data()
+        merged = {
+            ticker: self._join_macro_data(ticker_df, macro_df)
+            for ticker, ticker_df in price_df.groupby('ticker', sort=False)
+        }
+
+        indicator_features = await self.technical_indicators.generate_features_batched_async(
+            {ticker: merged_df.reset_index() for ticker, merged_df in merged.items()}
+        )
+        return {
+            ticker: self._attach_features(merged_df, indicator_features[ticker])
+            for ticker, merged_df in merged.items()
+        }
+
+    async def _get_combined_macro_data(self) -> Optional[pd.DataFrame]:
         all_macro_dfs = [df for df in await self._get_all_macro_data() if df is not None]
-        
-        merged_df = price_df
-        if all_macro_dfs:
-            macro_df = pd.concat(all_macro_dfs, axis=1).resample('D').ffill()
-            merged_df = pd.merge(price_df, macro_df, left_index=True, right_index=True, how='left')
-
-        indicator_features = self.technical_indicators.generate_features(merged_df.reset_index())
+        if not all_macro_dfs:
+            return None
+        return pd.concat(all_macro_dfs, axis=1).sort_index()
+
+    @staticmethod
+    def _join_macro_data(price_df: pd.DataFrame, macro_df: Optional[pd.DataFrame]) -> pd.DataFrame:
+        price_df = price_df.assign(date=pd.to_datetime(price_df['date'])).sort_values('date').set_index('date')
+        if macro_df is None:
+            return price_df
+        # Align macro observations straight onto the trading days, carrying the last
+        # value forward, instead of materializing a daily calendar back to 1970.
+        return price_df.join(macro_df.reindex(price_df.index, method='ffill'))
+
+    @staticmethod
+    def _attach_features(merged_df: pd.DataFrame, indicator_features: Dict[str, Any]) -> pd.DataFrame:
         for indicator_type in indicator_features.values():
             if indicator_type:
                 for name, series in indicator_type.items():
                     merged_df[name] = series.values
-
         return merged_df.reset_index()
 
     async def _get_all_macro_data(self) -> List[Optional[pd.DataFrame]]:
@@ -115,10 +187,12 @@ class DataMergingService:
             return None
 
     async def _save_merged_data(self, merged_df: pd.DataFrame, ticker: str):
-        merged_df['year'] = pd.to_datetime(merged_df['date']).dt.year
-        for year, year_df in merged_df.groupby('year'):
-            s3_key = f"merged_data/year={year}/merged_{ticker}_{year}.parquet"
-            await self.s3_storage._upload_dataframe_to_s3(year_df.drop(columns=['year']), s3_key)
+        # Group on a separate series so the caller's frame doesn't gain a year column
+        years = pd.to_datetime(merged_df['date']).dt.year
+        await self.s3_storage.upload_dataframes({
+            f"merged_data/year={year}/merged_{ticker}_{year}.parquet": year_df
+            for year, year_df in merged_df.groupby(years)
+        })
 
     async def _get_existing_merged_data(
         self,
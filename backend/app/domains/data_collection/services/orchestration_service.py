@@ -9,21 +9,56 @@ to create a comprehensive dataset.
 Enhanced with centralized ticker management and batch processing capabilities.
 """
 import logging
-from typing import Dict, Any, Optional, List
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Any, Optional, List
 import asyncio
 from datetime import date, timedelta
 
+import pyarrow as pa
+import pyarrow.compute as pc
+from tenacity import AsyncRetrying, retry_if_exception, stop_after_attempt, wait_exponential
+
 from ..clients.tiingo_client import TiingoClient, get_tiingo_client
 from ..clients.fmp_client import FMPClient, get_fmp_client
 from ..clients.sec_client import SECClient, get_sec_client
 from ..clients.fred_client import FredClient, get_fred_client
 from ..storage.s3_storage_service import get_s3_storage_service, S3StorageService
-from ..config import get_key_macro_series_ids
+from ..config import get_key_macro_series_ids, get_data_collection_config
 from ..config.ticker_config import get_ticker_config, TickerGroup, TickerConfig
 from ....sec_utils import ticker_to_cik
+from ....shared.concurrency import DynamicLimiter, TokenBucket
+from ....shared.validation_utils import normalize_tickers
 
 logger = logging.getLogger(__name__)
 
+_TRANSIENT_STATUS_CODES = frozenset({429, 502, 503, 504})
+_TRANSIENT_MESSAGES = ("rate limit", "quota", "too many requests")
+# Year slices waiting for the S3 writer while the next batch streams in
+_PRICE_STORE_QUEUE_SIZE = 2
+
+
+def _is_transient(exc: BaseException) -> bool:
+    """Whether an ingestion failure is provider throttling or a short outage worth retrying."""
+    status = getattr(exc, "status", None) or getattr(exc, "status_code", None)
+    if status in _TRANSIENT_STATUS_CODES:
+        return True
+    message = str(exc).lower()
+    return any(marker in message for marker in _TRANSIENT_MESSAGES)
+
+
+async def _put_while_consuming(queue: asyncio.Queue, item: Any, consumer: asyncio.Task) -> None:
+    """
+    Puts ``item`` on a bounded queue, re-raising the consumer's error if it dies first.
+
+    A plain ``queue.put`` would wait forever on a full queue nobody is draining.
+    """
+    put = asyncio.ensure_future(queue.put(item))
+    await asyncio.wait({put, consumer}, return_when=asyncio.FIRST_COMPLETED)
+    if not put.done():
+        put.cancel()
+        consumer.result()
+
+
 class DataCollectionService:
     """A unified service to manage data collection from all sources."""
 
@@ -34,14 +69,59 @@ class DataCollectionService:
         self.fred_client = get_fred_client()
         self.storage_service: S3StorageService = get_s3_storage_service()
         self.ticker_config: TickerConfig = get_ticker_config()
+        self._batch_limiters: set[DynamicLimiter] = set()
+        # One rate limiter per data provider, shared by every batch in the process
+        config = get_data_collection_config()
+        self.fmp_rate_limiter = TokenBucket(config.fmp_requests_per_second)
+        # Process-wide cap on whole batch jobs, so stacked batch calls can't multiply fan-out
+        self._batch_job_gate = DynamicLimiter(config.max_concurrent_batch_jobs)
+        self._queued_batch_jobs = 0
 
-    async def collect_key_macro_indicators(self) -> Dict[str, Any]:
+    async def set_max_concurrent(self, max_concurrent: int) -> int:
+        """
+        Change the concurrency limit of every batch collection currently running.
+
+        Lets operators throttle or widen in-flight batches without restarting them.
+        Batches started afterwards use their own ``max_concurrent``.
+
+        Returns:
+            Number of running batches that were resized
+        """
+        limiters = list(self._batch_limiters)
+        for limiter in limiters:
+            await limiter.resize(max_concurrent)
+        return len(limiters)
+
+    @property
+    def batch_job_queue_depth(self) -> int:
+        """Number of batch jobs waiting for a slot behind the running ones."""
+        return self._queued_batch_jobs
+
+    @asynccontextmanager
+    async def _batch_job_slot(self, description: str) -> AsyncIterator[None]:
+        """Hold one of the process-wide batch job slots for the duration of a batch."""
+        if self._batch_job_gate.active >= self._batch_job_gate.max_concurrent:
+            logger.warning(
+                f"Batch job gate full ({self._batch_job_gate.active} running, "
+                f"{self._queued_batch_jobs} queued); {description} is waiting"
+            )
+        self._queued_batch_jobs += 1
+        try:
+            await self._batch_job_gate.acquire()
+        finally:
+            self._queued_batch_jobs -= 1
+        try:
+            yield
+        finally:
+            await self._batch_job_gate.release()
+
+    async def collect_key_macro_indicators(self, full_refresh: bool = False) -> Dict[str, Any]:
         """
         Collects a predefined list of key macroeconomic indicators from FRED.
         """
         series_ids = get_key_macro_series_ids()
 
-        tasks = [self.collect_and_store_macro_series(sid) for sid in series_ids]
+        tasks = [self.collect_and_store_macro_series(sid, full_refresh=full_refresh) for sid in series_ids]
         results = await asyncio.gather(*tasks)
 
         successful_collections = [res for res in results if res.get("status") == "success"]
@@ -58,10 +138,18 @@ class DataCollectionService:
             
         return summary
 
-    async def collect_daily_prices(self, ticker: str) -> Dict[str, Any]:
+    async def collect_daily_prices(self, ticker: str, batch_size: int = 10_000) -> Dict[str, Any]:
         """
         Collects daily market prices for a given ticker, fetching only the data
         missing since the last ingestion.
+
+        Prices are streamed from Tiingo and stored in batches of roughly ``batch_size``
+        records, so a multi-decade backfill never holds the full history in memory.
+        Each flush stops at a calendar-year boundary, holding the trailing year back
+        for the next batch, so every year is written as one object rather than a base
+        object plus part files wherever a batch happened to end. Completed years are
+        handed to a storage task through a small queue, so S3 writes overlap with
+        the download instead of pausing it.
         """
 
         latest_date_in_s3 = await self.storage_service.get_latest_price_date(ticker)
@@ -72,11 +160,52 @@ class DataCollectionService:
             if start_date >= date.today():
                  return {"status": "up_to_date", "source": "tiingo", "ticker": ticker}
 
-        price_data = await self.tiingo_client.get_historical_prices(ticker, start_date=start_date)
-        
-        if price_data:
-            await self.storage_service.save_price_data([p.model_dump() for p in price_data], ticker)
-            return {"status": "success", "source": "tiingo", "ticker": ticker, "records_added": len(price_data)}
+        counts = {"inserted": 0, "updated": 0}
+
+        async def store_price_slices() -> None:
+            while (price_slice := await queue.get()) is not None:
+                saved = await self.storage_service.save_price_data(price_slice, ticker)
+                counts["inserted"] += saved["inserted"]
+                counts["updated"] += saved["updated"]
+
+        # Fetch and store overlap: the next Tiingo batch streams in while the
+        # previous year slices are written. One writer keeps this ticker's
+        # objects from being written concurrently.
+        queue: asyncio.Queue = asyncio.Queue(maxsize=_PRICE_STORE_QUEUE_SIZE)
+        store_task = asyncio.create_task(store_price_slices())
+        try:
+            pending: Optional[pa.Table] = None
+            async for price_batch in self.tiingo_client.iter_historical_price_batches(
+                ticker, start_date=start_date, batch_size=batch_size
+            ):
+                if price_batch.num_rows == 0:
+                    continue
+                pending = price_batch if pending is None else pa.concat_tables([pending, price_batch])
+                # Rows arrive oldest first, so the trailing year is a suffix of the buffer
+                years = pc.year(pending["date"])
+                flush_count = pc.sum(pc.less(years, years[-1])).as_py() or 0
+                if flush_count:
+                    await _put_while_consuming(queue, pending.slice(0, flush_count), store_task)
+                    pending = pending.slice(flush_count)
+
+            if pending is not None and pending.num_rows:
+                await _put_while_consuming(queue, pending, store_task)
+            await _put_while_consuming(queue, None, store_task)
+            await store_task
+        finally:
+            store_task.cancel()
+
+        records_added = counts["inserted"]
+        records_updated = counts["updated"]
+
+        if records_added or records_updated:
+            return {
+                "status": "success",
+                "source": "tiingo",
+                "ticker": ticker,
+                "records_added": records_added,
+                "records_updated": records_updated
+            }
         return {"status": "no_new_data", "source": "tiingo", "ticker": ticker}
 
     async def collect_fundamentals(self, ticker: str, limit: int = 5) -> Dict[str, Any]:
@@ -112,9 +241,21 @@ class DataCollectionService:
             return {"status": "success", "source": "sec", "ticker": ticker, "filings": len(filings)}
         return {"status": "no_data", "source": "sec", "ticker": ticker}
         
-    async def collect_and_store_macro_series(self, series_id: str) -> Dict[str, Any]:
+    async def collect_and_store_macro_series(self, series_id: str, full_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Collects a FRED series and stores it by year.
+
+        Only the latest stored year onwards is fetched and rewritten, since each
+        year is one object; ``full_refresh`` refetches the whole history, e.g. to
+        pick up revisions to older observations.
+        """
         try:
-            macro_data = self.fred_client.get_series(series_id)
+            observation_start = None
+            if not full_refresh:
+                latest_year = await self.storage_service.get_latest_macro_year(series_id)
+                if latest_year is not None:
+                    observation_start = date(latest_year, 1, 1)
+            macro_data = self.fred_client.get_series(series_id, observation_start=observation_start)
             if not macro_data.empty:
                 await self.storage_service.save_macro_data(macro_data, series_id)
                 return {"status": "success", "source": "fred", "series_id": series_id, "records": len(macro_data)}
@@ -129,13 +270,19 @@ class DataCollectionService:
 
     # Batch Processing Methods with Ticker Groups
 
-    async def collect_daily_prices_batch(self, group: TickerGroup, max_concurrent: int = 5) -> Dict[str, Any]:
+    async def collect_daily_prices_batch(
+        self,
+        group: TickerGroup,
+        max_concurrent: int = 5,
+        requests_per_second: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Collect daily prices for all tickers in a specified group.
         
         Args:
             group: The ticker group to process
             max_concurrent: Maximum number of concurrent API calls
+            requests_per_second: Optional lower Tiingo request rate for this batch (the client always paces at the configured rate)
             
         Returns:
             Dictionary with batch processing results
@@ -151,16 +298,55 @@ class DataCollectionService:
         
         logger.info(f"Starting batch price collection for {group.value} group ({len(tickers)} tickers)")
         
-        # Use semaphore to limit concurrent API calls
-        semaphore = asyncio.Semaphore(max_concurrent)
+        summary = await self.collect_daily_prices_for_tickers(
+            tickers, max_concurrent=max_concurrent, requests_per_second=requests_per_second, label=group.value
+        )
+        return {"group": group.value, **summary}
+
+    async def collect_daily_prices_for_tickers(
+        self,
+        tickers: List[str],
+        max_concurrent: int = 5,
+        requests_per_second: Optional[float] = None,
+        label: str = "custom"
+    ) -> Dict[str, Any]:
+        """
+        Collect daily prices for an arbitrary list of tickers as a single batch job.
+        
+        Any list size is accepted; the tickers run behind the same concurrency
+        limiter, rate limiter and batch job slot as a group batch.
+        
+        Args:
+            tickers: Ticker symbols to collect
+            max_concurrent: Maximum number of concurrent API calls
+            requests_per_second: Optional lower Tiingo request rate for this batch (the client always paces at the configured rate)
+            label: Name used for the batch in logs
+            
+        Returns:
+            Dictionary with batch processing results
+        """
+        # Duplicates would fetch a ticker twice and race two writes to the same S3 objects
+        tickers = normalize_tickers(tickers, keep_order=True)
+
+        # Limit concurrent API calls; the limit can be changed mid-run via set_max_concurrent
+        limiter = DynamicLimiter(max_concurrent)
+        # The Tiingo client paces every request at the configured rate; an override adds a slower bucket here
+        rate_limiter = TokenBucket(requests_per_second) if requests_per_second else None
         
         async def collect_single_ticker(ticker: str) -> Dict[str, Any]:
-            async with semaphore:
+            async with limiter:
                 try:
-                    result = await self.collect_daily_prices(ticker)
-                    # Add small delay to respect API rate limits
-                    await asyncio.sleep(0.1)
-                    return result
+                    # Retry throttled or briefly unavailable requests with exponential backoff
+                    async for attempt in AsyncRetrying(
+                        stop=stop_after_attempt(3),
+                        wait=wait_exponential(min=1, max=30),
+                        retry=retry_if_exception(_is_transient),
+                        reraise=True
+                    ):
+                        with attempt:
+                            if rate_limiter is not None:
+                                await rate_limiter.acquire()
+                            return await self.collect_daily_prices(ticker)
                 except Exception as e:
                     logger.error(f"Failed to collect prices for {ticker}: {e}")
                     return {
@@ -171,8 +357,13 @@ class DataCollectionService:
                     }
         
         # Execute all ticker collections concurrently
-        tasks = [collect_single_ticker(ticker) for ticker in tickers]
-        results = await asyncio.gather(*tasks)
+        async with self._batch_job_slot(f"price batch for {label}"):
+            self._batch_limiters.add(limiter)
+            try:
+                tasks = [collect_single_ticker(ticker) for ticker in tickers]
+                results = await asyncio.gather(*tasks)
+            finally:
+                self._batch_limiters.discard(limiter)
         
         # Summarize results
         successful = [r for r in results if r.get("status") == "success"]
@@ -182,7 +373,6 @@ class DataCollectionService:
         
         summary = {
             "status": "completed",
-            "group": group.value,
             "total_tickers": len(tickers),
             "successful": len(successful),
             "up_to_date": len(up_to_date),
@@ -191,12 +381,18 @@ class DataCollectionService:
             "results": results
         }
         
-        logger.info(f"Batch price collection completed for {group.value}: "
+        logger.info(f"Batch price collection completed for {label}: "
                    f"{len(successful)} successful, {len(failed)} failed")
         
         return summary
 
-    async def collect_fundamentals_batch(self, group: TickerGroup, max_concurrent: int = 3, limit: int = 5) -> Dict[str, Any]:
+    async def collect_fundamentals_batch(
+        self,
+        group: TickerGroup,
+        max_concurrent: int = 3,
+        limit: int = 5,
+        requests_per_second: Optional[float] = None
+    ) -> Dict[str, Any]:
         """
         Collect fundamental data for all tickers in a specified group.
         
@@ -204,6 +400,7 @@ class DataCollectionService:
             group: The ticker group to process
             max_concurrent: Maximum number of concurrent API calls (lower for fundamentals)
             limit: Number of years of fundamental data to fetch
+            requests_per_second: Override for the FMP request rate (defaults to config)
             
         Returns:
             Dictionary with batch processing results
@@ -219,16 +416,46 @@ class DataCollectionService:
         
         logger.info(f"Starting batch fundamentals collection for {group.value} group ({len(tickers)} tickers)")
         
-        # Use semaphore to limit concurrent API calls (more conservative for fundamentals)
-        semaphore = asyncio.Semaphore(max_concurrent)
+        summary = await self.collect_fundamentals_for_tickers(
+            tickers, max_concurrent=max_concurrent, limit=limit,
+            requests_per_second=requests_per_second, label=group.value
+        )
+        return {"group": group.value, **summary}
+
+    async def collect_fundamentals_for_tickers(
+        self,
+        tickers: List[str],
+        max_concurrent: int = 3,
+        limit: int = 5,
+        requests_per_second: Optional[float] = None,
+        label: str = "custom"
+    ) -> Dict[str, Any]:
+        """
+        Collect fundamental data for an arbitrary list of tickers as a single batch job.
+        
+        Args:
+            tickers: Ticker symbols to collect
+            max_concurrent: Maximum number of concurrent API calls (lower for fundamentals)
+            limit: Number of years of fundamental data to fetch
+            requests_per_second: Override for the FMP request rate (defaults to config)
+            label: Name used for the batch in logs
+            
+        Returns:
+            Dictionary with batch processing results
+        """
+        # Duplicates would fetch a ticker twice and race two writes to the same S3 objects
+        tickers = normalize_tickers(tickers, keep_order=True)
+
+        # Limit concurrent API calls (more conservative for fundamentals)
+        limiter = DynamicLimiter(max_concurrent)
+        rate_limiter = TokenBucket(requests_per_second) if requests_per_second else self.fmp_rate_limiter
         
         async def collect_single_ticker(ticker: str) -> Dict[str, Any]:
-            async with semaphore:
+            async with limiter:
                 try:
-                    result = await self.collect_fundamentals(ticker, limit=limit)
-                    # Add delay to respect API rate limits
-                    await asyncio.sleep(0.5)
-                    return result
+                    # Pace request starts to respect API rate limits
+                    await rate_limiter.acquire()
+                    return await self.collect_fundamentals(ticker, limit=limit)
                 except Exception as e:
                     logger.error(f"Failed to collect fundamentals for {ticker}: {e}")
                     return {
@@ -239,8 +466,13 @@ class DataCollectionService:
                     }
         
         # Execute all ticker collections concurrently
-        tasks = [collect_single_ticker(ticker) for ticker in tickers]
-        results = await asyncio.gather(*tasks)
+        async with self._batch_job_slot(f"fundamentals batch for {label}"):
+            self._batch_limiters.add(limiter)
+            try:
+                tasks = [collect_single_ticker(ticker) for ticker in tickers]
+                results = await asyncio.gather(*tasks)
+            finally:
+                self._batch_limiters.discard(limiter)
         
         # Summarize results
         successful = [r for r in results if r.get("status") == "success"]
@@ -249,7 +481,6 @@ class DataCollectionService:
         
         summary = {
             "status": "completed",
-            "group": group.value,
             "total_tickers": len(tickers),
             "successful": len(successful),
             "failed": len(failed),
@@ -257,7 +488,7 @@ class DataCollectionService:
             "results": results
         }
         
-        logger.info(f"Batch fundamentals collection completed for {group.value}: "
+        logger.info(f"Batch fundamentals collection completed for {label}: "
                    f"{len(successful)} successful, {len(failed)} failed")
         
         return summary
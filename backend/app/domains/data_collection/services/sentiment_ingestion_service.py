@@ -4,6 +4,8 @@ import logging
 from typing import List
 
 # App imports
+from ....shared.concurrency import DynamicLimiter, TokenBucket
+from ..config import get_data_collection_config
 from ..clients.alpha_vantage_client import get_alpha_vantage_client, AlphaVantageClient
 from ..storage.s3_storage_service import get_s3_storage_service, S3StorageService
 from ..models.sentiment import SentimentFeed
@@ -18,6 +20,7 @@ class SentimentIngestionService:
     ):
         self.alpha_vantage_client = alpha_vantage_client
         self.s3_storage_service = s3_storage_service
+        self.rate_limiter = TokenBucket(get_data_collection_config().alpha_vantage_requests_per_second)
 
     async def ingest_sentiment_for_ticker(self, ticker: str):
         try:
@@ -28,17 +31,22 @@ class SentimentIngestionService:
         except Exception as e:
             logger.error(f"Failed to ingest sentiment for {ticker}: {e}")
 
-    async def ingest_sentiment_for_tickers(self, tickers: List[str]):
+    async def ingest_sentiment_for_tickers(self, tickers: List[str], max_concurrent: int = 3):
         """
-        Fetches and stores sentiment data for a list of tickers, with a delay
-        to respect API rate limits.
+        Fetches and stores sentiment data for a list of tickers.
+
+        Request starts are paced by a token bucket to respect the Alpha Vantage
+        quota, while the fetch and S3 write for each ticker overlap with the next
+        ones instead of adding a fixed sleep after every ticker.
         """
-        # Alpha Vantage free tier is 5 calls per minute.
-        # So we wait 12 seconds between calls.
-        delay_seconds = 15 
-        for ticker in tickers:
-            await self.ingest_sentiment_for_ticker(ticker)
-            await asyncio.sleep(delay_seconds)
+        limiter = DynamicLimiter(max_concurrent)
+
+        async def ingest_single_ticker(ticker: str) -> None:
+            async with limiter:
+                await self.rate_limiter.acquire()
+                await self.ingest_sentiment_for_ticker(ticker)
+
+        await asyncio.gather(*(ingest_single_ticker(ticker) for ticker in tickers))
 
 def get_sentiment_ingestion_service() -> "SentimentIngestionService":
     return SentimentIngestionService() 
\ No newline at end of file
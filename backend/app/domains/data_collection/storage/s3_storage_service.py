@@ -6,22 +6,134 @@ It provides a single, consistent interface for storing various types of financia
 such as price data, fundamentals, and SEC filings, in a structured Parquet format.
 """
 import asyncio
+import functools
 import io
+import itertools
 import logging
-from typing import List, Dict, Any, Optional
-from datetime import date
+import os
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional, Tuple, Union
+from datetime import date, datetime
+from decimal import Decimal
 
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
 import pyarrow.parquet as pq
 from botocore.exceptions import ClientError
+from pydantic import TypeAdapter
 
 from app.domains.data_collection.config import get_data_collection_config
+from ..models.market_data import PriceDataPoint
 from ..models.sentiment import Sentiment
 
 logger = logging.getLogger(__name__)
 
+_YEAR_PARTITION_RE = re.compile(r"year=(\d{4})")
+# daily_prices_{ticker}_{year}.parquet, optionally with an appended _part-YYYYMMDD suffix
+_PRICE_KEY_TICKER_RE = re.compile(r"daily_prices_(.+)_\d{4}(?:_part-\d{8})?\.parquet$")
+_LIST_CACHE_TTL_SECONDS = 60
+# Per-ticker listings add a cache entry per ticker-year; expired ones are
+# dropped once the cache grows past this many prefixes.
+_LIST_CACHE_MAX_PREFIXES = 4096
+_PRICE_PREFIX = "market-data/daily_prices/"
+_FOOTER_RANGE_BYTES = 64 * 1024
+_PARQUET_MAGIC = b"PAR1"
+# Once a ticker-year has this many appended parts, the next write folds them
+# back into the yearly object so daily runs don't accumulate tiny files.
+_MAX_PRICE_PARTS_PER_YEAR = 20
+# S3 rejects DeleteObjects requests naming more than 1000 keys
+_MAX_DELETE_KEYS_PER_REQUEST = 1000
+
+# Price columns are stored as float32: seven significant digits covers quotes in
+# the universe we track, at half the bytes of float64 (or of a per-batch inferred
+# decimal, whose precision also varied between objects). Volumes stay int64 since
+# split-adjusted volumes can exceed the int32 range. The columns are PriceDataPoint's
+# Decimal fields, so a field added to the model is stored the same way.
+_PRICE_FLOAT_COLUMNS = tuple(
+    name for name, field in PriceDataPoint.model_fields.items() if field.annotation == Optional[Decimal]
+)
+# Every price read scans with the stored layout rather than the first object's
+# schema, so objects written before it (decimal128 prices with a different
+# precision per file, date32 or tz-aware dates, a pandas index column) are cast
+# to the same types as current ones and can be read together.
+_PRICE_SCHEMA = pa.schema([
+    ('ticker', pa.string()),
+    ('date', pa.timestamp('ns')),
+    *(
+        (name, pa.float32() if name in _PRICE_FLOAT_COLUMNS else pa.int64())
+        for name in PriceDataPoint.model_fields if name not in ('ticker', 'date')
+    ),
+])
+# Columns a price read can select
+PRICE_COLUMNS = tuple(_PRICE_SCHEMA.names)
+
+# Article fields stored with each of a ticker's sentiment rows
+_SENTIMENT_ARTICLE_COLUMNS = (
+    'title', 'url', 'time_published', 'summary', 'source', 'source_domain',
+    'overall_sentiment_score', 'overall_sentiment_label'
+)
+_SENTIMENT_FEED_ADAPTER = TypeAdapter(List[Sentiment])
+
+# S3 work is network-bound, so the I/O pool scales past the core count
+_MIN_IO_WORKERS = 16
+_MAX_IO_WORKERS = 64
+
+# Objects above the threshold are sent as parallel multipart uploads;
+# smaller ones still go out as a single PUT.
+_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_MULTIPART_CHUNK_SIZE,
+    multipart_chunksize=_MULTIPART_CHUNK_SIZE,
+    max_concurrency=8,
+    use_threads=True
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _price_storage_schema(schema: pa.Schema) -> pa.Schema:
+    """
+    Maps an incoming price batch's schema to the stored one: the date as
+    timestamp[ns] and price columns as float32.
+
+    Batches from one source share a schema, so the target is derived once and
+    each write is a single table cast.
+    """
+    return pa.schema([
+        field.with_type(pa.timestamp('ns')) if field.name == 'date'
+        else field.with_type(pa.float32()) if field.name in _PRICE_FLOAT_COLUMNS
+        else field
+        for field in schema
+    ])
+
+
+def _date_filter(
+    date_type: pa.DataType,
+    start_date: Optional[date] = None,
+    end_date: Optional[date] = None
+) -> Optional[ds.Expression]:
+    """Builds an inclusive filter on the ``date`` column, typed to match how it is stored."""
+    def _date_scalar(value: date) -> pa.Scalar:
+        if pa.types.is_timestamp(date_type):
+            return pa.scalar(pd.Timestamp(value), type=date_type)
+        return pa.scalar(value, type=date_type)
+
+    date_filter = None
+    if start_date is not None:
+        date_filter = ds.field('date') >= _date_scalar(start_date)
+    if end_date is not None:
+        upper = ds.field('date') <= _date_scalar(end_date)
+        date_filter = upper if date_filter is None else date_filter & upper
+    return date_filter
+
 class S3StorageService:
     """A unified service for storing financial data in S3."""
 
@@ -30,24 +142,114 @@ class S3StorageService:
         self.bucket_name = self.config.s3_bucket_name or self.config.s3_bucket
         if not self.bucket_name:
             raise ValueError("S3 bucket name not configured. Set S3_BUCKET in .env file")
+        self._s3_client = None
+        self._list_paginator = None
+        self._s3_filesystem: Optional[pafs.S3FileSystem] = None
+        # Listings keyed by (prefix, delimiter), mapping each key to its ETag; a
+        # delimited listing holds the common prefixes one level down instead
+        self._list_cache: Dict[Tuple[str, Optional[str]], Tuple[float, Dict[str, str]]] = {}
+        # One listing per prefix at a time; concurrent misses on the same prefix share it
+        self._inflight_listings: Dict[Tuple[str, Optional[str]], "asyncio.Task[Dict[str, str]]"] = {}
+        self._inflight_price_reads: Dict[tuple, "asyncio.Task[Optional[pa.Table]]"] = {}
+        # Full price history of recently read tickers, keyed by ticker and tagged
+        # with the listing version it was read at, least recently used first
+        self._hot_price_tables: "OrderedDict[str, Tuple[str, pa.Table]]" = OrderedDict()
+        # Blocking S3 and Parquet I/O runs on its own bounded pool rather than the
+        # loop's default executor. The S3 client's connection pool and Arrow's I/O
+        # thread pool (used by dataset scans) are sized to match it.
+        self._io_workers = self.config.s3_io_max_workers or min(
+            _MAX_IO_WORKERS, max(_MIN_IO_WORKERS, 4 * (os.cpu_count() or 1))
+        )
+        self._io_executor = ThreadPoolExecutor(max_workers=self._io_workers, thread_name_prefix="s3-io")
+        pa.set_io_thread_count(self._io_workers)
     
     def _get_s3_client(self):
-        """Create a fresh S3 client to avoid token expiration issues."""
-        return boto3.client("s3")
+        """
+        Returns the service's S3 client, creating it on first use.
+
+        boto3 clients are thread-safe and refresh expiring credentials themselves,
+        so one client is shared across the executor threads.
+        """
+        if self._s3_client is None:
+            self._s3_client = boto3.client(
+                "s3", config=Config(max_pool_connections=self._io_workers)
+            )
+        return self._s3_client
+
+    def warm_up(self) -> None:
+        """
+        Builds the shared S3 client, list paginator and Arrow S3 filesystem up front.
+
+        Called once at application startup so the first request doesn't pay for
+        credential resolution and client construction.
+        """
+        self._get_list_paginator()
+        self._get_s3_filesystem()
+
+    def _get_list_paginator(self):
+        if self._list_paginator is None:
+            self._list_paginator = self._get_s3_client().get_paginator('list_objects_v2')
+        return self._list_paginator
 
     async def _upload_dataframe_to_s3(self, df: pd.DataFrame, s3_key: str):
+        await self._upload_table_to_s3(pa.Table.from_pandas(df, preserve_index=True), s3_key)
+
+    async def _upload_table_to_s3(self, table: pa.Table, s3_key: str):
         try:
-            out_buffer = io.BytesIO()
-            df.to_parquet(out_buffer, index=True)
-            out_buffer.seek(0)
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._get_s3_client().put_object(Bucket=self.bucket_name, Key=s3_key, Body=out_buffer)
-            )
+            # Write straight from the Arrow table into an Arrow-owned buffer; the
+            # reader hands that buffer to boto3 without another bytes copy.
+            sink = pa.BufferOutputStream()
+            pq.write_table(table, sink, compression='zstd', compression_level=3, use_dictionary=True)
+            await self._upload_fileobj(pa.BufferReader(sink.getvalue()), s3_key)
         except Exception as e:
             logger.error(f"Error uploading to {s3_key}: {e}")
             raise
 
+    async def _upload_fileobj(
+        self,
+        fileobj: Union[io.BytesIO, pa.NativeFile],
+        s3_key: str,
+        content_type: Optional[str] = None
+    ):
+        """Uploads a file-like object, switching to multipart for large payloads."""
+        extra_args = {'ContentType': content_type} if content_type else None
+        await asyncio.get_event_loop().run_in_executor(
+            self._io_executor,
+            lambda: self._get_s3_client().upload_fileobj(
+                fileobj,
+                self.bucket_name,
+                s3_key,
+                ExtraArgs=extra_args,
+                Config=_TRANSFER_CONFIG
+            )
+        )
+        self._invalidate_list_cache(s3_key)
+
+    async def _delete_objects(self, s3_keys: List[str]):
+        """Deletes keys in DeleteObjects-sized batches, sent concurrently."""
+        if not s3_keys:
+            return
+        loop = asyncio.get_event_loop()
+        await asyncio.gather(*(
+            loop.run_in_executor(
+                self._io_executor,
+                lambda batch=batch: self._get_s3_client().delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+            )
+            for batch in (
+                s3_keys[i:i + _MAX_DELETE_KEYS_PER_REQUEST]
+                for i in range(0, len(s3_keys), _MAX_DELETE_KEYS_PER_REQUEST)
+            )
+        ))
+        for s3_key in s3_keys:
+            self._invalidate_list_cache(s3_key)
+
+    async def upload_dataframes(self, frames: Dict[str, pd.DataFrame]):
+        """Uploads several DataFrames, keyed by S3 key, concurrently rather than one after another."""
+        await asyncio.gather(*(self._upload_dataframe_to_s3(df, s3_key) for s3_key, df in frames.items()))
+
     async def download_multiple_dataframes(self, s3_keys: List[str]) -> List[pd.DataFrame]:
         tasks = [self._download_dataframe_from_s3(key) for key in s3_keys]
         results = await asyncio.gather(*tasks)
@@ -56,91 +258,147 @@ class S3StorageService:
     async def _download_dataframe_from_s3(self, s3_key: str) -> Optional[pd.DataFrame]:
         try:
             response = await asyncio.get_event_loop().run_in_executor(
-                None,
+                self._io_executor,
                 lambda: self._get_s3_client().get_object(Bucket=self.bucket_name, Key=s3_key)
             )
-            buffer = io.BytesIO(response['Body'].read())
-            table = pq.read_table(buffer)
-            return table.to_pandas()
+            table = pq.read_table(pa.BufferReader(response['Body'].read()))
+            # self_destruct releases each Arrow column as its pandas block is built,
+            # so a download never holds both full copies at once.
+            return table.to_pandas(self_destruct=True, split_blocks=True, use_threads=True)
         except ClientError:
             return None
         except Exception as e:
             logger.error(f"Error downloading or parsing {s3_key}: {e}")
             raise
 
-    async def save_price_data(self, price_data: List[Dict], ticker: str):
-        if not price_data:
-            return
+    @staticmethod
+    def _merge_on_date(existing_df: pd.DataFrame, new_df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Merges new rows into an existing date-sorted frame, new rows winning on date clashes.
+
+        Existing rows are dropped by date membership rather than hashing the whole
+        combined frame, and the stable mergesort is cheap on the mostly-sorted result.
+        """
+        new_df = new_df.drop_duplicates(subset=['date'], keep='last')
+        existing_kept = existing_df[~existing_df['date'].isin(new_df['date'])]
+        combined_df = pd.concat([existing_kept, new_df], ignore_index=True)
+        return combined_df.sort_values(by='date', kind='mergesort').reset_index(drop=True)
+
+    async def save_price_data(self, price_data: Union[pa.Table, List[Dict]], ticker: str) -> Dict[str, int]:
+        """
+        Stores a batch of daily prices for a ticker, replacing any stored rows for the same dates.
+
+        :return: Counts of ``inserted`` (new dates) and ``updated`` (replaced dates) rows.
+        """
+        counts = {'inserted': 0, 'updated': 0}
+        if len(price_data) == 0:
+            return counts
         
-        new_df = pd.DataFrame(price_data)
-        new_df['date'] = pd.to_datetime(new_df['date'])
-        new_df['year'] = new_df['date'].dt.year
+        # The batch stays in Arrow from the client's parsed table (or raw records)
+        # to the Parquet upload; pandas is only involved when an existing year has
+        # to be merged.
+        table = price_data if isinstance(price_data, pa.Table) else pa.Table.from_pylist(price_data)
+        table = table.cast(_price_storage_schema(table.schema))
 
-        for year, year_df in new_df.groupby('year'):
-            s3_key = f"market-data/daily_prices/year={year}/daily_prices_{ticker}_{year}.parquet"
-            
-            existing_df = await self._download_dataframe_from_s3(s3_key)
-            
-            if existing_df is not None:
-                existing_df['date'] = pd.to_datetime(existing_df['date'])
-                combined_df = pd.concat([existing_df, year_df], ignore_index=True)
-                combined_df = combined_df.drop_duplicates(subset=['date'], keep='last')
-                combined_df = combined_df.sort_values(by='date').reset_index(drop=True)
-            else:
-                combined_df = year_df.sort_values(by='date').reset_index(drop=True)
+        # Clean the whole batch in one pass: rows without a date or a positive close
+        # are dropped, a stable sort orders the rest, and the last record per date wins.
+        # Sorting once here means every year slice below is already in order.
+        valid = pc.and_kleene(pc.is_valid(table['date']), pc.greater(table['close'], 0))
+        table = table.filter(valid, null_selection_behavior='drop')
+        dropped = len(price_data) - table.num_rows
+        if dropped:
+            logger.warning(f"Dropped {dropped} of {len(price_data)} price records for {ticker} without a date or positive close")
+        if table.num_rows == 0:
+            return counts
+        table = table.take(pc.sort_indices(table, sort_keys=[('date', 'ascending')]))
+        dates = table['date'].combine_chunks()
+        is_last_for_date = pc.not_equal(dates.slice(0, len(dates) - 1), dates.slice(1))
+        table = table.filter(pa.concat_arrays([is_last_for_date, pa.array([True])]))
 
-            await self._upload_dataframe_to_s3(combined_df.drop(columns=['year']), s3_key)
+        # Each year lives under its own prefix and objects, so a multi-year backfill
+        # writes all of its years concurrently.
+        self._hot_price_tables.pop(ticker, None)
+        years = pc.year(table['date'])
+        updated = await asyncio.gather(*(
+            self._save_price_year(ticker, year, table.filter(pc.equal(years, year)))
+            for year in pc.unique(years).to_pylist()
+        ))
+        counts['updated'] = sum(updated)
+        counts['inserted'] = table.num_rows - counts['updated']
+        return counts
+
+    async def _save_price_year(self, ticker: str, year: int, year_table: pa.Table) -> int:
+        """Writes one year of a ticker's prices; returns how many stored rows were replaced."""
+        s3_key = f"{_PRICE_PREFIX}year={year}/daily_prices_{ticker}_{year}.parquet"
+
+        # The yearly file plus any appended parts, e.g. daily_prices_AAPL_2024_part-20240315.parquet
+        year_keys = await self._list_price_year_keys(ticker, year)
+        if not year_keys:
+            await self._upload_table_to_s3(year_table, s3_key)
+            return 0
+
+        # Incremental batches that start after everything already stored are written
+        # as a new part, which skips downloading and rewriting the existing file.
+        date_bounds = await self._get_date_bounds(max(year_keys))
+        new_min_date = year_table['date'][0].as_py()
+        can_append = len(year_keys) <= _MAX_PRICE_PARTS_PER_YEAR
+        if can_append and date_bounds is not None and new_min_date.date() > date_bounds[1]:
+            part_key = s3_key.replace('.parquet', f"_part-{new_min_date:%Y%m%d}.parquet")
+            await self._upload_table_to_s3(year_table, part_key)
+            return 0
+
+        # Overlapping batch or too many parts: fold the yearly file and all parts back into one object.
+        # Existing objects are read with the stored price schema, so legacy ones
+        # (decimal prices, string, date32 or tz-aware dates) fold in as float32
+        # prices with naive dates that match the new batch's.
+        existing_table = await asyncio.get_event_loop().run_in_executor(
+            self._io_executor, lambda: self._read_parquet_table(list(year_keys), schema=_PRICE_SCHEMA)
+        )
+        new_df = year_table.to_pandas()
+        updated = 0
+        if existing_table is not None:
+            existing_df = existing_table.to_pandas()
+            updated = int(new_df['date'].isin(existing_df['date']).sum())
+            combined_df = self._merge_on_date(existing_df, new_df)
+        else:
+            combined_df = new_df
+
+        await self._upload_dataframe_to_s3(combined_df, s3_key)
+        await self._delete_objects([key for key in year_keys if key != s3_key])
+        return updated
         
     async def save_fundamentals_data(self, fundamentals_data: List[Dict], ticker: str):
         if not fundamentals_data:
             return
 
         new_df = pd.DataFrame(fundamentals_data)
-        new_df['date'] = pd.to_datetime(new_df['date']).dt.date
-        new_df['year'] = pd.to_datetime(new_df['date']).dt.year
+        dates = pd.to_datetime(new_df['date'])
+        new_df['date'] = dates.dt.date
+        new_df['year'] = dates.dt.year
 
-        for (year, period), group_df in new_df.groupby(['year', 'period']):
-            s3_key = f"fundamentals/fmp/year={year}/fundamentals_{ticker}_{year}_{period}.parquet"
-            
-            existing_df = await self._download_dataframe_from_s3(s3_key)
-
-            if existing_df is not None:
-                existing_df['date'] = pd.to_datetime(existing_df['date']).dt.date
-                combined_df = pd.concat([existing_df, group_df], ignore_index=True)
-                combined_df = combined_df.drop_duplicates(subset=['date'], keep='last')
-                combined_df = combined_df.sort_values(by='date').reset_index(drop=True)
-            else:
-                combined_df = group_df.sort_values(by='date').reset_index(drop=True)
-            
-            await self._upload_dataframe_to_s3(combined_df.drop(columns=['year']), s3_key)
+        await self._merge_and_upload_groups(
+            new_df,
+            lambda year, period: f"fundamentals/fmp/year={year}/fundamentals_{ticker}_{year}_{period}.parquet"
+        )
 
     async def save_sentiment_data(self, sentiment_data: List[Sentiment], ticker: str):
         if not sentiment_data:
             return
 
-        records = []
-        for sentiment in sentiment_data:
-            for ticker_sentiment in sentiment.ticker_sentiment:
-                if ticker_sentiment.ticker == ticker:
-                    records.append({
-                        "title": sentiment.title,
-                        "url": sentiment.url,
-                        "time_published": sentiment.time_published,
-                        "summary": sentiment.summary,
-                        "source": sentiment.source,
-                        "source_domain": sentiment.source_domain,
-                        "overall_sentiment_score": sentiment.overall_sentiment_score,
-                        "overall_sentiment_label": sentiment.overall_sentiment_label,
-                        "ticker": ticker_sentiment.ticker,
-                        "relevance_score": ticker_sentiment.relevance_score,
-                        "ticker_sentiment_score": ticker_sentiment.ticker_sentiment_score,
-                        "ticker_sentiment_label": ticker_sentiment.ticker_sentiment_label,
-                    })
-
-        if not records:
+        # Dump the whole feed in one pydantic-core call, then let pandas expand each
+        # article into one row per ticker sentiment and keep this ticker's rows.
+        articles = pd.DataFrame(_SENTIMENT_FEED_ADAPTER.dump_python(
+            sentiment_data, include={'__all__': {*_SENTIMENT_ARTICLE_COLUMNS, 'ticker_sentiment'}}
+        ))
+        articles = articles.explode('ticker_sentiment', ignore_index=True).dropna(subset=['ticker_sentiment'])
+        if articles.empty:
+            return
+        ticker_sentiments = pd.DataFrame(articles.pop('ticker_sentiment').tolist(), index=articles.index)
+        df = articles.join(ticker_sentiments)
+        df = df[df['ticker'] == ticker].reset_index(drop=True)
+        if df.empty:
             return
 
-        df = pd.DataFrame(records)
         df['time_published'] = pd.to_datetime(df['time_published'], format='%Y%m%dT%H%M%S')
         df['date'] = df['time_published'].dt.date
         
@@ -162,59 +420,75 @@ class S3StorageService:
         if 'date' not in new_df.columns:
             return
 
-        new_df['date'] = pd.to_datetime(new_df['date']).dt.date
-        new_df['year'] = pd.to_datetime(new_df['date']).dt.year
+        dates = pd.to_datetime(new_df['date'])
+        new_df['date'] = dates.dt.date
+        new_df['year'] = dates.dt.year
 
-        for (year, period), group_df in new_df.groupby(['year', 'period']):
-            s3_key = f"financial_statements/{statement_type}/{ticker}/year={year}/fmp_{ticker}_{year}_{period}.parquet"
-            
+        await self._merge_and_upload_groups(
+            new_df,
+            lambda year, period: f"financial_statements/{statement_type}/{ticker}/year={year}/fmp_{ticker}_{year}_{period}.parquet"
+        )
+
+    async def _merge_and_upload_groups(self, new_df: pd.DataFrame, key_for_group: Callable[[int, str], str]):
+        """
+        Merges each (year, period) group of ``new_df`` into its stored object.
+
+        Groups map to distinct objects, so their download-merge-upload round trips
+        run concurrently instead of one after another.
+        """
+        async def merge_group(year: int, period: str, group_df: pd.DataFrame):
+            s3_key = key_for_group(year, period)
             existing_df = await self._download_dataframe_from_s3(s3_key)
 
             if existing_df is not None:
-                existing_df['date'] = pd.to_datetime(existing_df['date']).dt.date
-                combined_df = pd.concat([existing_df, group_df], ignore_index=True)
-                combined_df = combined_df.drop_duplicates(subset=['date'], keep='last')
-                combined_df = combined_df.sort_values(by='date').reset_index(drop=True)
+                # Dates round-trip as date32; only legacy string columns need parsing.
+                if pd.api.types.is_string_dtype(existing_df['date']):
+                    existing_df['date'] = pd.to_datetime(existing_df['date']).dt.date
+                combined_df = self._merge_on_date(existing_df, group_df)
             else:
                 combined_df = group_df.sort_values(by='date').reset_index(drop=True)
 
             await self._upload_dataframe_to_s3(combined_df.drop(columns=['year']), s3_key)
 
+        await asyncio.gather(*(
+            merge_group(year, period, group_df)
+            for (year, period), group_df in new_df.groupby(['year', 'period'])
+        ))
+
     async def save_financial_statements(self, statements_data: List[Dict], ticker: str):
         if not statements_data:
             return
         df = pd.DataFrame(statements_data)
-        df['year'] = pd.to_datetime(df['date']).dt.year
-        df['quarter'] = pd.to_datetime(df['date']).dt.quarter
+        dates = pd.to_datetime(df['date'])
+        df['year'] = dates.dt.year
+        df['quarter'] = dates.dt.quarter
 
+        frames = {}
         for (year, quarter), group_df in df.groupby(['year', 'quarter']):
             period = f"Q{quarter}" if quarter > 0 else "annual"
             s3_key = f"fundamentals/sec/financial_statements/year={year}/statements_{ticker}_{year}_{period}.parquet"
-            await self._upload_dataframe_to_s3(group_df.drop(columns=['year', 'quarter']), s3_key)
+            frames[s3_key] = group_df.drop(columns=['year', 'quarter'])
+        await self.upload_dataframes(frames)
 
     async def save_macro_data(self, macro_data: pd.DataFrame, series_id: str):
         if macro_data.empty:
             return
         
-        df = macro_data.copy()
-        df['year'] = df.index.year
+        await self.upload_dataframes({
+            f"macro_data/fred/{series_id}/year={year}/data.parquet": year_df
+            for year, year_df in macro_data.groupby(macro_data.index.year)
+        })
 
-        for year, year_df in df.groupby('year'):
-            s3_key = f"macro_data/fred/{series_id}/year={year}/data.parquet"
-            await self._upload_dataframe_to_s3(year_df.drop(columns=['year']), s3_key)
+    async def get_latest_macro_year(self, series_id: str) -> Optional[int]:
+        """Returns the most recent year stored for a FRED series, from the cached key listing."""
+        keys = await self._list_ticker_keys(f"macro_data/fred/{series_id}/", "data.parquet")
+        years = [int(match.group(1)) for key in keys if (match := _YEAR_PARTITION_RE.search(key))]
+        return max(years, default=None)
 
     async def save_filing_html(self, html_content: str, ticker: str, accession_number: str):
         s3_key = f"sec_filings/{ticker.upper()}/{accession_number}.html"
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._get_s3_client().put_object(
-                    Bucket=self.bucket_name,
-                    Key=s3_key,
-                    Body=html_content.encode('utf-8'),
-                    ContentType='text/html'
-                )
-            )
+            await self._upload_fileobj(io.BytesIO(html_content.encode('utf-8')), s3_key, 'text/html')
         except Exception as e:
             logger.error(f"Error saving HTML for {accession_number} to S3: {e}")
             raise
@@ -233,7 +507,7 @@ class S3StorageService:
         """
         try:
             await asyncio.get_event_loop().run_in_executor(
-                None,
+                self._io_executor,
                 lambda: self._get_s3_client().put_object(
                     Bucket=self.bucket_name,
                     Key=s3_key,
@@ -256,14 +530,10 @@ class S3StorageService:
         """
         s3_key = f"summaries/{file_id}.md"
         try:
-            await asyncio.get_event_loop().run_in_executor(
-                None,
-                lambda: self._get_s3_client().put_object(
-                    Bucket=self.bucket_name,
-                    Key=s3_key,
-                    Body=document_content.encode('utf-8'),
-                    ContentType='text/markdown' # Or 'text/html'
-                )
+            await self._upload_fileobj(
+                io.BytesIO(document_content.encode('utf-8')),
+                s3_key,
+                'text/markdown' # Or 'text/html'
             )
             logger.info(f"Successfully saved summary document to {s3_key}")
         except ClientError as e:
@@ -290,7 +560,7 @@ class S3StorageService:
         """
         try:
             response = await asyncio.get_event_loop().run_in_executor(
-                None,
+                self._io_executor,
                 lambda: self._get_s3_client().get_object(Bucket=self.bucket_name, Key=s3_key)
             )
             return response['Body'].read().decode('utf-8')
@@ -318,6 +588,23 @@ class S3StorageService:
         logger.info(f"Generated public S3 URL: {public_url}")
         return public_url
 
+    async def generate_presigned_urls(self, s3_keys: List[str], expiration: int = 3600) -> Dict[str, str]:
+        """
+        Generates direct public URLs for many S3 objects at once.
+
+        :param s3_keys: The keys of the objects in S3.
+        :param expiration: (Ignored for public URLs) Time in seconds for the presigned URLs to remain valid.
+        :return: A mapping of each key to its public URL. Empty if bucket name is not configured.
+        """
+        if not self.bucket_name:
+            logger.error("S3 bucket name is not configured. Cannot generate public URLs.")
+            return {}
+
+        base_url = f"https://{self.bucket_name}.s3.amazonaws.com/"
+        urls = {s3_key: f"{base_url}{s3_key}" for s3_key in s3_keys}
+        logger.info(f"Generated {len(urls)} public S3 URLs")
+        return urls
+
     async def object_exists(self, key: str) -> bool:
         """
         Checks if an object exists in S3.
@@ -326,7 +613,10 @@ class S3StorageService:
         :return: True if the object exists, False otherwise.
         """
         try:
-            await self._get_s3_client().head_object(Bucket=self.bucket_name, Key=key)
+            await asyncio.get_event_loop().run_in_executor(
+                self._io_executor,
+                lambda: self._get_s3_client().head_object(Bucket=self.bucket_name, Key=key)
+            )
             return True
         except ClientError as e:
             if e.response['Error']['Code'] == '404':
@@ -336,10 +626,37 @@ class S3StorageService:
             logger.error(f"Error checking object existence for {key}: {e}")
             return False
 
+    async def objects_exist(self, keys: List[str]) -> Dict[str, bool]:
+        """
+        Checks existence of many objects with one listing per common prefix.
+
+        Keys are grouped by their parent "directory", so checking e.g. every yearly
+        partition of a ticker costs a single ListObjectsV2 call instead of one
+        HeadObject round trip per key.
+
+        :param keys: The full S3 keys to check.
+        :return: A mapping of each key to whether it exists.
+        """
+        keys_by_prefix: Dict[str, List[str]] = {}
+        for key in keys:
+            prefix = key.rsplit('/', 1)[0] + '/' if '/' in key else ''
+            keys_by_prefix.setdefault(prefix, []).append(key)
+
+        loop = asyncio.get_event_loop()
+        prefixes = list(keys_by_prefix)
+        listings = await asyncio.gather(*[
+            loop.run_in_executor(self._io_executor, self._list_prefix_keys, prefix) for prefix in prefixes
+        ])
+
+        existing = set()
+        for listing in listings:
+            existing.update(listing.keys())
+        return {key: key in existing for key in keys}
+
     async def _read_s3_file(self, s3_key: str) -> Optional[str]:
         try:
             response = await asyncio.get_event_loop().run_in_executor(
-                None,
+                self._io_executor,
                 lambda: self._get_s3_client().get_object(Bucket=self.bucket_name, Key=s3_key)
             )
             return response['Body'].read().decode('utf-8')
@@ -349,75 +666,593 @@ class S3StorageService:
             logger.error(f"Error reading file from S3 ({s3_key}): {e}")
             return None
 
-    async def get_fundamentals(self, ticker: str) -> Optional[pd.DataFrame]:
+    def _list_prefix_keys(self, s3_prefix: str) -> Dict[str, str]:
+        """Lists the keys under a prefix with their ETags, which the listing already carries."""
+        paginator = self._get_list_paginator()
+        return {
+            obj['Key']: obj.get('ETag', '')
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=s3_prefix)
+            for obj in page.get('Contents', [])
+        }
+
+    def _list_common_prefixes(self, s3_prefix: str, delimiter: str) -> Dict[str, str]:
+        paginator = self._get_list_paginator()
+        return {
+            common['Prefix']: ''
+            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=s3_prefix, Delimiter=delimiter)
+            for common in page.get('CommonPrefixes', [])
+        }
+
+    async def _list_ticker_keys(self, s3_prefix: str, key_marker: str) -> List[str]:
+        """Lists every key under ``s3_prefix`` whose name contains ``key_marker``."""
+        keys = await self._list_cached_prefix(s3_prefix)
+        return [key for key in keys if key_marker in key]
+
+    async def _list_cached_prefix(self, s3_prefix: str, delimiter: Optional[str] = None) -> Dict[str, str]:
+        """
+        Lists every key under ``s3_prefix`` with its ETag, or with ``delimiter``
+        the common prefixes one level below it.
+
+        Each prefix's listing is cached for a short TTL so repeated reads don't
+        re-paginate the bucket; uploads invalidate it. Concurrent misses on one
+        prefix await the same listing task, and no lock is held across the
+        request, so listings of unrelated prefixes run side by side.
+        """
+        cache_key = (s3_prefix, delimiter)
+        cached = self._list_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < _LIST_CACHE_TTL_SECONDS:
+            return cached[1]
+        listing = self._inflight_listings.get(cache_key)
+        if listing is None:
+            listing = asyncio.ensure_future(self._fetch_listing(cache_key))
+            self._inflight_listings[cache_key] = listing
+            listing.add_done_callback(functools.partial(self._forget_listing, cache_key))
+        # Shielded so one caller being cancelled doesn't cancel the listing for the others
+        return await asyncio.shield(listing)
+
+    async def _fetch_listing(self, cache_key: Tuple[str, Optional[str]]) -> Dict[str, str]:
+        s3_prefix, delimiter = cache_key
+        listed_at = time.monotonic()
+        keys = await asyncio.get_event_loop().run_in_executor(
+            self._io_executor,
+            lambda: self._list_common_prefixes(s3_prefix, delimiter) if delimiter
+            else self._list_prefix_keys(s3_prefix)
+        )
+        # A write under the prefix while this listing ran invalidated it; the
+        # result may predate that write, so it is returned but not cached.
+        if self._inflight_listings.get(cache_key) is asyncio.current_task():
+            if len(self._list_cache) >= _LIST_CACHE_MAX_PREFIXES:
+                self._prune_list_cache()
+            self._list_cache[cache_key] = (listed_at, keys)
+        return keys
+
+    def _prune_list_cache(self) -> None:
+        expired_before = time.monotonic() - _LIST_CACHE_TTL_SECONDS
+        for cache_key in [key for key, (listed_at, _) in self._list_cache.items() if listed_at < expired_before]:
+            del self._list_cache[cache_key]
+
+    def _forget_listing(self, cache_key: Tuple[str, Optional[str]], listing: "asyncio.Task[Dict[str, str]]") -> None:
+        if self._inflight_listings.get(cache_key) is listing:
+            del self._inflight_listings[cache_key]
+
+    def _invalidate_list_cache(self, s3_key: str):
+        for cache_key in [key for key in self._list_cache if s3_key.startswith(key[0])]:
+            s3_prefix, delimiter = cache_key
+            if delimiter is not None:
+                # A delimited listing only changes when the key opens a new common prefix
+                common_prefix = s3_prefix + s3_key[len(s3_prefix):].split(delimiter, 1)[0] + delimiter
+                if common_prefix in self._list_cache[cache_key][1]:
+                    continue
+            self._list_cache.pop(cache_key, None)
+        for cache_key in [key for key in self._inflight_listings if s3_key.startswith(key[0])]:
+            self._inflight_listings.pop(cache_key, None)
+
+    async def _list_price_keys(
+        self,
+        ticker: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Dict[str, str]:
+        """
+        Lists one ticker's price objects (yearly files and appended parts) in the
+        requested years, mapped to their ETags.
+
+        The year partitions come from a cached delimited listing; each year is
+        then listed with the ticker's own key prefix, so the cost doesn't grow
+        with the number of tickers stored.
+        """
+        years = self._filter_keys_by_year(
+            await self._list_cached_prefix(_PRICE_PREFIX, '/'), start_date, end_date
+        )
+        listings = await asyncio.gather(*(
+            self._list_price_year_keys(ticker, int(match.group(1)))
+            for year_prefix in years
+            if (match := _YEAR_PARTITION_RE.search(year_prefix)) is not None
+        ))
+        return {key: etag for listing in listings for key, etag in listing.items()}
+
+    async def _list_price_year_keys(self, ticker: str, year: int) -> Dict[str, str]:
+        """Lists a ticker's yearly price object and its appended parts for one year, with ETags."""
+        keys = await self._list_cached_prefix(f"{_PRICE_PREFIX}year={year}/daily_prices_{ticker}_{year}")
+        # The prefix would also match a ticker that starts with this one's name and year
+        return {
+            key: etag for key, etag in keys.items()
+            if (match := _PRICE_KEY_TICKER_RE.search(key)) is not None and match.group(1) == ticker
+        }
+
+    @staticmethod
+    def _filter_keys_by_year(
+        keys: List[str],
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> List[str]:
+        """Drops yearly partitions that fall entirely outside the requested date range."""
+        if start_date is None and end_date is None:
+            return keys
+
+        filtered = []
+        for key in keys:
+            match = _YEAR_PARTITION_RE.search(key)
+            if match is None:
+                filtered.append(key)
+                continue
+            year = int(match.group(1))
+            if start_date is not None and year < start_date.year:
+                continue
+            if end_date is not None and year > end_date.year:
+                continue
+            filtered.append(key)
+        return filtered
+
+    def _get_s3_filesystem(self) -> pafs.S3FileSystem:
+        if self._s3_filesystem is None:
+            region = boto3.session.Session().region_name or "us-east-1"
+            self._s3_filesystem = pafs.S3FileSystem(region=region)
+        return self._s3_filesystem
+
+    def _read_parquet_dataset(
+        self,
+        s3_keys: List[str],
+        columns: Optional[List[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Optional[pd.DataFrame]:
+        table = self._read_parquet_table(s3_keys, columns, start_date, end_date)
+        if table is None:
+            return None
+        return table.to_pandas().reset_index(drop=True)
+
+    def _parquet_scanner(
+        self,
+        s3_keys: List[str],
+        columns: Optional[List[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        schema: Optional[pa.Schema] = None
+    ) -> ds.Scanner:
+        """
+        Builds a scanner over a set of parquet objects read as a single pyarrow dataset.
+
+        Only the requested columns are decoded, and the date filter is pushed down
+        so row groups whose statistics fall outside the range are skipped. Without
+        ``schema`` the dataset takes the first object's schema.
+        """
+        # Key order is date order: yearly files sort before their appended parts
+        dataset = ds.dataset(
+            [f"{self.bucket_name}/{key}" for key in sorted(s3_keys)],
+            schema=schema,
+            format="parquet",
+            filesystem=self._get_s3_filesystem()
+        )
+
+        date_filter = None
+        if 'date' in dataset.schema.names:
+            date_filter = _date_filter(dataset.schema.field('date').type, start_date, end_date)
+
+        return dataset.scanner(columns=columns, filter=date_filter)
+
+    def _read_parquet_table(
+        self,
+        s3_keys: List[str],
+        columns: Optional[List[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: Optional[int] = None,
+        schema: Optional[pa.Schema] = None
+    ) -> Optional[pa.Table]:
+        """
+        Reads a set of parquet objects into one table. With ``limit`` the scan
+        stops once that many matching rows have been read.
+        """
+        scanner = self._parquet_scanner(s3_keys, columns, start_date, end_date, schema)
+        table = scanner.head(limit) if limit is not None else scanner.to_table()
+        if table.num_rows == 0:
+            return None
+        return table
+
+    def _open_parquet_reader(
+        self,
+        s3_keys: List[str],
+        columns: Optional[List[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        schema: Optional[pa.Schema] = None
+    ) -> Optional[pa.RecordBatchReader]:
+        """
+        Opens a reader that fetches record batches as it is consumed.
+
+        The first non-empty batch is read eagerly so an empty result is reported
+        as None rather than as a reader with no rows.
+        """
+        scanner = self._parquet_scanner(s3_keys, columns, start_date, end_date, schema)
+        batches = (batch for batch in scanner.to_batches() if batch.num_rows)
+        first = next(batches, None)
+        if first is None:
+            return None
+        return pa.RecordBatchReader.from_batches(scanner.projected_schema, itertools.chain([first], batches))
+
+    def _read_parquet_footer(self, s3_key: str) -> pq.FileMetaData:
+        """
+        Fetches and parses only the parquet footer of an S3 object.
+
+        A suffix range GET pulls the tail of the object; a second request is made
+        only when the footer is larger than the first range.
+        """
+        client = self._get_s3_client()
+        tail = client.get_object(
+            Bucket=self.bucket_name, Key=s3_key, Range=f"bytes=-{_FOOTER_RANGE_BYTES}"
+        )['Body'].read()
+        footer_length = int.from_bytes(tail[-8:-4], 'little') + 8
+        if footer_length > len(tail):
+            tail = client.get_object(
+                Bucket=self.bucket_name, Key=s3_key, Range=f"bytes=-{footer_length}"
+            )['Body'].read()
+        # The reader only needs the leading magic bytes plus the footer itself.
+        return pq.read_metadata(pa.BufferReader(_PARQUET_MAGIC + tail[-footer_length:]))
+
+    async def _get_date_bounds(self, s3_key: str, column: str = 'date') -> Optional[Tuple[date, date]]:
+        """
+        Returns the (min, max) of a date column from parquet row-group statistics.
+
+        :return: The bounds, or None if the object is missing or lacks statistics.
+        """
+        try:
+            metadata = await asyncio.get_event_loop().run_in_executor(
+                self._io_executor, lambda: self._read_parquet_footer(s3_key)
+            )
+        except ClientError:
+            return None
+        return self._footer_date_bounds(metadata, column)
+
+    @staticmethod
+    def _footer_date_bounds(metadata: pq.FileMetaData, column: str = 'date') -> Optional[Tuple[date, date]]:
+        """Reads the (min, max) of a column from already-fetched footer statistics."""
+        column_index = None
+        if metadata.num_row_groups:
+            row_group = metadata.row_group(0)
+            for i in range(row_group.num_columns):
+                if row_group.column(i).path_in_schema == column:
+                    column_index = i
+                    break
+        if column_index is None:
+            return None
+
+        mins, maxes = [], []
+        for i in range(metadata.num_row_groups):
+            statistics = metadata.row_group(i).column(column_index).statistics
+            if statistics is None or not statistics.has_min_max:
+                return None
+            mins.append(statistics.min)
+            maxes.append(statistics.max)
+
+        # Legacy objects may store dates as strings; their statistics aren't usable bounds
+        if not all(isinstance(value, date) for value in (*mins, *maxes)):
+            return None
+
+        def _as_date(value) -> date:
+            return value.date() if isinstance(value, datetime) else value
+
+        return _as_date(min(mins)), _as_date(max(maxes))
+
+    async def get_fundamentals(
+        self,
+        ticker: str,
+        columns: Optional[List[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Optional[pd.DataFrame]:
         s3_prefix = f"fundamentals/fmp/year="
         try:
-            paginator = self._get_s3_client().get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=self.bucket_name, Prefix=s3_prefix)
-            
-            all_data = []
-            for page in pages:
-                for obj in page.get('Contents', []):
-                    key = obj['Key']
-                    if f"fundamentals_{ticker}" in key:
-                        response = self._get_s3_client().get_object(Bucket=self.bucket_name, Key=key)
-                        df = pq.read_table(io.BytesIO(response['Body'].read())).to_pandas()
-                        all_data.append(df)
-            
-            if not all_data:
+            ticker_keys = await self._list_ticker_keys(s3_prefix, f"fundamentals_{ticker}_")
+            ticker_keys = self._filter_keys_by_year(ticker_keys, start_date, end_date)
+
+            if not ticker_keys:
                 return None
 
-            return pd.concat(all_data, ignore_index=True)
+            return await asyncio.get_event_loop().run_in_executor(
+                self._io_executor,
+                lambda: self._read_parquet_dataset(ticker_keys, columns, start_date, end_date)
+            )
             
         except Exception as e:
             logger.error(f"Error retrieving fundamentals data for {ticker} from S3: {e}")
             return None
 
-    async def get_price_data(self, ticker: str) -> Optional[pd.DataFrame]:
-        s3_prefix = f"market-data/daily_prices/"
+    async def get_price_data(
+        self,
+        ticker: str,
+        columns: Optional[List[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Optional[pd.DataFrame]:
+        table = await self.get_price_table(ticker, columns, start_date, end_date)
+        if table is None:
+            return None
+        return await asyncio.get_event_loop().run_in_executor(self._io_executor, table.to_pandas)
+
+    async def get_price_table(
+        self,
+        ticker: str,
+        columns: Optional[List[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        limit: Optional[int] = None
+    ) -> Optional[pa.Table]:
+        """
+        Like ``get_price_data`` but returns the Arrow table, for callers that
+        serialize it directly and don't need a pandas round trip. ``limit`` caps
+        the number of rows read, earliest dates first.
+
+        Concurrent calls with identical arguments share a single read. A full
+        history read (no columns, dates or limit) is kept in memory for recently
+        read tickers, and later reads of the ticker are sliced from it until the
+        stored objects change; otherwise the columns, date range and limit are
+        pushed down to the scan.
+        """
+        read_key = (ticker, tuple(columns) if columns else None, start_date, end_date, limit)
+        read_task = self._inflight_price_reads.get(read_key)
+        if read_task is None:
+            read_task = asyncio.ensure_future(
+                self._read_price_table(ticker, columns, start_date, end_date, limit)
+            )
+            self._inflight_price_reads[read_key] = read_task
+            read_task.add_done_callback(lambda _: self._inflight_price_reads.pop(read_key, None))
+        # Shielded so one caller disconnecting doesn't cancel the read for the others
+        return await asyncio.shield(read_task)
+
+    async def _read_price_table(
+        self,
+        ticker: str,
+        columns: Optional[List[str]],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        limit: Optional[int]
+    ) -> Optional[pa.Table]:
         try:
-            paginator = self._get_s3_client().get_paginator('list_objects_v2')
-            all_ticker_keys = []
-            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=s3_prefix):
-                for obj in page.get('Contents', []):
-                    if f"daily_prices_{ticker}" in obj.get('Key', ''):
-                        all_ticker_keys.append(obj['Key'])
-
-            if not all_ticker_keys:
+            ticker_keys = await self._list_price_keys(ticker)
+            if not ticker_keys:
                 return None
-            
-            return pd.concat(await self.download_multiple_dataframes(all_ticker_keys), ignore_index=True)
+
+            loop = asyncio.get_event_loop()
+            version = self._price_keys_version(ticker_keys)
+            cached = self._hot_price_tables.get(ticker)
+            if cached is not None and cached[0] == version:
+                self._hot_price_tables.move_to_end(ticker)
+                return await loop.run_in_executor(
+                    self._io_executor,
+                    lambda: self._slice_price_table(cached[1], columns, start_date, end_date, limit)
+                )
+
+            if columns or start_date is not None or end_date is not None or limit is not None:
+                range_keys = self._filter_keys_by_year(list(ticker_keys), start_date, end_date)
+                if not range_keys:
+                    return None
+                return await loop.run_in_executor(
+                    self._io_executor,
+                    lambda: self._read_parquet_table(
+                        range_keys, columns, start_date, end_date, limit, schema=_PRICE_SCHEMA
+                    )
+                )
+
+            full_table = await loop.run_in_executor(
+                self._io_executor, lambda: self._read_parquet_table(list(ticker_keys), schema=_PRICE_SCHEMA)
+            )
+            if full_table is None:
+                return None
+            self._hot_price_tables[ticker] = (version, full_table)
+            self._hot_price_tables.move_to_end(ticker)
+            while len(self._hot_price_tables) > self.config.hot_price_cache_tickers:
+                self._hot_price_tables.popitem(last=False)
+            return full_table
+
+        except Exception as e:
+            logger.error(f"Error retrieving price table for {ticker} from S3: {e}")
+            return None
+
+    @staticmethod
+    def _slice_price_table(
+        table: pa.Table,
+        columns: Optional[List[str]],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        limit: Optional[int]
+    ) -> Optional[pa.Table]:
+        """Applies a read's date range, column selection and row limit to an in-memory price table."""
+        date_filter = _date_filter(table.schema.field('date').type, start_date, end_date)
+        if date_filter is not None:
+            table = table.filter(date_filter)
+        if columns:
+            table = table.select(columns)
+        if limit is not None:
+            table = table.slice(0, limit)
+        return table if table.num_rows else None
+
+    @staticmethod
+    def _price_keys_version(objects: Dict[str, str]) -> str:
+        """Joins object keys with their listed ETags; changes whenever any of the objects does."""
+        return "|".join(f"{key}:{objects[key]}" for key in sorted(objects))
+
+    async def get_price_table_for_tickers(
+        self,
+        tickers: List[str],
+        columns: Optional[List[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Optional[pa.Table]:
+        """
+        Reads prices for several tickers in one dataset scan.
+
+        The key listing is shared and every matching object goes into a single
+        pushed-down scan, instead of a listing and scan per ticker. Rows are
+        identified by their ``ticker`` column, which is always included.
+        """
+        wanted = set(tickers)
+        try:
+            price_keys = await self._list_ticker_keys(_PRICE_PREFIX, "daily_prices_")
+            ticker_keys = [
+                key for key in price_keys
+                if (match := _PRICE_KEY_TICKER_RE.search(key)) is not None and match.group(1) in wanted
+            ]
+            ticker_keys = self._filter_keys_by_year(ticker_keys, start_date, end_date)
+
+            if not ticker_keys:
+                return None
+
+            if columns is not None and 'ticker' not in columns:
+                columns = ['ticker', *columns]
+            return await asyncio.get_event_loop().run_in_executor(
+                self._io_executor,
+                lambda: self._read_parquet_table(
+                    ticker_keys, columns, start_date, end_date, schema=_PRICE_SCHEMA
+                )
+            )
 
         except Exception as e:
-            logger.error(f"Error retrieving price data for {ticker} from S3: {e}")
+            logger.error(f"Error retrieving price data for {len(wanted)} tickers from S3: {e}")
+            return None
+
+    async def get_price_coverage(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Summarizes stored prices per ticker: row count and earliest/latest date.
+
+        Everything comes from one shared key listing and the Parquet footers of
+        the matching objects, fetched concurrently, so no price data is read.
+        Tickers without stored prices are reported with zero records.
+        """
+        coverage: Dict[str, Dict[str, Any]] = {
+            ticker: {'record_count': 0, 'earliest_date': None, 'latest_date': None}
+            for ticker in tickers
+        }
+        price_keys = await self._list_ticker_keys(_PRICE_PREFIX, "daily_prices_")
+        key_tickers = {
+            key: match.group(1) for key in price_keys
+            if (match := _PRICE_KEY_TICKER_RE.search(key)) is not None and match.group(1) in coverage
+        }
+        if not key_tickers:
+            return coverage
+
+        loop = asyncio.get_event_loop()
+        footers = await asyncio.gather(*(
+            loop.run_in_executor(self._io_executor, lambda key=key: self._read_parquet_footer(key))
+            for key in key_tickers
+        ), return_exceptions=True)
+
+        for (key, ticker), metadata in zip(key_tickers.items(), footers):
+            if isinstance(metadata, Exception):
+                logger.error(f"Error reading parquet footer of {key}: {metadata}")
+                continue
+            info = coverage[ticker]
+            info['record_count'] += metadata.num_rows
+            bounds = self._footer_date_bounds(metadata)
+            if bounds is not None:
+                earliest, latest = bounds
+                info['earliest_date'] = min(filter(None, (info['earliest_date'], earliest)))
+                info['latest_date'] = max(filter(None, (info['latest_date'], latest)))
+        return coverage
+
+    async def get_price_data_version(
+        self,
+        ticker: str,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Optional[str]:
+        """
+        Returns a token that changes whenever the stored prices for the range change.
+
+        Built from the keys and S3 ETags of the yearly objects covering the range,
+        taken from the cached listing, so it costs no object reads. Returns None
+        when no data is stored for the range.
+        """
+        try:
+            ticker_keys = await self._list_price_keys(ticker, start_date, end_date)
+        except Exception as e:
+            logger.error(f"Error listing price data for {ticker} from S3: {e}")
+            return None
+
+        if not ticker_keys:
+            return None
+        return self._price_keys_version(ticker_keys)
+
+    async def open_price_reader(
+        self,
+        ticker: str,
+        columns: Optional[List[str]] = None,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None
+    ) -> Optional[pa.RecordBatchReader]:
+        """
+        Streaming counterpart of ``get_price_table``: returns a record batch reader
+        that pulls row groups from S3 as it is consumed, so memory stays flat
+        however long the requested history is. Consume it off the event loop.
+        """
+        try:
+            ticker_keys = await self._list_price_keys(ticker, start_date, end_date)
+
+            if not ticker_keys:
+                return None
+
+            return await asyncio.get_event_loop().run_in_executor(
+                self._io_executor,
+                lambda: self._open_parquet_reader(list(ticker_keys), columns, start_date, end_date, _PRICE_SCHEMA)
+            )
+
+        except Exception as e:
+            logger.error(f"Error opening price reader for {ticker} from S3: {e}")
             return None
 
     async def get_latest_price_date(self, ticker: str) -> Optional[date]:
-        s3_prefix = "market-data/daily_prices/"
         try:
-            paginator = self._get_s3_client().get_paginator('list_objects_v2')
-            
-            all_ticker_keys = []
-            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=s3_prefix):
-                for obj in page.get('Contents', []):
-                    if f"daily_prices_{ticker}" in obj.get('Key', ''):
-                        all_ticker_keys.append(obj['Key'])
+            # Newest year first: usually the first year listed holds the ticker's latest object
+            year_prefixes = await self._list_cached_prefix(_PRICE_PREFIX, '/')
+            years = sorted(
+                (int(match.group(1)) for prefix in year_prefixes
+                 if (match := _YEAR_PARTITION_RE.search(prefix)) is not None),
+                reverse=True
+            )
+            year_keys: Dict[str, str] = {}
+            for year in years:
+                year_keys = await self._list_price_year_keys(ticker, year)
+                if year_keys:
+                    break
 
-            if not all_ticker_keys:
-                    return None
+            if not year_keys:
+                return None
 
-            latest_key = max(all_ticker_keys)
+            latest_key = max(year_keys)
 
-            response = self._get_s3_client().get_object(Bucket=self.bucket_name, Key=latest_key)
-            df = pq.read_table(io.BytesIO(response['Body'].read())).to_pandas()
+            date_bounds = await self._get_date_bounds(latest_key)
+            if date_bounds is not None:
+                return date_bounds[1]
 
-            if 'date' not in df.columns:
+            # Footer had no usable statistics; fall back to reading the column.
+            dates = await asyncio.get_event_loop().run_in_executor(
+                self._io_executor,
+                lambda: self._read_parquet_table([latest_key], ['date'], schema=_PRICE_SCHEMA)
+            )
+            if dates is None:
                 return None
-            
-            df['date'] = pd.to_datetime(df['date']).dt.date
-            
-            latest_date = df['date'].max()
-            return latest_date
+            latest = pc.max(dates['date']).as_py()
+            return latest.date() if latest is not None else None
 
         except Exception as e:
             logger.error(f"Error retrieving latest price date for {ticker} from S3: {e}")
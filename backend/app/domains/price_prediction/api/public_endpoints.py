@@ -5,37 +5,50 @@ Client-facing endpoints for price prediction and modeling functionality.
 Only includes endpoints that external clients should access.
 """
 
-from typing import Optional, Dict
-from datetime import datetime, timedelta
+import hashlib
+from typing import Annotated, List, Literal, Optional
+from datetime import date, datetime, timedelta
 
-from fastapi import APIRouter, Depends, Path, Query, HTTPException
+from fastapi import APIRouter, Depends, Header, Path, Query, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from app.shared.response_models import APIResponse
-from app.shared.exceptions import handle_domain_exception
+from app.shared.validation_utils import TickerStr, normalize_tickers
+from app.shared.response_utils import NumpyORJSONResponse, resolve_table_format, table_response
+from app.domains.data_collection.models.market_data import BatchPriceHistoryRequest
+from app.domains.data_collection.storage.s3_storage_service import PRICE_COLUMNS, get_s3_storage_service
 from app.domains.price_prediction.price_prediction_service import get_price_prediction_service, PricePredictionService
 
 router = APIRouter()
 
+# Ranges that ended before today no longer change, so caches may keep them for a day
+_CLOSED_RANGE_CACHE_CONTROL = "public, max-age=86400"
+_OPEN_RANGE_CACHE_CONTROL = "public, max-age=60"
+
+def _validate_price_columns(columns: Optional[List[str]]) -> None:
+    """Rejects unknown column names up front, so they fail as a bad request rather than a missing ticker."""
+    unknown = [column for column in columns or () if column not in PRICE_COLUMNS]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown price columns: {', '.join(unknown)}. Available: {', '.join(PRICE_COLUMNS)}"
+        )
+
 @router.post("/predict/{ticker}")
 async def predict_stock_price(
-    ticker: str = Path(
-        ..., 
+    ticker: Annotated[TickerStr, Path(
         title="Stock Ticker", 
-        description="The ticker symbol of the company (e.g., AAPL)", 
-        min_length=1, 
-        max_length=10
-    ),
+        description="The ticker symbol of the company (e.g., AAPL)"
+    )],
     days_ahead: int = Query(
         30, 
         description="Number of days to predict ahead", 
         ge=1, 
         le=90
     ),
-    model_type: str = Query(
+    model_type: Literal["lstm", "linear_regression", "ensemble"] = Query(
         "lstm", 
-        description="Prediction model type",
-        regex="^(lstm|linear_regression|ensemble)$"
+        description="Prediction model type"
     ),
 ):
     """
@@ -61,10 +74,9 @@ async def predict_stock_price(
         
         # This will raise PricePredictionNotImplementedException
         result = await price_prediction_service.predict_price(
-            ticker=ticker.upper(),
+            ticker=ticker,
             days_ahead=days_ahead,
-            model_type=model_type,
-            db=db
+            model_type=model_type
         )
         
         return result
@@ -76,7 +88,7 @@ async def predict_stock_price(
                 status="pending",
                 message="Price prediction functionality is currently under development",
                 data={
-                    "ticker": ticker.upper(),
+                    "ticker": ticker,
                     "requested_prediction_date": (datetime.now() + timedelta(days=days_ahead)).isoformat(),
                     "model_type": model_type,
                     "implementation_status": "In Development",
@@ -87,27 +99,118 @@ async def predict_stock_price(
                     ]
                 }
             )
-        else:
-            raise handle_domain_exception(e) 
+        raise
 
-@router.get("/price/{ticker}", response_model=Dict)
+@router.get("/price/{ticker}", response_class=NumpyORJSONResponse)
 async def predict_price(
-    ticker: str,
+    ticker: TickerStr,
     days_ahead: int = 30,
     prediction_service: PricePredictionService = Depends(get_price_prediction_service)
 ):
     """
     Trains an ARIMA model on historical price data and returns future price predictions.
     """
-    if not ticker or not isinstance(ticker, str):
-        raise HTTPException(status_code=400, detail="A valid ticker symbol is required.")
-        
     if not isinstance(days_ahead, int) or not (1 <= days_ahead <= 365):
         raise HTTPException(status_code=400, detail="Days ahead must be an integer between 1 and 365.")
 
-    result = await prediction_service.train_and_predict(ticker.upper(), days_ahead)
+    result = await prediction_service.train_and_predict(ticker, days_ahead)
     
     if not result.get('success'):
         raise HTTPException(status_code=500, detail=result.get('error', 'Prediction failed'))
         
-    return result 
\ No newline at end of file
+    # Forecast series are plain numeric lists; orjson encodes them without the jsonable_encoder pass
+    return NumpyORJSONResponse(result)
+
+@router.get("/history/{ticker}")
+async def get_price_history(
+    request: Request,
+    ticker: Annotated[TickerStr, Path()],
+    start_date: Optional[date] = Query(None, description="First date to include (YYYY-MM-DD)"),
+    end_date: Optional[date] = Query(None, description="Last date to include (YYYY-MM-DD)"),
+    columns: Optional[str] = Query(None, description="Comma-separated columns to return, e.g. date,close"),
+    limit: Optional[int] = Query(None, ge=1, description="Maximum number of rows to return, earliest first"),
+    format: Optional[Literal["json", "columns", "arrow", "parquet"]] = Query(
+        None, description="Response encoding; defaults to content negotiation on the Accept header"
+    ),
+    accept: Optional[str] = Header(None)
+):
+    """
+    Returns stored daily prices for a ticker as a table.
+    
+    ``format=arrow`` (or ``Accept: application/vnd.apache.arrow.stream``) streams
+    Arrow IPC, ``format=parquet`` returns a Parquet file, ``format=columns`` returns
+    one JSON object of per-column value lists, and the default is NDJSON.
+    The response is written straight from Arrow data read from storage; without
+    ``limit``, Arrow and NDJSON responses stream row groups as they are read.
+    Column selection, the date range and ``limit`` are all applied in the storage scan.
+    
+    Responses carry a weak ETag derived from the stored objects' versions, so a
+    revalidating client gets ``304 Not Modified`` without any data being read.
+    """
+    selected_columns = [c.strip() for c in columns.split(",") if c.strip()] if columns else None
+    _validate_price_columns(selected_columns)
+    output_format = resolve_table_format(accept, format)
+    storage = get_s3_storage_service()
+    
+    data_version = await storage.get_price_data_version(ticker, start_date, end_date)
+    if data_version is None:
+        raise HTTPException(status_code=404, detail=f"No price data found for {ticker}")
+    
+    etag_source = f"{data_version}|{ticker}|{start_date}|{end_date}|{limit}|{selected_columns}|{output_format}"
+    cache_headers = {
+        "ETag": f'W/"{hashlib.blake2b(etag_source.encode(), digest_size=16).hexdigest()}"',
+        "Cache-Control": _CLOSED_RANGE_CACHE_CONTROL if end_date is not None and end_date < date.today() else _OPEN_RANGE_CACHE_CONTROL,
+        "Vary": "Accept",
+    }
+    if request.headers.get("if-none-match") == cache_headers["ETag"]:
+        return Response(status_code=304, headers=cache_headers)
+    
+    if limit is None and output_format not in ("parquet", "columns"):
+        # Streamed formats pull row groups from storage as the response is written
+        price_source = await storage.open_price_reader(
+            ticker,
+            columns=selected_columns,
+            start_date=start_date,
+            end_date=end_date
+        )
+    else:
+        price_source = await storage.get_price_table(
+            ticker,
+            columns=selected_columns,
+            start_date=start_date,
+            end_date=end_date,
+            limit=limit
+        )
+    if price_source is None:
+        raise HTTPException(status_code=404, detail=f"No price data found for {ticker}")
+    
+    response = table_response(price_source, output_format=output_format)
+    response.headers.update(cache_headers)
+    return response
+
+@router.post("/history/batch")
+async def get_price_history_batch(
+    request: BatchPriceHistoryRequest,
+    format: Optional[Literal["json", "columns", "arrow", "parquet"]] = Query(
+        None, description="Response encoding; defaults to content negotiation on the Accept header"
+    ),
+    accept: Optional[str] = Header(None)
+):
+    """
+    Returns stored daily prices for several tickers as one table.
+    
+    All tickers are read in a single storage scan; rows carry a ``ticker``
+    column. Encodings are the same as for ``/history/{ticker}``.
+    """
+    _validate_price_columns(request.columns)
+    tickers = normalize_tickers(request.tickers)
+    price_table = await get_s3_storage_service().get_price_table_for_tickers(
+        tickers,
+        columns=request.columns,
+        start_date=request.start_date,
+        end_date=request.end_date
+    )
+    if price_table is None:
+        raise HTTPException(status_code=404, detail="No price data found for the requested tickers")
+    
+    return table_response(price_table, accept, format)
@@ -15,7 +15,10 @@ from .modeling_config import (
     SP_500_TICKERS,
     MAJOR_INDEXES,
     SECTOR_ETFS,
-    ALL_SYMBOLS
+    ALL_SYMBOLS,
+    SP_100_SYMBOLS,
+    INDEX_SYMBOLS,
+    ALL_TARGET_SYMBOLS
 )
 
 __all__ = [
@@ -29,5 +32,8 @@ __all__ = [
     "SP_500_TICKERS",
     "MAJOR_INDEXES", 
     "SECTOR_ETFS",
-    "ALL_SYMBOLS"
+    "ALL_SYMBOLS",
+    "SP_100_SYMBOLS",
+    "INDEX_SYMBOLS",
+    "ALL_TARGET_SYMBOLS"
 ] 
\ No newline at end of file
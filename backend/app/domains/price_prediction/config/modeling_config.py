@@ -6,7 +6,8 @@ data source settings, and market constants.
 """
 
 import os
-from typing import List, Optional, Dict
+from functools import lru_cache
+from typing import List, Optional, Dict, Tuple
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -51,30 +52,24 @@ class ModelingConfig(BaseSettings):
     default_lookback_days: int = 365 * 10  # 10 years default
     
     @property
-    def sp100_tickers(self) -> List[str]:
+    def sp100_tickers(self) -> Tuple[str, ...]:
         """Get S&P 100 ticker symbols."""
-        return SP_100_TICKERS.copy()
+        return SP_100_SYMBOLS
     
     @property
-    def sp500_tickers(self) -> List[str]:
+    def sp500_tickers(self) -> Tuple[str, ...]:
         """Get S&P 500 ticker symbols."""
-        return SP_500_TICKERS.copy()
+        return SP_500_SYMBOLS
     
     @property
-    def major_indexes(self) -> List[str]:
+    def major_indexes(self) -> Tuple[str, ...]:
         """Get major index symbols."""
-        symbols = []
-        for index_list in MAJOR_INDEXES.values():
-            symbols.extend(index_list)
-        return sorted(list(set(symbols)))
+        return INDEX_SYMBOLS
     
     @property
-    def sector_etfs(self) -> List[str]:
+    def sector_etfs(self) -> Tuple[str, ...]:
         """Get sector ETF symbols."""
-        symbols = []
-        for sector_list in SECTOR_ETFS.values():
-            symbols.extend(sector_list)
-        return sorted(list(set(symbols)))
+        return SECTOR_ETF_SYMBOLS
 
     def validate_required_fields(self) -> Dict[str, bool]:
         """
@@ -111,18 +106,18 @@ SP_100_TICKERS = [
     
     # Consumer Discretionary
     "HD", "MCD", "NKE", "SBUX", "LOW", "TJX", "BKNG", "MAR", "GM", "F",
-    "AMZN", "TSLA", "TGT", "COST", "WMT", "CVX", "XOM", "COP", "SLB", "OXY",
+    "TGT", "COST", "WMT", "CVX", "XOM", "COP", "SLB", "OXY",
     
     # Consumer Staples & Other
-    "KO", "PEP", "WMT", "PG", "JNJ", "KMB", "CL", "GIS", "K", "CPB",
+    "KO", "PEP", "PG", "KMB", "CL", "GIS", "K", "CPB",
     "MO", "PM", "KHC", "MDLZ", "HSY", "STZ", "TAP", "CAG", "SJM", "HRL",
     
     # Additional top companies
-    "V", "MA", "PYPL", "DIS", "VZ", "T", "CMCSA", "NFLX", "CRM", "NOW"
+    "V", "MA", "PYPL", "DIS", "VZ", "T", "CMCSA", "NOW"
 ]
 
-# Remove duplicates and sort
-SP_100_TICKERS = sorted(list(set(SP_100_TICKERS)))
+# Each symbol is listed once above, so only the ordering is needed here
+SP_100_TICKERS = sorted(SP_100_TICKERS)
 
 # Complete S&P 500 ticker list (current as of 2024)
 SP_500_TICKERS = [
@@ -231,21 +226,21 @@ POPULAR_STOCKS = [
     "TSLA", "RBLX", "SNAP", "UBER", "LYFT", "DOCU", "ZM", "PTON", "NKLA", "WKHS", "RIDE"
 ]
 
+# Flattened, deduplicated symbol groups, built once at import
+INDEX_SYMBOLS: Tuple[str, ...] = tuple(sorted({symbol for index_list in MAJOR_INDEXES.values() for symbol in index_list}))
+SECTOR_ETF_SYMBOLS: Tuple[str, ...] = tuple(sorted({symbol for sector_list in SECTOR_ETFS.values() for symbol in sector_list}))
+
 # Flatten all symbols for comprehensive coverage
-ALL_SYMBOLS = SP_500_TICKERS.copy()
-for index_list in MAJOR_INDEXES.values():
-    ALL_SYMBOLS.extend(index_list)
-for sector_list in SECTOR_ETFS.values():
-    ALL_SYMBOLS.extend(sector_list)
-ALL_SYMBOLS.extend(INTERNATIONAL_ETFS)
-ALL_SYMBOLS.extend(COMMODITY_ETFS)
-ALL_SYMBOLS.extend(BOND_ETFS)
-ALL_SYMBOLS.extend(POPULAR_STOCKS)
-ALL_SYMBOLS.extend(NASDAQ_100_TICKERS)
-ALL_SYMBOLS.extend(RUSSELL_2000_TICKERS)
-
-# Remove duplicates and sort
-ALL_SYMBOLS = sorted(list(set(ALL_SYMBOLS)))
+ALL_SYMBOLS = sorted({
+    *SP_500_TICKERS, *INDEX_SYMBOLS, *SECTOR_ETF_SYMBOLS, *INTERNATIONAL_ETFS, *COMMODITY_ETFS,
+    *BOND_ETFS, *POPULAR_STOCKS, *NASDAQ_100_TICKERS, *RUSSELL_2000_TICKERS
+})
+
+# Immutable symbol groups served by the getters below; built once at import so
+# callers share them without copying and cannot mutate them for each other
+SP_100_SYMBOLS: Tuple[str, ...] = tuple(SP_100_TICKERS)
+SP_500_SYMBOLS: Tuple[str, ...] = tuple(SP_500_TICKERS)
+ALL_TARGET_SYMBOLS: Tuple[str, ...] = tuple(ALL_SYMBOLS)
 
 # Data validation settings
 VALIDATION_RULES = {
@@ -258,19 +253,20 @@ VALIDATION_RULES = {
 }
 
 
+@lru_cache()
 def get_modeling_config() -> ModelingConfig:
-    """Get the modeling configuration instance."""
+    """Get the cached modeling configuration instance, parsed from the environment once."""
     return ModelingConfig()
 
 
-def get_all_target_symbols() -> List[str]:
+def get_all_target_symbols() -> Tuple[str, ...]:
     """Get all symbols we want to track."""
-    return ALL_SYMBOLS.copy()
+    return ALL_TARGET_SYMBOLS
 
 
-def get_sp100_symbols() -> List[str]:
+def get_sp100_symbols() -> Tuple[str, ...]:
     """Get S&P 100 symbols."""
-    return SP_100_TICKERS.copy()
+    return SP_100_SYMBOLS
 
 
 def get_sp500_symbols() -> List[str]:
@@ -308,22 +304,17 @@ def get_russell_2000_symbols() -> List[str]:
     return RUSSELL_2000_TICKERS.copy()
 
 
-def get_comprehensive_symbols() -> List[str]:
+def get_comprehensive_symbols() -> Tuple[str, ...]:
     """Get all symbols for the most comprehensive dataset."""
-    return ALL_SYMBOLS.copy()
+    return ALL_TARGET_SYMBOLS
 
 
 def get_new_symbols_to_ingest(already_ingested: List[str]) -> List[str]:
     """Get symbols that haven't been ingested yet."""
-    all_symbols = set(ALL_SYMBOLS)
     already_ingested_set = set(already_ingested)
-    new_symbols = all_symbols - already_ingested_set
-    return sorted(list(new_symbols))
+    return [symbol for symbol in ALL_TARGET_SYMBOLS if symbol not in already_ingested_set]
 
 
-def get_index_symbols() -> List[str]:
+def get_index_symbols() -> Tuple[str, ...]:
     """Get major index symbols."""
-    symbols = []
-    for index_list in MAJOR_INDEXES.values():
-        symbols.extend(index_list)
-    return sorted(list(set(symbols))) 
\ No newline at end of file
+    return INDEX_SYMBOLS 
\ No newline at end of file
@@ -4,13 +4,94 @@ Technical Indicators Feature Engineering
 Generates technical analysis indicators for price prediction modeling.
 """
 
+import asyncio
 import logging
 import pandas as pd
 import numpy as np
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+_SMA_PERIODS = [5, 10, 20, 50, 200]
+_EMA_PERIODS = [12, 26, 50]
+_MACD_FAST, _MACD_SLOW = 12, 26
+_BOLLINGER_PERIOD = 20
+
+
+def _obv(close: np.ndarray, volume: np.ndarray) -> np.ndarray:
+    """On-Balance Volume over float64 arrays: cumulative volume signed by the close's direction."""
+    obv = np.zeros(close.shape[0])
+    if close.shape[0] > 1:
+        # Unchanged (or missing) closes contribute nothing, matching a flat bar
+        direction = np.sign(np.nan_to_num(np.diff(close)))
+        signed = np.where(direction != 0, direction * volume[1:], 0.0)
+        np.cumsum(signed, out=obv[1:])
+    return obv
+
+
+class _MovingAverages:
+    """
+    Close-price SMAs, EMAs and rolling standard deviations computed once per
+    period for a single generate_features call.
+
+    MACD reuses the EMAs and Bollinger Bands the SMA that the SMA/EMA indicators
+    already produced, instead of making another pass over the close series.
+    ``precomputed`` seeds the memo, e.g. with one ticker's slice of a batch.
+    """
+
+    def __init__(self, close: pd.Series, precomputed: Optional[Dict[Tuple[str, int], pd.Series]] = None):
+        self._close = close
+        self._cache: Dict[Tuple[str, int], pd.Series] = dict(precomputed or {})
+
+    def sma(self, period: int) -> pd.Series:
+        key = ("sma", period)
+        if key not in self._cache:
+            self._cache[key] = self._close.rolling(window=period).mean()
+        return self._cache[key]
+
+    def ema(self, period: int) -> pd.Series:
+        key = ("ema", period)
+        if key not in self._cache:
+            self._cache[key] = self._close.ewm(span=period).mean()
+        return self._cache[key]
+
+    def std(self, period: int) -> pd.Series:
+        key = ("std", period)
+        if key not in self._cache:
+            self._cache[key] = self._close.rolling(window=period).std()
+        return self._cache[key]
+
+
+class _BatchedMovingAverages:
+    """
+    The moving averages every ticker needs, computed for many tickers at once.
+
+    ``closes`` has one column per ticker aligned by observation number, not by
+    date: row i is each ticker's i-th close and shorter histories are padded
+    with NaN at the end. Each rolling/EWM call then covers all tickers in one
+    pandas call. All of these windows look only backwards, so the padding never
+    reaches a ticker's own rows and each slice equals the per-ticker result.
+    """
+
+    _WINDOWS = (
+        *(("sma", period) for period in sorted({*_SMA_PERIODS, _BOLLINGER_PERIOD})),
+        *(("ema", period) for period in sorted({*_EMA_PERIODS, _MACD_FAST, _MACD_SLOW})),
+        ("std", _BOLLINGER_PERIOD),
+    )
+
+    def __init__(self, closes: pd.DataFrame):
+        averages = _MovingAverages(closes)
+        self._frames = {(kind, period): getattr(averages, kind)(period) for kind, period in self._WINDOWS}
+
+    def for_ticker(self, ticker: str, close: pd.Series) -> _MovingAverages:
+        """A ticker's memo, seeded with its slice of every batched window."""
+        rows = len(close)
+        return _MovingAverages(close, {
+            key: pd.Series(frame[ticker].to_numpy()[:rows], index=close.index, name=close.name)
+            for key, frame in self._frames.items()
+        })
+
+
 class TechnicalIndicatorsGenerator:
     """Generates technical indicators for stock price data."""
     
@@ -37,54 +118,152 @@ class TechnicalIndicatorsGenerator:
         try:
             logger.info("Generating technical indicator features")
             
-            features = {}
-            
-            # Calculate all technical indicators
-            for indicator_name, calculator in self.indicators.items():
-                try:
-                    features[indicator_name] = calculator(price_data)
-                    logger.debug(f"Successfully calculated {indicator_name}")
-                except Exception as e:
-                    logger.warning(f"Failed to calculate {indicator_name}: {e}")
-                    features[indicator_name] = None
-            
-            return features
+            numeric_data = self._to_numeric_frame(price_data)
+            return self._calculate_indicators(numeric_data, _MovingAverages(numeric_data['close']))
             
         except Exception as e:
             logger.error(f"Error generating technical indicators: {e}")
             return {}
-    
-    def _calculate_sma(self, data: pd.DataFrame, periods: List[int] = [5, 10, 20, 50, 200]) -> Dict[str, pd.Series]:
+
+    def generate_features_batched(self, price_data: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate technical indicator features for several tickers at once.
+
+        The close-price SMAs, EMAs and rolling deviations of all tickers are
+        computed together over one frame with a column per ticker, so each
+        window costs one pandas call rather than one per ticker. The indicators
+        themselves are then assembled per ticker from those slices, giving
+        exactly what ``generate_features`` returns for each frame.
+
+        Args:
+            price_data: Price DataFrames keyed by ticker
+
+        Returns:
+            Feature dictionaries (as from ``generate_features``) keyed by ticker
+        """
+        if not price_data:
+            return {}
+        try:
+            logger.info(f"Generating technical indicator features for {len(price_data)} tickers")
+
+            numeric_data = {ticker: self._to_numeric_frame(frame) for ticker, frame in price_data.items()}
+            batched = _BatchedMovingAverages(pd.concat(
+                {ticker: frame['close'].reset_index(drop=True) for ticker, frame in numeric_data.items()}, axis=1
+            ))
+            return {
+                ticker: self._calculate_indicators(frame, batched.for_ticker(ticker, frame['close']))
+                for ticker, frame in numeric_data.items()
+            }
+
+        except Exception as e:
+            logger.error(f"Error generating batched technical indicators: {e}")
+            return {ticker: {} for ticker in price_data}
+
+    def _calculate_indicators(self, numeric_data: pd.DataFrame, averages: _MovingAverages) -> Dict[str, Any]:
+        """Runs every indicator calculator over one ticker's numeric prices."""
+        features = {}
+        for indicator_name, calculator in self.indicators.items():
+            try:
+                features[indicator_name] = calculator(numeric_data, averages)
+                logger.debug(f"Successfully calculated {indicator_name}")
+            except Exception as e:
+                logger.warning(f"Failed to calculate {indicator_name}: {e}")
+                features[indicator_name] = None
+        return features
+
+    async def generate_features_async(self, price_data: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Generate one ticker's technical indicator features off the event loop.
+
+        The frame runs in a worker thread: pandas releases the GIL in its
+        rolling/EWM kernels, and nothing is copied or pickled. Price-scaled
+        indicators come back as float32, volume-scaled ones as float64.
+        """
+        return await asyncio.to_thread(lambda: _downcast_features(self.generate_features(price_data)))
+
+    async def generate_features_batched_async(self, price_data: Dict[str, pd.DataFrame]) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate several tickers' features with ``generate_features_batched`` in a
+        worker thread, with the same dtypes as ``generate_features_async``.
+        """
+        return await asyncio.to_thread(lambda: {
+            ticker: _downcast_features(features)
+            for ticker, features in self.generate_features_batched(price_data).items()
+        })
+
+    @staticmethod
+    def _to_numeric_frame(price_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Convert the price columns to float64 once, up front.
+
+        Stored prices are Decimal objects, so without this every rolling/ewm call
+        would run over an object column in Python instead of a contiguous array.
+        """
+        numeric_columns = [c for c in ("open", "high", "low", "close", "volume") if c in price_data.columns]
+        return price_data.assign(**{
+            column: pd.to_numeric(price_data[column], errors="coerce").astype("float64")
+            for column in numeric_columns
+        })
+
+    def _calculate_sma(
+        self,
+        data: pd.DataFrame,
+        averages: Optional[_MovingAverages] = None,
+        periods: List[int] = _SMA_PERIODS
+    ) -> Dict[str, pd.Series]:
         """Calculate Simple Moving Averages."""
+        averages = averages or _MovingAverages(data['close'])
         sma_features = {}
         for period in periods:
             if len(data) >= period:
-                sma_features[f"sma_{period}"] = data['close'].rolling(window=period).mean()
+                sma_features[f"sma_{period}"] = averages.sma(period)
         return sma_features
     
-    def _calculate_ema(self, data: pd.DataFrame, periods: List[int] = [12, 26, 50]) -> Dict[str, pd.Series]:
+    def _calculate_ema(
+        self,
+        data: pd.DataFrame,
+        averages: Optional[_MovingAverages] = None,
+        periods: List[int] = _EMA_PERIODS
+    ) -> Dict[str, pd.Series]:
         """Calculate Exponential Moving Averages."""
+        averages = averages or _MovingAverages(data['close'])
         ema_features = {}
         for period in periods:
             if len(data) >= period:
-                ema_features[f"ema_{period}"] = data['close'].ewm(span=period).mean()
+                ema_features[f"ema_{period}"] = averages.ema(period)
         return ema_features
     
-    def _calculate_rsi(self, data: pd.DataFrame, period: int = 14) -> Dict[str, pd.Series]:
+    def _calculate_rsi(
+        self,
+        data: pd.DataFrame,
+        averages: Optional[_MovingAverages] = None,
+        period: int = 14
+    ) -> Dict[str, pd.Series]:
         """Calculate Relative Strength Index."""
         if len(data) < period + 1:
             return {"rsi": pd.Series(dtype=float)}
         
-        delta = data['close'].diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+        # Gains and losses are averaged in one rolling pass over a two-column frame;
+        # a missing delta counts as neither
+        delta = data['close'].diff().to_numpy()
+        gain_loss = pd.DataFrame({
+            "gain": np.where(delta > 0, delta, 0.0),
+            "loss": np.where(delta < 0, -delta, 0.0)
+        }, index=data.index).rolling(window=period).mean()
         
-        rs = gain / loss
+        rs = gain_loss["gain"] / gain_loss["loss"]
         rsi = 100 - (100 / (1 + rs))
         
         return {"rsi": rsi}
     
-    def _calculate_macd(self, data: pd.DataFrame, fast: int = 12, slow: int = 26, signal: int = 9) -> Dict[str, pd.Series]:
+    def _calculate_macd(
+        self,
+        data: pd.DataFrame,
+        averages: Optional[_MovingAverages] = None,
+        fast: int = _MACD_FAST,
+        slow: int = _MACD_SLOW,
+        signal: int = 9
+    ) -> Dict[str, pd.Series]:
         """Calculate MACD indicator."""
         if len(data) < slow:
             return {
@@ -93,8 +272,9 @@ class TechnicalIndicatorsGenerator:
                 "macd_histogram": pd.Series(dtype=float)
             }
         
-        ema_fast = data['close'].ewm(span=fast).mean()
-        ema_slow = data['close'].ewm(span=slow).mean()
+        averages = averages or _MovingAverages(data['close'])
+        ema_fast = averages.ema(fast)
+        ema_slow = averages.ema(slow)
         
         macd_line = ema_fast - ema_slow
         macd_signal = macd_line.ewm(span=signal).mean()
@@ -106,7 +286,13 @@ class TechnicalIndicatorsGenerator:
             "macd_histogram": macd_histogram
         }
     
-    def _calculate_bollinger_bands(self, data: pd.DataFrame, period: int = 20, std_dev: int = 2) -> Dict[str, pd.Series]:
+    def _calculate_bollinger_bands(
+        self,
+        data: pd.DataFrame,
+        averages: Optional[_MovingAverages] = None,
+        period: int = _BOLLINGER_PERIOD,
+        std_dev: int = 2
+    ) -> Dict[str, pd.Series]:
         """Calculate Bollinger Bands."""
         if len(data) < period:
             return {
@@ -116,8 +302,9 @@ class TechnicalIndicatorsGenerator:
                 "bb_width": pd.Series(dtype=float)
             }
         
-        sma = data['close'].rolling(window=period).mean()
-        std = data['close'].rolling(window=period).std()
+        averages = averages or _MovingAverages(data['close'])
+        sma = averages.sma(period)
+        std = averages.std(period)
         
         bb_upper = sma + (std * std_dev)
         bb_lower = sma - (std * std_dev)
@@ -130,7 +317,11 @@ class TechnicalIndicatorsGenerator:
             "bb_width": bb_width
         }
     
-    def _calculate_volume_indicators(self, data: pd.DataFrame) -> Dict[str, pd.Series]:
+    def _calculate_volume_indicators(
+        self,
+        data: pd.DataFrame,
+        averages: Optional[_MovingAverages] = None
+    ) -> Dict[str, pd.Series]:
         """Calculate volume-based indicators."""
         volume_features = {}
         
@@ -140,22 +331,44 @@ class TechnicalIndicatorsGenerator:
         
         # Volume Rate of Change
         if len(data) >= 10:
-            volume_features["volume_roc"] = data['volume'].pct_change(periods=10)
+            # Same as pct_change(periods=10) with its default pad fill, without
+            # the per-call pandas overhead
+            volume = data['volume'].ffill().to_numpy(dtype=np.float64)
+            roc = np.full_like(volume, np.nan)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                roc[10:] = volume[10:] / volume[:-10] - 1.0
+            volume_features["volume_roc"] = pd.Series(roc, index=data.index)
         
         # On-Balance Volume (OBV)
-        obv = [0]
-        for i in range(1, len(data)):
-            if data['close'].iloc[i] > data['close'].iloc[i-1]:
-                obv.append(obv[-1] + data['volume'].iloc[i])
-            elif data['close'].iloc[i] < data['close'].iloc[i-1]:
-                obv.append(obv[-1] - data['volume'].iloc[i])
-            else:
-                obv.append(obv[-1])
-        
+        obv = _obv(
+            data['close'].to_numpy(dtype=np.float64),
+            data['volume'].to_numpy(dtype=np.float64)
+        )
         volume_features["obv"] = pd.Series(obv, index=data.index)
         
         return volume_features
 
 
 # Service instance
-technical_indicators_generator = TechnicalIndicatorsGenerator() 
\ No newline at end of file
+technical_indicators_generator = TechnicalIndicatorsGenerator()
+
+
+# Volume-scaled indicators; OBV is a running sum of volumes and can exceed
+# float32's 24-bit mantissa, so these keep their float64 precision
+_FLOAT64_FEATURES = frozenset({"obv", "volume_sma_20"})
+
+
+def _downcast_features(features: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Returns price-scaled indicators computed in float64 as float32, matching how
+    prices are stored. Volume-scaled indicators stay float64.
+    """
+    return {
+        indicator_type: {
+            name: series if name in _FLOAT64_FEATURES else series.astype(np.float32)
+            for name, series in values.items()
+        }
+        if values else values
+        for indicator_type, values in features.items()
+    }
+
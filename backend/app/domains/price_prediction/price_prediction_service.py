@@ -1,6 +1,9 @@
+import copy
 import logging
+import time
+from collections import OrderedDict
 import pandas as pd
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from app.domains.data_collection.services import get_data_collection_service
 from app.domains.data_collection.storage.s3_storage_service import get_s3_storage_service
@@ -10,6 +13,11 @@ from app.shared.singleton import get_singleton
 
 logger = logging.getLogger(__name__)
 
+# Daily prices move once a day, so a fitted forecast stays valid well beyond this
+_PREDICTION_CACHE_TTL_SECONDS = 60
+# Forecasts cached at once; the oldest are dropped first
+_PREDICTION_CACHE_MAX_ENTRIES = 256
+
 class PricePredictionService:
     """Service for training models and generating stock price predictions."""
 
@@ -17,6 +25,8 @@ class PricePredictionService:
         self.data_collection_service = get_data_collection_service()
         self.s3_storage = get_s3_storage_service()
         self.arima_predictor = ArimaPredictor()
+        # Insertion order is expiry order, since every entry lives for the same TTL
+        self._prediction_cache: "OrderedDict[Tuple[str, int, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
 
     async def prepare_training_data(self, ticker: str) -> Optional[pd.DataFrame]:
         """Prepares training data for a ticker by fetching and processing it."""
@@ -47,7 +57,33 @@ class PricePredictionService:
         return error_response(f"Unsupported model type: {model_type}")
     
     async def train_and_predict(self, ticker: str, days_ahead: int, model_type: str = "arima") -> Dict[str, Any]:
-        """Orchestrates the full train-and-predict pipeline."""
+        """
+        Orchestrates the full train-and-predict pipeline.
+        
+        Successful results are cached for a short TTL so repeated requests for the
+        same forecast skip the price refresh and the model fit. Each caller gets
+        its own copy, so changing a result can't alter what others receive.
+        """
+        cache_key = (ticker, days_ahead, model_type.lower())
+        self._evict_expired_predictions()
+        cached = self._prediction_cache.get(cache_key)
+        if cached is not None:
+            return copy.deepcopy(cached[1])
+
+        result = await self._train_and_predict(ticker, days_ahead, model_type)
+        if result.get('success'):
+            self._prediction_cache.pop(cache_key, None)
+            self._prediction_cache[cache_key] = (time.monotonic(), copy.deepcopy(result))
+            while len(self._prediction_cache) > _PREDICTION_CACHE_MAX_ENTRIES:
+                self._prediction_cache.popitem(last=False)
+        return result
+
+    def _evict_expired_predictions(self) -> None:
+        expires_before = time.monotonic() - _PREDICTION_CACHE_TTL_SECONDS
+        while self._prediction_cache and next(iter(self._prediction_cache.values()))[0] <= expires_before:
+            self._prediction_cache.popitem(last=False)
+
+    async def _train_and_predict(self, ticker: str, days_ahead: int, model_type: str) -> Dict[str, Any]:
         training_data = await self.prepare_training_data(ticker)
         if training_data is None:
             return error_response(f'Failed to prepare training data for {ticker}')
@@ -2,27 +2,28 @@
 """
 Data Ingestion Management Script
 
-Command-line script for managing historical data ingestion for the modeling domain.
-Supports ingesting S&P 100, custom ticker lists, and individual tickers.
+Command-line script for inspecting historical price data for the modeling domain.
+Ingestion itself runs through ``python -m app.domains.data_collection.cli``; the
+ingestion subcommands kept here only point there.
+
+Run from the backend directory as a module so the ``app`` package resolves
+without any path manipulation:
+
+    python -m app.domains.price_prediction.scripts.ingest_data coverage --tickers AAPL MSFT
 """
 
 import asyncio
 import argparse
 import logging
 import sys
-from datetime import date, datetime, timedelta
 from typing import List, Optional
-import os
-
-# Add parent directories to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', '..', '..', '..'))
 
-from app.domains.modeling.data_ingestion.price_data_ingestion import price_data_ingestion_service
-from app.domains.modeling.config.modeling_config import get_sp100_symbols, get_all_target_symbols, get_index_symbols
+from app.domains.price_prediction.config.modeling_config import get_sp100_symbols, get_all_target_symbols, get_index_symbols
 from app.domains.data_collection.config.ticker_config import (
     get_dow_tickers, get_sp500_tickers, get_nasdaq_tickers, get_russell2000_tickers, get_top_etfs
 )
-from app.db.session import AsyncSessionLocal
+from app.domains.data_collection.storage.s3_storage_service import get_s3_storage_service
+from app.shared.validation_utils import normalize_tickers
 
 # Configure logging
 logging.basicConfig(
@@ -32,167 +33,46 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def ingest_single_ticker(
-    ticker: str,
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-    source: str = "tiingo"
-):
-    """Ingest data for a single ticker."""
-    async with AsyncSessionLocal() as db:
-        logger.info(f"Starting ingestion for {ticker}")
-        
-        result = await price_data_ingestion_service.ingest_historical_prices(
-            ticker=ticker.upper(),
-            start_date=start_date,
-            end_date=end_date,
-            source=source,
-            db=db
-        )
-        
-        if "error" in result:
-            logger.error(f"Failed to ingest {ticker}: {result['error']}")
-            return False
-        else:
-            logger.info(f"Successfully ingested {ticker}: {result.get('records_inserted', 0)} records")
-            return True
+_MOVED_COMMANDS = ('single', 'sp100', 'all', 'custom', 'status')
 
 
-async def ingest_sp100(
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-    max_concurrent: int = 5
-):
-    """Ingest data for S&P 100 companies."""
-    async with AsyncSessionLocal() as db:
-        logger.info("Starting S&P 100 bulk ingestion")
-        
-        result = await price_data_ingestion_service.bulk_ingest_sp100(
-            start_date=start_date,
-            end_date=end_date,
-            max_concurrent=max_concurrent,
-            db=db
-        )
-        
-        logger.info(f"S&P 100 ingestion completed: {result['successful']}/{result['total_tickers']} successful")
-        
-        if result['errors']:
-            logger.warning(f"Errors encountered: {len(result['errors'])}")
-            for error in result['errors'][:10]:  # Show first 10 errors
-                logger.warning(f"  {error}")
-        
-        return result
+def _ingestion_moved(command: str) -> None:
+    """Exits with a pointer to the command that replaced a Postgres-backed one."""
+    sys.exit(
+        f"'{command}' is no longer available: the Postgres price ingestion service it ran on "
+        f"has been removed. Prices are now ingested into S3 by the data collection CLI:\n"
+        f"  python -m app.domains.data_collection.cli fetch-daily-prices TICKER\n"
+        f"  python -m app.domains.data_collection.cli fetch-prices-batch --group GROUP"
+    )
 
 
-async def ingest_all_targets(
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-    max_concurrent: int = 5
-):
-    """Ingest data for all target symbols."""
-    async with AsyncSessionLocal() as db:
-        logger.info("Starting bulk ingestion for all target symbols")
-        
-        result = await price_data_ingestion_service.bulk_ingest_all_targets(
-            start_date=start_date,
-            end_date=end_date,
-            max_concurrent=max_concurrent,
-            db=db
-        )
-        
-        logger.info(f"Bulk ingestion completed: {result['successful']}/{result['total_tickers']} successful")
-        logger.info(f"Total records ingested: {result['total_records']}")
-        
-        if result['errors']:
-            logger.warning(f"Errors encountered: {len(result['errors'])}")
-            for error in result['errors'][:10]:  # Show first 10 errors
-                logger.warning(f"  {error}")
-        
-        return result
+async def show_data_coverage(tickers: Optional[List[str]] = None):
+    """Show stored price coverage for tickers."""
+    logger.info("Checking data coverage...")
 
+    tickers = normalize_tickers(tickers) if tickers else get_all_target_symbols()
+    coverage = await get_s3_storage_service().get_price_coverage(tickers)
 
-async def ingest_custom_tickers(
-    tickers: List[str],
-    start_date: Optional[str] = None,
-    end_date: Optional[str] = None,
-    max_concurrent: int = 5
-):
-    """Ingest data for custom list of tickers."""
-    async with AsyncSessionLocal() as db:
-        logger.info(f"Starting custom bulk ingestion for {len(tickers)} tickers")
-        
-        result = await price_data_ingestion_service.bulk_ingest_tickers(
-            tickers=[ticker.upper() for ticker in tickers],
-            start_date=start_date,
-            end_date=end_date,
-            max_concurrent=max_concurrent,
-            db=db
-        )
-        
-        logger.info(f"Custom ingestion completed: {result['successful']}/{result['total_tickers']} successful")
-        
-        if result['errors']:
-            logger.warning(f"Errors encountered: {len(result['errors'])}")
-            for error in result['errors'][:10]:  # Show first 10 errors
-                logger.warning(f"  {error}")
-        
-        return result
+    print("\nData Coverage Summary:")
+    print("-" * 80)
+    print(f"{'Ticker':<10} {'Records':<10} {'Earliest':<12} {'Latest':<12}")
+    print("-" * 80)
 
+    for ticker, info in coverage.items():
+        records = info['record_count']
+        earliest = info['earliest_date'].isoformat() if info['earliest_date'] else 'N/A'
+        latest = info['latest_date'].isoformat() if info['latest_date'] else 'N/A'
 
-async def show_data_coverage(tickers: Optional[List[str]] = None):
-    """Show data coverage for tickers."""
-    async with AsyncSessionLocal() as db:
-        logger.info("Checking data coverage...")
-        
-        coverage = await price_data_ingestion_service.get_data_coverage(
-            tickers=tickers,
-            db=db
-        )
-        
-        print("\nData Coverage Summary:")
-        print("-" * 80)
-        print(f"{'Ticker':<10} {'Records':<10} {'Earliest':<12} {'Latest':<12} {'Source':<10}")
-        print("-" * 80)
-        
-        for ticker, info in coverage.items():
-            records = info['record_count']
-            earliest = info['earliest_date'] or 'N/A'
-            latest = info['latest_date'] or 'N/A'
-            source = info['data_source'] or 'N/A'
-            
-            print(f"{ticker:<10} {records:<10} {earliest:<12} {latest:<12} {source:<10}")
-        
-        # Summary statistics
-        total_records = sum(info['record_count'] for info in coverage.values())
-        tickers_with_data = sum(1 for info in coverage.values() if info['record_count'] > 0)
-        
-        print("-" * 80)
-        print(f"Total tickers: {len(coverage)}")
-        print(f"Tickers with data: {tickers_with_data}")
-        print(f"Total records: {total_records:,}")
+        print(f"{ticker:<10} {records:<10} {earliest:<12} {latest:<12}")
 
+    # Summary statistics
+    total_records = sum(info['record_count'] for info in coverage.values())
+    tickers_with_data = sum(1 for info in coverage.values() if info['record_count'] > 0)
 
-async def show_ingestion_status():
-    """Show recent ingestion activity."""
-    async with AsyncSessionLocal() as db:
-        logger.info("Checking ingestion status...")
-        
-        logs = await price_data_ingestion_service.get_ingestion_status(db=db)
-        
-        print("\nRecent Ingestion Activity:")
-        print("-" * 120)
-        print(f"{'Ticker':<10} {'Status':<12} {'Records':<10} {'Started':<20} {'Completed':<20} {'Error':<30}")
-        print("-" * 120)
-        
-        for log in logs[:20]:  # Show last 20 entries
-            ticker = log['ticker'] or 'N/A'
-            status = log['status']
-            records = log['records_inserted'] or 0
-            started = log['started_at'][:19] if log['started_at'] else 'N/A'
-            completed = log['completed_at'][:19] if log['completed_at'] else 'N/A'
-            error = (log['error_message'] or '')[:28]
-            
-            print(f"{ticker:<10} {status:<12} {records:<10} {started:<20} {completed:<20} {error:<30}")
+    print("-" * 80)
+    print(f"Total tickers: {len(coverage)}")
+    print(f"Tickers with data: {tickers_with_data}")
+    print(f"Total records: {total_records:,}")
 
 
 def main():
@@ -200,34 +80,10 @@ def main():
     parser = argparse.ArgumentParser(description="AI Capital Data Ingestion Management")
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    # Single ticker ingestion
-    single_parser = subparsers.add_parser('single', help='Ingest data for a single ticker')
-    single_parser.add_argument('ticker', help='Stock ticker symbol')
-    single_parser.add_argument('--start-date', help='Start date (YYYY-MM-DD)')
-    single_parser.add_argument('--end-date', help='End date (YYYY-MM-DD)')
-    single_parser.add_argument('--source', default='tiingo', help='Data source (default: tiingo)')
-    
-    # S&P 100 ingestion
-    sp100_parser = subparsers.add_parser('sp100', help='Ingest data for S&P 100 companies')
-    sp100_parser.add_argument('--start-date', help='Start date (YYYY-MM-DD)')
-    sp100_parser.add_argument('--end-date', help='End date (YYYY-MM-DD)')
-    sp100_parser.add_argument('--max-concurrent', type=int, default=5, help='Max concurrent requests')
-    
-    # All targets ingestion
-    all_parser = subparsers.add_parser('all', help='Ingest data for all target symbols')
-    all_parser.add_argument('--start-date', help='Start date (YYYY-MM-DD)')
-    all_parser.add_argument('--end-date', help='End date (YYYY-MM-DD)')
-    all_parser.add_argument('--max-concurrent', type=int, default=5, help='Max concurrent requests')
-    
-    # Custom tickers ingestion
-    custom_parser = subparsers.add_parser('custom', help='Ingest data for custom ticker list')
-    custom_parser.add_argument('tickers', nargs='+', help='List of ticker symbols')
-    custom_parser.add_argument('--start-date', help='Start date (YYYY-MM-DD)')
-    custom_parser.add_argument('--end-date', help='End date (YYYY-MM-DD)')
-    custom_parser.add_argument('--max-concurrent', type=int, default=5, help='Max concurrent requests')
-    
-    # Status and monitoring commands
-    subparsers.add_parser('status', help='Show recent ingestion activity')
+    # Postgres-backed commands that moved to the data collection CLI; they take
+    # no options and only print the redirect
+    for command in _MOVED_COMMANDS:
+        subparsers.add_parser(command, help='Moved: use the data collection CLI')
     
     coverage_parser = subparsers.add_parser('coverage', help='Show data coverage')
     coverage_parser.add_argument('--tickers', nargs='*', help='Specific tickers to check')
@@ -235,45 +91,19 @@ def main():
     # Utility commands
     symbols_parser = subparsers.add_parser('symbols', help='List available symbol groups')
     
-    args = parser.parse_args()
+    # Old invocations of a moved command still carry its arguments; they are
+    # ignored so the redirect is shown instead of a usage error
+    args, extra = parser.parse_known_args()
+    if extra and args.command not in _MOVED_COMMANDS:
+        parser.error(f"unrecognized arguments: {' '.join(extra)}")
     
     if not args.command:
         parser.print_help()
         return
     
     # Execute the appropriate command
-    if args.command == 'single':
-        asyncio.run(ingest_single_ticker(
-            ticker=args.ticker,
-            start_date=args.start_date,
-            end_date=args.end_date,
-            source=args.source
-        ))
-    
-    elif args.command == 'sp100':
-        asyncio.run(ingest_sp100(
-            start_date=args.start_date,
-            end_date=args.end_date,
-            max_concurrent=args.max_concurrent
-        ))
-    
-    elif args.command == 'all':
-        asyncio.run(ingest_all_targets(
-            start_date=args.start_date,
-            end_date=args.end_date,
-            max_concurrent=args.max_concurrent
-        ))
-    
-    elif args.command == 'custom':
-        asyncio.run(ingest_custom_tickers(
-            tickers=args.tickers,
-            start_date=args.start_date,
-            end_date=args.end_date,
-            max_concurrent=args.max_concurrent
-        ))
-    
-    elif args.command == 'status':
-        asyncio.run(show_ingestion_status())
+    if args.command in _MOVED_COMMANDS:
+        _ingestion_moved(args.command)
     
     elif args.command == 'coverage':
         asyncio.run(show_data_coverage(tickers=args.tickers))
@@ -1,15 +1,18 @@
+import logging
 import redis.asyncio as redis
 from typing import Optional
 
 from ..config import settings
 
+logger = logging.getLogger(__name__)
+
 redis_pool: Optional[redis.ConnectionPool] = None
 
 def init_redis_pool():
     """Initializes the Redis connection pool."""
     global redis_pool
     try:
-        print(f"Initializing Redis connection pool for {settings.redis_host}:{settings.redis_port}")
+        logger.info("Initializing Redis connection pool for %s:%s", settings.redis_host, settings.redis_port)
         redis_pool = redis.ConnectionPool(
             host=settings.redis_host,
             port=settings.redis_port,
@@ -20,15 +23,15 @@ def init_redis_pool():
         # Optional: Ping to check connection early
         # client = redis.Redis(connection_pool=redis_pool)
         # asyncio.run(client.ping()) # This won't work directly here, needs async context
-        print("Redis connection pool initialized.")
+        logger.info("Redis connection pool initialized.")
     except Exception as e:
-        print(f"Failed to initialize Redis connection pool: {e}")
+        logger.error("Failed to initialize Redis connection pool: %s", e)
         redis_pool = None # Ensure pool is None if init fails
 
 async def get_redis_client() -> Optional[redis.Redis]:
     """Gets a Redis client instance from the pool."""
     if redis_pool is None:
-        print("Redis pool not initialized. Cannot get client.")
+        logger.warning("Redis pool not initialized. Cannot get client.")
         return None
     # Using Redis.from_pool is recommended for async
     return redis.Redis.from_pool(redis_pool)
@@ -5,6 +5,7 @@ Replaces PostgreSQL storage for summary metadata with cost-effective DynamoDB.
 Handles section summaries, comprehensive reports, and processing status.
 """
 
+import asyncio
 import boto3
 import logging
 from datetime import datetime, timezone
@@ -91,6 +92,7 @@ class DynamoDBSummaryService:
     ) -> bool:
         """Save section summary metadata to DynamoDB."""
         try:
+            now = datetime.now(timezone.utc).isoformat()
             item = {
                 'PK': f'FILING#{accession_number}',
                 'SK': f'SUMMARY#{section_key}#{model_name}',
@@ -99,8 +101,8 @@ class DynamoDBSummaryService:
                 'section_key': section_key,
                 'model_name': model_name,
                 'processing_status': processing_status,
-                'created_at': datetime.now(timezone.utc).isoformat(),
-                'updated_at': datetime.now(timezone.utc).isoformat()
+                'created_at': now,
+                'updated_at': now
             }
             
             # Add optional fields
@@ -168,6 +170,7 @@ class DynamoDBSummaryService:
     ) -> bool:
         """Save comprehensive report metadata to DynamoDB."""
         try:
+            now = datetime.now(timezone.utc).isoformat()
             item = {
                 'PK': f'FILING#{accession_number}',
                 'SK': f'REPORT#{model_name}',
@@ -175,8 +178,8 @@ class DynamoDBSummaryService:
                 'accession_number': accession_number,
                 'model_name': model_name,
                 'processing_status': processing_status,
-                'created_at': datetime.now(timezone.utc).isoformat(),
-                'updated_at': datetime.now(timezone.utc).isoformat()
+                'created_at': now,
+                'updated_at': now
             }
             
             # Add optional fields
@@ -357,7 +360,6 @@ class DynamoDBMetadataService:
         Creates the DynamoDB table if it does not already exist.
         This method is idempotent.
         """
-        import asyncio
         loop = asyncio.get_event_loop()
         
         try:
@@ -409,7 +411,6 @@ class DynamoDBMetadataService:
         :return: A FilingMetadata object or None if not found.
         """
         try:
-            import asyncio
             loop = asyncio.get_event_loop()
             
             response = await loop.run_in_executor(
@@ -462,7 +463,6 @@ class DynamoDBMetadataService:
                 if isinstance(chunk['created_at'], datetime):
                     chunk['created_at'] = chunk['created_at'].isoformat()
 
-            import asyncio
             loop = asyncio.get_event_loop()
             await loop.run_in_executor(None, lambda: self.table.put_item(Item=item))
             logger.info(f"Successfully saved metadata for {metadata.accession_number}.")
@@ -4,10 +4,13 @@ HTML Parsing Service for SEC Filings
 This service is responsible for parsing the HTML content of SEC filings
 to extract sections based on their semantic structure.
 """
+import asyncio
 import logging
 from typing import Dict, Optional, List
 
+from ...data_collection.clients.sec_client import get_sec_client
 from ...data_collection.storage.s3_storage_service import S3StorageService, get_s3_storage_service
+from ..config.section_filter import get_hierarchical_section_filter
 from .sec_parser_service import SecParserService, get_sec_parser_service
 
 logger = logging.getLogger(__name__)
@@ -68,7 +71,6 @@ class DocumentParsingService:
         # For now, with simplified hierarchy, just include sections that contain key item patterns
         # or are likely children of key items (more sophisticated hierarchy matching can be added later)
         
-        from ..config.section_filter import get_hierarchical_section_filter
         filter_service = get_hierarchical_section_filter()
         
         # Include identified key item sections
@@ -130,9 +132,6 @@ class DocumentParsingService:
         """
         Downloads filing HTML directly from SEC Edgar.
         """
-        import asyncio
-        from ...data_collection.clients.sec_client import get_sec_client
-
         sec_client = get_sec_client()
         logger.info(f"Attempting to download filing {accession_number} for {ticker}")
 
@@ -22,6 +22,8 @@ except ImportError as e:
     SEC_PARSER_AVAILABLE = False
     SEC_PARSER_ERROR = str(e)
 
+from ..config.section_filter import get_hierarchical_section_filter
+
 logger = logging.getLogger(__name__)
 
 
@@ -231,8 +233,6 @@ class SecParserService:
         Returns:
             Dict mapping item_key to section_title
         """
-        from ..config.section_filter import get_hierarchical_section_filter
-        
         key_items = {}
         filter_service = get_hierarchical_section_filter()
         
@@ -18,6 +18,8 @@ from .summarization_chunking_service import SummarizationChunkingService, get_su
 from .llm_orchestration_service import LLMOrchestrationService, get_llm_orchestration_service
 from .embedding_service import EmbeddingService, get_embedding_service
 from ...data_collection.storage.s3_storage_service import S3StorageService, get_s3_storage_service
+from ...data_collection.clients.sec_client import get_sec_client
+from ....sec_utils import ticker_to_cik
 
 logger = logging.getLogger(__name__)
 
@@ -134,6 +136,8 @@ class SummarizationService:
             # Store summarization chunks (large chunks) with metadata for processing
             summarization_metadata_list = []
             embedding_metadata_list = []
+            # One timestamp for every chunk created in this pass
+            chunked_at = datetime.now(timezone.utc)
             
             # Process summarization chunks (used for the LLM summarization pipeline)
             for section_title, section_chunks in summarization_chunks.items():
@@ -154,7 +158,8 @@ class SummarizationService:
                         section=section_title,
                         chunk_index=chunk_index,
                         s3_path=s3_key,
-                        character_count=len(chunk_text)
+                        character_count=len(chunk_text),
+                        created_at=chunked_at
                     )
                     summarization_metadata_list.append(chunk_meta)
 
@@ -177,7 +182,8 @@ class SummarizationService:
                         section=section_title,
                         chunk_index=chunk_index,
                         s3_path=s3_key,
-                        character_count=len(chunk_text)
+                        character_count=len(chunk_text),
+                        created_at=chunked_at
                     )
                     embedding_metadata_list.append(chunk_meta)
 
@@ -244,8 +250,6 @@ class SummarizationService:
         """
         Fetches real SEC filing data for the requested ticker using the SEC client.
         """
-        from ...data_collection.clients.sec_client import get_sec_client
-        
         sec_client = get_sec_client()
 
         # Determine which form types to search for - prioritize 10-K
@@ -274,8 +278,8 @@ class SummarizationService:
             filing = filings[0]
             
             # Get CIK for the ticker
-            from ....sec_utils import ticker_to_cik
             cik = ticker_to_cik(ticker)
+            now = datetime.now(timezone.utc)
             
             return SECFiling(
                 id=1,  # Not used anymore
@@ -285,8 +289,8 @@ class SummarizationService:
                 form_type=filing["form_type"],
                 filing_date=datetime.strptime(filing["filing_date"], "%Y-%m-%d").replace(tzinfo=timezone.utc),
                 report_url=f"https://www.sec.gov/Archives/edgar/data/{cik}/{filing['accession_number'].replace('-', '')}/{filing['primary_doc']}",
-                created_at=datetime.now(timezone.utc),
-                updated_at=datetime.now(timezone.utc)
+                created_at=now,
+                updated_at=now
             )
             
         except Exception as e:
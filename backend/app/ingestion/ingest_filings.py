@@ -1,15 +1,19 @@
+"""
+SEC filings ingestion script.
+
+Run from the backend directory as a module so the ``app`` package resolves
+without any path manipulation:
+
+    python -m app.ingestion.ingest_filings
+"""
 import asyncio
 import logging
 from datetime import datetime
-import sys
 import os
 from typing import List, Dict, Any
 
 from dotenv import load_dotenv
 
-# Add the project root to the Python path
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-
 # Load environment variables from .env file
 load_dotenv()
 
@@ -28,10 +32,6 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 # Import ticker configuration instead of hardcoding
-import sys
-import os
-sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
-
 from app.domains.data_collection.config.ticker_config import get_dow_tickers
 
 # Use DOW tickers for SEC filings processing (can be changed to any group)
@@ -1,25 +1,31 @@
+import asyncio
+import hashlib
+import json
 import logging
 import os
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 from fastapi import APIRouter
+from fastapi.middleware.gzip import GZipMiddleware
 from dotenv import load_dotenv
 
+# Configure logging to show INFO level logs
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
 # Load environment variables from .env file in project root
 project_root = Path(__file__).resolve().parents[2]  # Go up to ai-capital/
 env_path = project_root / '.env'
 if env_path.exists():
     # Force override existing environment variables
     load_dotenv(dotenv_path=env_path, override=True)
-    print(f"Loaded .env from {env_path} with override=True")
+    logging.getLogger(__name__).info("Loaded .env from %s with override=True", env_path)
 else:
-    print(f"Warning: .env file not found at {env_path}")
-
-# Configure logging to show INFO level logs
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+    logging.getLogger(__name__).warning(".env file not found at %s", env_path)
 
 # Set specific loggers to INFO level
 logging.getLogger("app.domains.data_collection.tiingo_client").setLevel(logging.INFO)
@@ -32,6 +38,26 @@ from .domains.portfolio_manager.api.user_endpoints import router as user_router
 from .domains.portfolio_manager.api.portfolio_endpoints import router as portfolio_router
 from .domains.portfolio_manager.api.transaction_endpoints import router as transaction_router
 from .domains.portfolio_manager.api.position_endpoints import router as position_router
+from .domains.data_collection.api.ingestion_endpoints import router as ingestion_router
+from .domains.data_collection.clients.tiingo_client import close_tiingo_client, get_tiingo_client
+from .domains.data_collection.clients.fmp_client import close_fmp_client
+from .domains.data_collection.clients.alpha_vantage_client import close_alpha_vantage_client
+from .domains.data_collection.storage.s3_storage_service import get_s3_storage_service
+from .shared.response_models import HealthCheckResponse, StatusEnum
+from .shared.exceptions import register_exception_handlers
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open the process-wide storage clients before serving traffic
+    try:
+        await asyncio.to_thread(get_s3_storage_service().warm_up)
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"S3 storage warm-up skipped: {e}")
+    yield
+    # Upstream API sessions are shared across requests for the app's lifetime
+    await asyncio.gather(close_tiingo_client(), close_fmp_client(), close_alpha_vantage_client())
+
 
 app = FastAPI(
     title="AI Capital API",
@@ -45,12 +71,20 @@ app = FastAPI(
         {"name": "Summarization", "description": "Endpoints for summarizing SEC filings."},
         {"name": "Price Prediction", "description": "Endpoints for predicting stock prices."},
         {"name": "Portfolio Management", "description": "Endpoints for managing portfolios and trades."},
+        {"name": "Data Collection", "description": "Endpoints for ingesting market data."},
     ],
     openapi_url="/api/v1/openapi.json",
     docs_url="/api/v1/docs",
-    redoc_url="/api/v1/redoc"
+    redoc_url="/api/v1/redoc",
+    lifespan=lifespan
 )
 
+# Domain and unexpected errors are turned into JSON responses in one place
+register_exception_handlers(app)
+
+# Compress larger bodies (price history, prediction series); small responses skip the cost
+app.add_middleware(GZipMiddleware, minimum_size=8192, compresslevel=1)
+
 # Create the main API router
 api_router = APIRouter(prefix="/api/v1")
 
@@ -62,23 +96,57 @@ api_router.include_router(user_router, prefix="/portfolio/auth", tags=["Portfoli
 api_router.include_router(portfolio_router, prefix="/portfolio/portfolios", tags=["Portfolio Management"])
 api_router.include_router(transaction_router, prefix="/portfolio/transactions", tags=["Portfolio Management"])
 api_router.include_router(position_router, prefix="/portfolio/positions", tags=["Portfolio Management"])
+api_router.include_router(ingestion_router, prefix="/ingest", tags=["Data Collection"])
 
 
 app.include_router(api_router)
 
 
+# The root payload only changes on redeploy, so it is serialized once at import
+_ROOT_PAYLOAD = json.dumps({
+    "message": "Welcome to the AI Capital API. Visit /api/v1/docs for documentation.",
+    "endpoints": {
+        "summarization": "GET /api/v1/summarizer/summary/{ticker} - SEC filing summarization",
+        "query": "GET /api/v1/summarizer/query/{ticker}?q=... - Q&A on filings",
+        "price_prediction": "GET /api/v1/predict/price/{ticker} - Stock price prediction",
+        "price_history": "GET /api/v1/predict/history/{ticker} - Stored daily prices (NDJSON or Arrow)",
+        "portfolio": "POST /api/v1/portfolio/auth/register - User registration",
+    }
+}).encode("utf-8")
+_ROOT_ETAG = f'"{hashlib.sha256(_ROOT_PAYLOAD).hexdigest()[:16]}"'
+_ROOT_CACHE_HEADERS = {"ETag": _ROOT_ETAG, "Cache-Control": "public, max-age=3600"}
+
+
 # Example usage for the root endpoint
 @app.get("/", include_in_schema=False)
-async def root():
-    return {
-        "message": "Welcome to the AI Capital API. Visit /api/v1/docs for documentation.",
-        "endpoints": {
-            "summarization": "GET /api/v1/summarizer/summary/{ticker} - SEC filing summarization",
-            "query": "GET /api/v1/summarizer/query/{ticker}?q=... - Q&A on filings",
-            "price_prediction": "GET /api/v1/predict/price/{ticker} - Stock price prediction",
-            "portfolio": "POST /api/v1/portfolio/auth/register - User registration",
-        }
-    }
+async def root(request: Request):
+    if request.headers.get("if-none-match") == _ROOT_ETAG:
+        return Response(status_code=304, headers=_ROOT_CACHE_HEADERS)
+    return Response(content=_ROOT_PAYLOAD, media_type="application/json", headers=_ROOT_CACHE_HEADERS)
+
+_STARTED_AT = time.monotonic()
+# Probes arrive every few seconds; reuse the last upstream check for this long
+_HEALTH_CACHE_TTL_SECONDS = 10.0
+_health_cache = {"expires": 0.0, "dependencies": None}
+
+
+@app.get("/health", response_model=HealthCheckResponse, include_in_schema=False)
+async def health_check():
+    now = time.monotonic()
+    if now >= _health_cache["expires"]:
+        # Uses the process-wide client so a probe doesn't open a fresh TLS session
+        tiingo_ok = await get_tiingo_client().test_connection()
+        _health_cache["dependencies"] = {"tiingo": "ok" if tiingo_ok else "unreachable"}
+        _health_cache["expires"] = now + _HEALTH_CACHE_TTL_SECONDS
+
+    dependencies = _health_cache["dependencies"]
+    return HealthCheckResponse(
+        status=StatusEnum.SUCCESS if all(v == "ok" for v in dependencies.values()) else StatusEnum.PARTIAL,
+        service_name="ai-capital-api",
+        version=app.version,
+        uptime_seconds=now - _STARTED_AT,
+        dependencies=dependencies
+    )
 
 # Add CORS middleware
 # ... existing code ...
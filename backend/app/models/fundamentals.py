@@ -183,5 +183,5 @@ class BulkFundamentalsIngestionRequest(BaseModel):
     start_date: Optional[date] = None
     end_date: Optional[date] = None
     # period removed - this is daily fundamentals data
-    max_concurrent: int = 2
+    max_concurrent: int = Field(default=2, ge=1, le=20)
     force_refresh: bool = False 
\ No newline at end of file
@@ -2,15 +2,17 @@
 Shared Domain Utilities
 
 Common utilities and helpers used across multiple domains.
-Provides configuration helpers, validation utilities, and database connection patterns.
+Provides configuration helpers, validation utilities, database connection patterns,
+and concurrency primitives.
 """
 
 from .config_helpers import (
     BaseDomainConfig, get_domain_config, validate_api_keys, 
     get_environment_variable, create_domain_config
 )
-from .validation_utils import validate_price_data, validate_date_range
+from .validation_utils import validate_price_data, validate_date_range, TickerStr
 from .database_helpers import get_db_connection_params, safe_db_operation
+from .concurrency import DynamicLimiter, TokenBucket
 from .response_models import (
     APIResponse, ErrorResponse, PaginatedResponse, HealthCheckResponse,
     SummarizationResponse, IngestionResponse, BulkIngestionResponse,
@@ -21,7 +23,7 @@ from .exceptions import (
     FilingNotFoundException, SummaryGenerationException, PrerequisiteDataMissingException,
     DataIngestionException, InvalidTickerException, DataSourceException,
     APIKeyMissingException, ConfigurationException,
-    handle_domain_exception, domain_exception_to_http_exception
+    handle_domain_exception, domain_exception_to_http_exception, register_exception_handlers
 )
 
 __all__ = [
@@ -40,6 +42,10 @@ __all__ = [
     "get_db_connection_params",
     "safe_db_operation",
     
+    # Concurrency utilities
+    "DynamicLimiter",
+    "TokenBucket",
+    
     # Response models and helpers
     "APIResponse", "ErrorResponse", "PaginatedResponse", "HealthCheckResponse",
     "SummarizationResponse", "IngestionResponse", "BulkIngestionResponse",
@@ -50,5 +56,5 @@ __all__ = [
     "FilingNotFoundException", "SummaryGenerationException", "PrerequisiteDataMissingException",
     "DataIngestionException", "InvalidTickerException", "DataSourceException",
     "APIKeyMissingException", "ConfigurationException",
-    "handle_domain_exception", "domain_exception_to_http_exception",
+    "handle_domain_exception", "domain_exception_to_http_exception", "register_exception_handlers",
 ] 
\ No newline at end of file
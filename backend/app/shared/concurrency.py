@@ -0,0 +1,103 @@
+"""
+Shared Concurrency Utilities
+
+Admission-control primitives for bounding concurrent work against external APIs.
+"""
+
+# Standard library imports
+import asyncio
+import time
+
+
+class DynamicLimiter:
+    """
+    Concurrency limiter whose limit can be changed while work is in flight.
+
+    Uses an explicit in-flight counter guarded by an ``asyncio.Condition``
+    instead of ``asyncio.Semaphore``, so resizing is a supported operation
+    rather than a mutation of the semaphore's private counter.
+    """
+
+    def __init__(self, max_concurrent: int):
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        self._max_concurrent = max_concurrent
+        self._active = 0
+        self._condition = asyncio.Condition()
+
+    @property
+    def max_concurrent(self) -> int:
+        """Current concurrency limit."""
+        return self._max_concurrent
+
+    @property
+    def active(self) -> int:
+        """Number of holders currently inside the limiter."""
+        return self._active
+
+    async def acquire(self) -> None:
+        """Wait until a slot is free, then take it."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self._max_concurrent)
+            self._active += 1
+
+    async def release(self) -> None:
+        """Give back a slot and wake one waiter."""
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify(1)
+
+    async def resize(self, max_concurrent: int) -> None:
+        """
+        Change the concurrency limit.
+
+        Raising the limit wakes waiters immediately; lowering it lets in-flight
+        holders finish and admits new ones only once below the new limit.
+        """
+        if max_concurrent < 1:
+            raise ValueError("max_concurrent must be at least 1")
+        async with self._condition:
+            self._max_concurrent = max_concurrent
+            self._condition.notify_all()
+
+    async def __aenter__(self) -> "DynamicLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.release()
+
+
+class TokenBucket:
+    """
+    Rate limiter allowing ``rate`` acquisitions per second with bursts up to ``capacity``.
+
+    Complements a concurrency cap: the cap bounds in-flight requests, the bucket
+    bounds how fast new ones start, so short responses can't burst past a quota.
+    """
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self._rate = rate
+        self._capacity = max(capacity, 1.0)
+        self._tokens = self._capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def rate(self) -> float:
+        """Sustained acquisitions per second."""
+        return self._rate
+
+    async def acquire(self) -> None:
+        """Take a token, sleeping until one is available."""
+        async with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self._capacity, self._tokens + (now - self._updated) * self._rate)
+            self._updated = now
+            # Reserve the token up front so concurrent callers queue behind each other
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            await asyncio.sleep(wait)
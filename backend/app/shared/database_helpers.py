@@ -102,21 +102,6 @@ def format_sql_in_clause(values: list) -> str:
     return f"({', '.join(escaped_values)})"
 
 
-def batch_process_records(records: list, batch_size: int = 1000):
-    """
-    Generator to process records in batches.
-    
-    Args:
-        records: List of records to process
-        batch_size: Size of each batch
-        
-    Yields:
-        Batches of records
-    """
-    for i in range(0, len(records), batch_size):
-        yield records[i:i + batch_size]
-
-
 def validate_database_connection(database_url: Optional[str] = None) -> Dict[str, Any]:
     """
     Test database connection and return status.
@@ -6,10 +6,16 @@ Provides structured error reporting with appropriate HTTP status codes.
 """
 
 # Standard library imports
+import logging
 from typing import Optional, Dict, Any
 
 # Third-party imports
-from fastapi import HTTPException
+from fastapi import FastAPI, HTTPException, Request
+
+# Local imports
+from .response_utils import NumpyORJSONResponse
+
+logger = logging.getLogger(__name__)
 
 
 class DomainException(Exception):
@@ -148,27 +154,32 @@ def domain_exception_to_http_exception(exception: DomainException) -> HTTPExcept
     Returns:
         HTTPException with appropriate status code and detail
     """
-    # Map exception types to HTTP status codes
-    status_code_map = {
-        FilingNotFoundException: 404,
-        InvalidTickerException: 400,
-        PrerequisiteDataMissingException: 409,  # Conflict - prerequisite data missing
-        SummaryGenerationException: 500,
-        DataIngestionException: 500,
-        DataSourceException: 502,  # Bad Gateway - external service issue
-        APIKeyMissingException: 401,  # Unauthorized - missing credentials
-        ConfigurationException: 500,
-    }
-    
-    status_code = status_code_map.get(type(exception), 500)
-    
-    detail = {
+    return HTTPException(status_code=_domain_status_code(exception), detail=_domain_error_detail(exception))
+
+
+# Map exception types to HTTP status codes
+_STATUS_CODE_MAP = {
+    FilingNotFoundException: 404,
+    InvalidTickerException: 400,
+    PrerequisiteDataMissingException: 409,  # Conflict - prerequisite data missing
+    SummaryGenerationException: 500,
+    DataIngestionException: 500,
+    DataSourceException: 502,  # Bad Gateway - external service issue
+    APIKeyMissingException: 401,  # Unauthorized - missing credentials
+    ConfigurationException: 500,
+}
+
+
+def _domain_status_code(exception: DomainException) -> int:
+    return _STATUS_CODE_MAP.get(type(exception), 500)
+
+
+def _domain_error_detail(exception: DomainException) -> Dict[str, Any]:
+    return {
         "error": exception.message,
         "error_code": exception.error_code,
         "details": exception.details
     }
-    
-    return HTTPException(status_code=status_code, detail=detail)
 
 
 def handle_domain_exception(exception: Exception) -> HTTPException:
@@ -192,4 +203,32 @@ def handle_domain_exception(exception: Exception) -> HTTPException:
                 "error_code": "INTERNAL_ERROR",
                 "details": {"message": str(exception)}
             }
-        ) 
\ No newline at end of file
+        )
+
+
+async def _domain_exception_handler(request: Request, exception: DomainException) -> NumpyORJSONResponse:
+    return NumpyORJSONResponse(
+        {"detail": _domain_error_detail(exception)}, status_code=_domain_status_code(exception)
+    )
+
+
+async def _unhandled_exception_handler(request: Request, exception: Exception) -> NumpyORJSONResponse:
+    logger.exception("Unhandled error serving %s %s", request.method, request.url.path)
+    return NumpyORJSONResponse(
+        {"detail": {
+            "error": "Internal server error",
+            "error_code": "INTERNAL_ERROR",
+            "details": {"message": str(exception)}
+        }},
+        status_code=500
+    )
+
+
+def register_exception_handlers(app: FastAPI) -> None:
+    """
+    Registers app-wide handlers that turn domain exceptions and unexpected errors
+    into the same JSON error bodies as ``handle_domain_exception``, so endpoints
+    can let exceptions propagate instead of wrapping every body in try/except.
+    """
+    app.add_exception_handler(DomainException, _domain_exception_handler)
+    app.add_exception_handler(Exception, _unhandled_exception_handler)
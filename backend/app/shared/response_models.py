@@ -6,6 +6,7 @@ Ensures consistent API response formats throughout the application.
 """
 
 # Standard library imports
+import time
 from datetime import datetime
 from typing import Optional, Any, Dict, List, Union
 from enum import Enum
@@ -14,6 +15,23 @@ from enum import Enum
 from pydantic import BaseModel, Field
 
 
+_timestamp_cache: Dict[str, Any] = {"second": 0, "value": None}
+
+
+def _response_timestamp() -> datetime:
+    """
+    Current local time at one-second resolution, shared by responses within a second.
+
+    Response timestamps don't need sub-second precision, and reusing the
+    immutable datetime skips building a new one for every response.
+    """
+    second = int(time.time())
+    if second != _timestamp_cache["second"]:
+        _timestamp_cache["value"] = datetime.fromtimestamp(second)
+        _timestamp_cache["second"] = second
+    return _timestamp_cache["value"]
+
+
 class StatusEnum(str, Enum):
     """Standard status values for API responses."""
     SUCCESS = "success"
@@ -34,7 +52,7 @@ class APIResponse(BaseModel):
     message: Optional[str] = Field(None, description="Human-readable message")
     data: Optional[Any] = Field(None, description="Response payload")
     errors: Optional[List[str]] = Field(None, description="List of error messages")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Response timestamp")
+    timestamp: datetime = Field(default_factory=_response_timestamp, description="Response timestamp")
     request_id: Optional[str] = Field(None, description="Unique request identifier")
 
 
@@ -48,7 +66,7 @@ class ErrorResponse(BaseModel):
     error: str = Field(..., description="Error message")
     detail: Optional[str] = Field(None, description="Detailed error information")
     error_code: Optional[str] = Field(None, description="Application-specific error code")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Error timestamp")
+    timestamp: datetime = Field(default_factory=_response_timestamp, description="Error timestamp")
 
 
 class PaginatedResponse(BaseModel):
@@ -77,7 +95,7 @@ class HealthCheckResponse(BaseModel):
     version: str = Field(..., description="Service version")
     uptime_seconds: Optional[float] = Field(None, description="Service uptime in seconds")
     dependencies: Optional[Dict[str, str]] = Field(None, description="Status of service dependencies")
-    timestamp: datetime = Field(default_factory=datetime.now, description="Health check timestamp")
+    timestamp: datetime = Field(default_factory=_response_timestamp, description="Health check timestamp")
 
 
 # Domain-specific response models that extend the base patterns
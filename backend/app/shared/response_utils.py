@@ -1,5 +1,27 @@
 """Utility functions for creating standardized response patterns."""
-from typing import Dict, Any, Optional
+import io
+from typing import Dict, Any, Iterator, Optional, Union
+
+import orjson
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+PARQUET_MEDIA_TYPE = "application/vnd.apache.parquet"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+class NumpyORJSONResponse(JSONResponse):
+    """
+    JSON response rendered by orjson, serializing numpy arrays and scalars natively.
+    
+    For handlers that return raw dicts rather than a response model: returning
+    it skips FastAPI's jsonable_encoder walk, which dominates serialization
+    cost for long numeric series such as forecasts. Endpoints with a response
+    model are already serialized straight to bytes by pydantic.
+    """
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
 
 def success_response(data: Any = None, message: str = "Success") -> Dict[str, Any]:
     """Create a success response with optional data and message."""
@@ -29,4 +51,99 @@ def prediction_response(
         response["confidence_intervals"] = confidence_intervals
     if model_info:
         response["model_info"] = model_info
-    return response
\ No newline at end of file
+    return response
+
+def _iter_record_batches(source: Union[pa.Table, pa.RecordBatchReader], chunk_rows: int) -> Iterator[pa.RecordBatch]:
+    """Yields record batches of at most ``chunk_rows`` rows from a table or a streaming reader."""
+    if isinstance(source, pa.Table):
+        yield from source.to_batches(max_chunksize=chunk_rows)
+        return
+    for batch in source:
+        for offset in range(0, batch.num_rows, chunk_rows):
+            yield batch.slice(offset, chunk_rows)
+
+def _iter_arrow_stream(source: Union[pa.Table, pa.RecordBatchReader], chunk_rows: int) -> Iterator[bytes]:
+    """Yields an Arrow IPC stream for ``source`` one record batch at a time."""
+    sink = io.BytesIO()
+
+    def _drain() -> bytes:
+        data = sink.getvalue()
+        sink.seek(0)
+        sink.truncate()
+        return data
+
+    # Record batches are zstd-compressed inside the stream; Arrow readers decompress transparently
+    options = pa.ipc.IpcWriteOptions(compression="zstd")
+    with pa.ipc.new_stream(sink, source.schema, options=options) as writer:
+        for batch in _iter_record_batches(source, chunk_rows):
+            writer.write_batch(batch)
+            yield _drain()
+    # Closing the writer emits the end-of-stream marker
+    yield _drain()
+
+def _json_default(value: Any) -> Any:
+    """orjson fallback for values Arrow hands back as non-native types (nanosecond timestamps, decimals)."""
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    return float(value)
+
+def record_batch_to_ndjson(batch: pa.RecordBatch) -> bytes:
+    """Serializes a record batch as newline-delimited JSON with orjson, without a pandas round-trip."""
+    return b"".join(orjson.dumps(record, default=_json_default) + b"\n" for record in batch.to_pylist())
+
+def _iter_ndjson(source: Union[pa.Table, pa.RecordBatchReader], chunk_rows: int) -> Iterator[bytes]:
+    """Yields ``source`` as newline-delimited JSON, serializing one record batch per chunk."""
+    for batch in _iter_record_batches(source, chunk_rows):
+        yield record_batch_to_ndjson(batch)
+
+def _column_values(column: pa.ChunkedArray) -> Any:
+    """Converts one column for orjson: numeric and temporal columns as numpy arrays, others as lists."""
+    if pa.types.is_decimal(column.type):
+        column = column.cast(pa.float64())
+    if pa.types.is_integer(column.type) or pa.types.is_floating(column.type) or pa.types.is_temporal(column.type):
+        # Nulls become NaN/NaT, which orjson writes as null
+        return column.to_numpy()
+    return column.to_pylist()
+
+def _columnar_json(source: Union[pa.Table, pa.RecordBatchReader]) -> bytes:
+    table = source if isinstance(source, pa.Table) else source.read_all()
+    payload = {name: _column_values(table.column(name)) for name in table.column_names}
+    return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+
+def resolve_table_format(accept: Optional[str] = None, output_format: Optional[str] = None) -> str:
+    """Picks "arrow", "parquet", "columns" or "json" from an explicit format, falling back to the ``Accept`` header."""
+    if output_format is not None:
+        return output_format
+    if accept:
+        if ARROW_STREAM_MEDIA_TYPE in accept:
+            return "arrow"
+        if PARQUET_MEDIA_TYPE in accept:
+            return "parquet"
+    return "json"
+
+def table_response(
+    source: Union[pa.Table, pa.RecordBatchReader],
+    accept: Optional[str] = None,
+    output_format: Optional[str] = None,
+    chunk_rows: int = 1024
+) -> Response:
+    """
+    Serialize an Arrow table or record batch reader as Arrow IPC, Parquet, columnar JSON or NDJSON.
+    
+    ``output_format`` ("arrow", "parquet", "columns" or "json") wins when given; otherwise
+    the ``Accept`` header picks Arrow IPC and anything else gets NDJSON. Arrow and
+    NDJSON are streamed in chunks, pulling from a reader only as the response is
+    sent. Parquet (zstd-compressed) and columnar JSON (``{column: [values]}``) are
+    written in one pass, so a reader is drained first.
+    """
+    output_format = resolve_table_format(accept, output_format)
+    if output_format == "arrow":
+        return StreamingResponse(_iter_arrow_stream(source, chunk_rows), media_type=ARROW_STREAM_MEDIA_TYPE)
+    if output_format == "parquet":
+        table = source if isinstance(source, pa.Table) else source.read_all()
+        sink = pa.BufferOutputStream()
+        pq.write_table(table, sink, compression="zstd")
+        return Response(content=sink.getvalue().to_pybytes(), media_type=PARQUET_MEDIA_TYPE)
+    if output_format == "columns":
+        return Response(content=_columnar_json(source), media_type="application/json")
+    return StreamingResponse(_iter_ndjson(source, chunk_rows), media_type=NDJSON_MEDIA_TYPE)
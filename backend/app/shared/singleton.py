@@ -1,5 +1,5 @@
 """Utility for creating singleton instances."""
-from typing import TypeVar, Type, Dict, Any
+from typing import TypeVar, Type, Dict, Any, Optional
 
 T = TypeVar('T')
 
@@ -9,4 +9,8 @@ def get_singleton(cls: Type[T], *args, **kwargs) -> T:
     """Get or create a singleton instance of the given class."""
     if cls not in _instances:
         _instances[cls] = cls(*args, **kwargs)
-    return _instances[cls]
\ No newline at end of file
+    return _instances[cls]
+
+def pop_singleton(cls: Type[T]) -> Optional[T]:
+    """Remove and return the singleton instance of the given class, if one was created."""
+    return _instances.pop(cls, None)
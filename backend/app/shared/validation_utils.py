@@ -6,11 +6,20 @@ Common validation functions used across domains.
 
 # Standard library imports
 from datetime import date, datetime
-from typing import List, Dict, Any, Optional, Union
+from typing import Annotated, Iterable, List, Dict, Any, Optional, Union
 from decimal import Decimal
 
 # Third-party imports
-from pydantic import ValidationError
+from pydantic import StringConstraints, ValidationError
+
+
+# Ticker path/query parameter: validated and uppercased once by pydantic's core,
+# so handlers receive a normalized symbol (index symbols like ^GSPC included).
+# Declare as Annotated[TickerStr, Path(...)]; a Path(...) default drops the constraints.
+TickerStr = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, to_upper=True, min_length=1, max_length=10, pattern=r"^[A-Za-z0-9.^\-]+$")
+]
 
 
 def validate_price_data(
@@ -191,4 +200,22 @@ def validate_ticker_symbol(ticker: str) -> Dict[str, Any]:
     if not normalized.replace("^", "").replace(".", "").replace("-", "").isalnum():
         results["errors"].append("Ticker contains invalid characters")
     
-    return results 
\ No newline at end of file
+    return results
+
+
+def normalize_tickers(tickers: Iterable[str], keep_order: bool = False) -> List[str]:
+    """
+    Normalize a list of ticker symbols in a single pass.
+    
+    Strips whitespace, uppercases, drops blanks and duplicates, and sorts the
+    result so batches are stable and each symbol is only fetched once.
+    
+    Args:
+        tickers: Raw ticker symbols, e.g. from CLI arguments
+        keep_order: Keep first-seen order instead of sorting
+        
+    Returns:
+        List of unique, uppercased ticker symbols
+    """
+    unique = dict.fromkeys(ticker.strip().upper() for ticker in tickers if ticker and ticker.strip())
+    return list(unique) if keep_order else sorted(unique)
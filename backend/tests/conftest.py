@@ -0,0 +1,90 @@
+"""
+Shared test fixtures.
+
+S3 is served by moto. The storage service's Arrow dataset reads go through a
+small filesystem handler backed by the same mocked boto3 client, so reads and
+writes see one bucket without a running S3 endpoint.
+"""
+
+import os
+
+# Settings are read at import time; give the required ones test values first
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("S3_BUCKET", "test-bucket")
+os.environ.setdefault("TIINGO_API_KEY", "test")
+os.environ.setdefault("FMP_API_KEY", "test")
+os.environ.setdefault("ALPHA_VANTAGE_API_KEY", "test")
+os.environ.setdefault("AWS_ACCESS_KEY_ID", "test")
+os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "test")
+os.environ.setdefault("AWS_DEFAULT_REGION", "us-east-1")
+
+import boto3
+import pyarrow as pa
+import pyarrow.fs as pafs
+import pytest
+from botocore.exceptions import ClientError
+from moto import mock_aws
+
+from app.domains.data_collection.storage.s3_storage_service import S3StorageService
+
+
+class BotoFileSystemHandler(pafs.FileSystemHandler):
+    """Read-only Arrow filesystem over a boto3 client; paths are ``bucket/key``."""
+
+    def __init__(self, client):
+        self.client = client
+
+    def __eq__(self, other):
+        return isinstance(other, BotoFileSystemHandler) and other.client is self.client
+
+    def __ne__(self, other):
+        return not self == other
+
+    def get_type_name(self):
+        return "boto-test"
+
+    def normalize_path(self, path):
+        return path
+
+    def get_file_info(self, paths):
+        infos = []
+        for path in paths:
+            bucket, key = path.split("/", 1)
+            try:
+                size = self.client.head_object(Bucket=bucket, Key=key)["ContentLength"]
+            except ClientError:
+                infos.append(pafs.FileInfo(path, pafs.FileType.NotFound))
+                continue
+            infos.append(pafs.FileInfo(path, pafs.FileType.File, size=size))
+        return infos
+
+    def open_input_file(self, path):
+        bucket, key = path.split("/", 1)
+        return pa.BufferReader(self.client.get_object(Bucket=bucket, Key=key)["Body"].read())
+
+    def open_input_stream(self, path):
+        return self.open_input_file(path)
+
+    def _read_only(self, *args, **kwargs):
+        raise NotImplementedError("test filesystem is read-only")
+
+    get_file_info_selector = create_dir = delete_dir = delete_dir_contents = _read_only
+    delete_root_dir_contents = delete_file = move = copy_file = _read_only
+    open_output_stream = open_append_stream = _read_only
+
+
+@pytest.fixture
+def s3_client():
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=os.environ["S3_BUCKET"])
+        yield client
+
+
+@pytest.fixture
+def storage(s3_client):
+    service = S3StorageService()
+    service._s3_client = s3_client
+    service._s3_filesystem = pafs.PyFileSystem(BotoFileSystemHandler(s3_client))
+    yield service
+    service._io_executor.shutdown(wait=True)
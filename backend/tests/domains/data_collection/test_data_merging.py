@@ -0,0 +1,59 @@
+import asyncio
+
+import pandas as pd
+import pytest
+
+from app.domains.data_collection.services import data_merging_service
+from app.domains.data_collection.services.data_merging_service import DataMergingService
+
+
+@pytest.fixture
+def service(storage, monkeypatch):
+    """A merging service over the mocked bucket with one stored macro series."""
+    monkeypatch.setattr(data_merging_service, "get_key_macro_series_ids", lambda: ["DGS10"])
+    rates = pd.DataFrame(
+        {"value": [3.9, 4.1, 4.3]},
+        index=pd.to_datetime(["2022-12-30", "2023-02-01", "2023-06-01"]).rename("date")
+    )
+    asyncio.run(storage._upload_dataframe_to_s3(rates, "macro_data/fred/DGS10/year=2023/data.parquet"))
+    return DataMergingService(s3_storage_service=storage)
+
+
+def _store_prices(storage, ticker, days, close):
+    rows = [
+        {"ticker": ticker, "date": day.date(), "open": close + i, "high": close + i + 1,
+         "low": close + i - 1, "close": close + i, "volume": 1_000 + i}
+        for i, day in enumerate(pd.bdate_range("2023-01-02", periods=days))
+    ]
+    return storage.save_price_data(rows, ticker)
+
+
+def test_batch_merge_matches_single_ticker_merges(storage, service):
+    async def scenario():
+        await _store_prices(storage, "AAPL", 260, 100.0)
+        await _store_prices(storage, "MSFT", 40, 250.0)
+        batch = await service.get_merged_data_for_tickers(["AAPL", "MSFT", "ZZZZ"], force_refresh=True)
+        single = {ticker: await service.get_merged_data(ticker, force_refresh=True) for ticker in ("AAPL", "MSFT")}
+        return batch, single
+
+    batch, single = asyncio.run(scenario())
+
+    assert batch["ZZZZ"] is None
+    # The macro series is carried forward onto the trading days
+    assert batch["AAPL"]["DGS10"].iloc[:3].tolist() == [3.9, 3.9, 3.9]
+    for ticker, merged_df in single.items():
+        assert {"DGS10", "sma_20", "obv"} <= set(merged_df.columns)
+        pd.testing.assert_frame_equal(batch[ticker], merged_df)
+
+
+def test_batch_merge_reuses_stored_merged_data(storage, service):
+    async def scenario():
+        await _store_prices(storage, "AAPL", 60, 100.0)
+        first = await service.get_merged_data_for_tickers(["AAPL"])
+        await _store_prices(storage, "AAPL", 61, 500.0)
+        return first, await service.get_merged_data_for_tickers(["AAPL"])
+
+    first, second = asyncio.run(scenario())
+
+    # The stored merged dataset is valid, so it is read back rather than rebuilt
+    assert len(second["AAPL"]) == len(first["AAPL"]) == 60
@@ -0,0 +1,59 @@
+from collections import OrderedDict
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.domains.data_collection.api import ingestion_endpoints
+
+
+class _StubCollectionService:
+    batch_job_queue_depth = 0
+
+    async def collect_daily_prices_for_tickers(self, tickers, max_concurrent, label):
+        return {"status": "completed", "total_tickers": len(tickers), "results": [{"ticker": t} for t in tickers]}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(ingestion_endpoints, "get_data_collection_service", _StubCollectionService)
+    monkeypatch.setattr(ingestion_endpoints, "_jobs", {})
+    monkeypatch.setattr(ingestion_endpoints, "_finished_jobs", OrderedDict())
+    app = FastAPI()
+    app.include_router(ingestion_endpoints.router, prefix="/ingest")
+    return TestClient(app)
+
+
+def _submit(client, tickers=("AAPL", "MSFT")):
+    response = client.post("/ingest/bulk", json={"tickers": list(tickers)})
+    assert response.status_code == 202
+    return response.json()["ingestion_id"]
+
+
+def test_finished_job_result_is_returned_once(client):
+    job_id = _submit(client)
+
+    first = client.get(f"/ingest/jobs/{job_id}").json()
+    second = client.get(f"/ingest/jobs/{job_id}").json()
+
+    assert first["status"] == "completed"
+    assert first["data"]["result"]["total_tickers"] == 2
+    assert second["status"] == "completed"
+    assert "result" not in second["data"]
+    assert second["data"]["result_delivered"] is True
+
+
+def test_finished_jobs_expire(client, monkeypatch):
+    job_id = _submit(client)
+    monkeypatch.setattr(ingestion_endpoints, "_FINISHED_JOB_TTL_SECONDS", -1.0)
+
+    assert client.get(f"/ingest/jobs/{job_id}").status_code == 404
+    assert ingestion_endpoints._jobs == {}
+
+
+def test_oldest_finished_jobs_are_evicted_beyond_the_cap(client, monkeypatch):
+    monkeypatch.setattr(ingestion_endpoints, "_MAX_FINISHED_JOBS", 2)
+    job_ids = [_submit(client, tickers=(f"T{i}",)) for i in range(3)]
+
+    assert client.get(f"/ingest/jobs/{job_ids[0]}").status_code == 404
+    assert [client.get(f"/ingest/jobs/{job_id}").status_code for job_id in job_ids[1:]] == [200, 200]
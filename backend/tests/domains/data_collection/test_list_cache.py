@@ -0,0 +1,59 @@
+import asyncio
+import threading
+import time
+
+
+def _slow_listing(storage, delay=0.2):
+    """Replaces the S3 listing with a blocking stub that records each call."""
+    calls = []
+    lock = threading.Lock()
+
+    def list_prefix_keys(s3_prefix):
+        with lock:
+            calls.append(s3_prefix)
+        time.sleep(delay)
+        return {f"{s3_prefix}object.parquet": "etag"}
+
+    storage._list_prefix_keys = list_prefix_keys
+    return calls
+
+
+def test_concurrent_misses_on_one_prefix_share_a_listing(storage):
+    calls = _slow_listing(storage)
+
+    async def scenario():
+        return await asyncio.gather(*(storage._list_ticker_keys("prices/a/", "object") for _ in range(5)))
+
+    results = asyncio.run(scenario())
+
+    assert calls == ["prices/a/"]
+    assert results == [["prices/a/object.parquet"]] * 5
+
+
+def test_unrelated_prefixes_are_listed_in_parallel(storage):
+    calls = _slow_listing(storage, delay=0.3)
+
+    async def scenario():
+        started = time.monotonic()
+        await asyncio.gather(*(storage._list_ticker_keys(f"prices/{i}/", "object") for i in range(4)))
+        return time.monotonic() - started
+
+    elapsed = asyncio.run(scenario())
+
+    assert sorted(calls) == [f"prices/{i}/" for i in range(4)]
+    assert elapsed < 0.9
+
+
+def test_write_during_listing_is_not_hidden_by_the_cache(storage):
+    calls = _slow_listing(storage)
+
+    async def scenario():
+        listing = asyncio.ensure_future(storage._list_ticker_keys("prices/a/", "object"))
+        await asyncio.sleep(0.05)
+        storage._invalidate_list_cache("prices/a/new.parquet")
+        await listing
+        await storage._list_ticker_keys("prices/a/", "object")
+
+    asyncio.run(scenario())
+
+    assert calls == ["prices/a/", "prices/a/"]
@@ -0,0 +1,32 @@
+import pytest
+
+from app.domains.data_collection.services.orchestration_service import _is_transient
+
+
+class _HTTPError(Exception):
+    def __init__(self, message="", status=None, status_code=None):
+        super().__init__(message)
+        self.status = status
+        self.status_code = status_code
+
+
+@pytest.mark.parametrize("error", [
+    _HTTPError(status=429),
+    _HTTPError(status=503),
+    _HTTPError(status_code=504),
+    _HTTPError("Rate limit exceeded, retry later"),
+    RuntimeError("Daily request QUOTA reached"),
+    RuntimeError("429 Too Many Requests"),
+])
+def test_throttling_and_outages_are_retried(error):
+    assert _is_transient(error)
+
+
+@pytest.mark.parametrize("error", [
+    _HTTPError("Not Found", status=404),
+    _HTTPError("Unauthorized", status_code=401),
+    _HTTPError(status=500),
+    ValueError("Unknown ticker ZZZZ"),
+])
+def test_other_failures_are_not_retried(error):
+    assert not _is_transient(error)
@@ -0,0 +1,221 @@
+import asyncio
+from datetime import date
+from decimal import Decimal
+
+import pandas as pd
+import pyarrow as pa
+
+from app.domains.data_collection.storage import s3_storage_service
+
+
+def _legacy_frame(ticker, days, closes):
+    """A price object as written before the float32 layout: Decimal prices, date objects and a pandas index."""
+    return pd.DataFrame(
+        {
+            "ticker": ticker,
+            "date": [pd.Timestamp(day).date() for day in days],
+            "close": [Decimal(close) for close in closes],
+            "volume": [1_000_000 + i for i in range(len(days))],
+        },
+        index=range(10, 10 + len(days)),
+    )
+
+
+def _price_rows(days, close=100.0, ticker="AAPL"):
+    return [{"ticker": ticker, "date": day, "close": close + i, "volume": 10 + i} for i, day in enumerate(days)]
+
+
+def test_reads_legacy_decimal_objects_next_to_float32_ones(storage):
+    async def scenario():
+        # Two legacy years whose Decimal precision differs, then a year written today
+        await storage._upload_dataframe_to_s3(
+            _legacy_frame("AAPL", ["2019-12-30", "2019-12-31"], ["71.25", "73.5"]),
+            "market-data/daily_prices/year=2019/daily_prices_AAPL_2019.parquet",
+        )
+        await storage._upload_dataframe_to_s3(
+            _legacy_frame("AAPL", ["2020-01-02"], ["75.0875"]),
+            "market-data/daily_prices/year=2020/daily_prices_AAPL_2020.parquet",
+        )
+        await storage.save_price_data(_price_rows(["2021-01-04", "2021-01-05"]), "AAPL")
+        return await storage.get_price_table("AAPL")
+
+    table = asyncio.run(scenario())
+
+    assert table is not None
+    assert "__index_level_0__" not in table.column_names
+    assert table.schema.field("close").type == pa.float32()
+    assert table.schema.field("date").type == pa.timestamp("ns")
+    assert [d.date() for d in table["date"].to_pylist()] == [
+        date(2019, 12, 30), date(2019, 12, 31), date(2020, 1, 2), date(2021, 1, 4), date(2021, 1, 5)
+    ]
+    assert table["close"].to_pylist() == pa.array([71.25, 73.5, 75.0875, 100.0, 101.0], pa.float32()).to_pylist()
+
+
+def test_overlapping_batch_folds_legacy_object_into_float32(storage, s3_client):
+    key = "market-data/daily_prices/year=2020/daily_prices_AAPL_2020.parquet"
+    legacy = _legacy_frame("AAPL", ["2020-01-02", "2020-01-03"], ["75.0875", "74.36"])
+    legacy["date"] = pd.to_datetime(legacy["date"]).dt.tz_localize("UTC")
+
+    async def scenario():
+        await storage._upload_dataframe_to_s3(legacy, key)
+        counts = await storage.save_price_data(_price_rows(["2020-01-03", "2020-01-06"]), "AAPL")
+        return counts, await storage.get_price_table("AAPL", columns=["date", "close"])
+
+    counts, table = asyncio.run(scenario())
+
+    assert counts == {"inserted": 1, "updated": 1}
+    assert [d.date() for d in table["date"].to_pylist()] == [date(2020, 1, 2), date(2020, 1, 3), date(2020, 1, 6)]
+    assert table["close"].to_pylist() == pa.array([75.0875, 100.0, 101.0], pa.float32()).to_pylist()
+    listed = s3_client.list_objects_v2(Bucket=storage.bucket_name, Prefix="market-data/")["Contents"]
+    assert [obj["Key"] for obj in listed] == [key]
+
+
+def test_latest_date_of_legacy_string_dates(storage):
+    legacy = _legacy_frame("MSFT", ["2018-06-01", "2018-06-04"], ["98.5", "101"])
+    legacy["date"] = legacy["date"].astype(str)
+
+    async def scenario():
+        await storage._upload_dataframe_to_s3(
+            legacy, "market-data/daily_prices/year=2018/daily_prices_MSFT_2018.parquet"
+        )
+        return await storage.get_latest_price_date("MSFT")
+
+    assert asyncio.run(scenario()) == date(2018, 6, 4)
+
+
+def test_single_ticker_reads_list_only_that_tickers_keys(storage):
+    listed = []
+    list_prefix_keys = storage._list_prefix_keys
+
+    def spy(s3_prefix):
+        listed.append(s3_prefix)
+        return list_prefix_keys(s3_prefix)
+
+    async def scenario():
+        await storage.save_price_data(_price_rows(["2020-12-31", "2021-01-04"]), "AAPL")
+        await storage.save_price_data(_price_rows(["2021-01-04"], ticker="AA"), "AA")
+        storage._list_cache.clear()
+        storage._list_prefix_keys = spy
+        return await storage.get_price_table("AA"), await storage.get_latest_price_date("AAPL")
+
+    table, latest = asyncio.run(scenario())
+
+    assert table.num_rows == 1 and set(table["ticker"].to_pylist()) == {"AA"}
+    assert latest == date(2021, 1, 4)
+    assert sorted(listed) == [
+        "market-data/daily_prices/year=2020/daily_prices_AA_2020",
+        "market-data/daily_prices/year=2021/daily_prices_AAPL_2021",
+        "market-data/daily_prices/year=2021/daily_prices_AA_2021",
+    ]
+
+
+def test_hot_cache_holds_only_full_history_reads(storage):
+    reads = []
+    read_parquet_table = storage._read_parquet_table
+
+    def spy(s3_keys, columns=None, start_date=None, end_date=None, limit=None, schema=None):
+        reads.append((len(s3_keys), columns, start_date, limit))
+        return read_parquet_table(s3_keys, columns, start_date, end_date, limit, schema)
+
+    async def scenario():
+        await storage.save_price_data(_price_rows(["2020-06-01", "2021-06-01", "2021-06-02"]), "AAPL")
+        storage._read_parquet_table = spy
+        ranged = await storage.get_price_table("AAPL", columns=["date", "close"], start_date=date(2021, 1, 1), limit=1)
+        cached_after_ranged = "AAPL" in storage._hot_price_tables
+        full = await storage.get_price_table("AAPL")
+        sliced = await storage.get_price_table("AAPL", columns=["close"], start_date=date(2021, 1, 1))
+        return ranged, cached_after_ranged, full, sliced
+
+    ranged, cached_after_ranged, full, sliced = asyncio.run(scenario())
+
+    # The ranged miss is pushed down to the 2021 object only and isn't cached
+    assert reads[0] == (1, ["date", "close"], date(2021, 1, 1), 1)
+    assert ranged.column_names == ["date", "close"] and ranged.num_rows == 1
+    assert not cached_after_ranged
+    # The full read fills the cache and the next read is sliced from it without a scan
+    assert len(reads) == 2 and full.num_rows == 3
+    assert sliced["close"].to_pylist() == [101.0, 102.0]
+
+
+def test_hot_cache_is_dropped_when_objects_change(storage):
+    async def scenario():
+        await storage.save_price_data(_price_rows(["2021-06-01"]), "AAPL")
+        first = await storage.get_price_table("AAPL")
+        await storage.save_price_data(_price_rows(["2021-06-02"], close=150.0), "AAPL")
+        return first, await storage.get_price_table("AAPL")
+
+    first, second = asyncio.run(scenario())
+
+    assert first.num_rows == 1
+    assert second["close"].to_pylist() == [100.0, 150.0]
+
+
+def _price_keys(s3_client, bucket):
+    listed = s3_client.list_objects_v2(Bucket=bucket, Prefix="market-data/").get("Contents", [])
+    return [obj["Key"].rsplit("/", 1)[1] for obj in listed]
+
+
+def test_later_batch_is_appended_as_a_part(storage, s3_client):
+    async def scenario():
+        first = await storage.save_price_data(_price_rows(["2024-03-11", "2024-03-12"]), "AAPL")
+        second = await storage.save_price_data(_price_rows(["2024-03-13"], close=200.0), "AAPL")
+        return first, second, await storage.get_price_table("AAPL", columns=["date", "close"])
+
+    first, second, table = asyncio.run(scenario())
+
+    assert first == {"inserted": 2, "updated": 0}
+    assert second == {"inserted": 1, "updated": 0}
+    assert _price_keys(s3_client, storage.bucket_name) == [
+        "daily_prices_AAPL_2024.parquet", "daily_prices_AAPL_2024_part-20240313.parquet"
+    ]
+    assert [d.date() for d in table["date"].to_pylist()] == [date(2024, 3, 11), date(2024, 3, 12), date(2024, 3, 13)]
+    assert table["close"].to_pylist() == [100.0, 101.0, 200.0]
+
+
+def test_overlapping_batch_folds_parts_into_the_yearly_object(storage, s3_client):
+    async def scenario():
+        await storage.save_price_data(_price_rows(["2024-03-11", "2024-03-12"]), "AAPL")
+        await storage.save_price_data(_price_rows(["2024-03-13", "2024-03-14"]), "AAPL")
+        counts = await storage.save_price_data(_price_rows(["2024-03-12", "2024-03-15"], close=300.0), "AAPL")
+        return counts, await storage.get_price_table("AAPL", columns=["date", "close"])
+
+    counts, table = asyncio.run(scenario())
+
+    assert counts == {"inserted": 1, "updated": 1}
+    assert _price_keys(s3_client, storage.bucket_name) == ["daily_prices_AAPL_2024.parquet"]
+    assert [d.day for d in table["date"].to_pylist()] == [11, 12, 13, 14, 15]
+    assert table["close"].to_pylist() == [100.0, 300.0, 100.0, 101.0, 301.0]
+
+
+def test_parts_beyond_the_limit_are_folded(storage, s3_client, monkeypatch):
+    monkeypatch.setattr(s3_storage_service, "_MAX_PRICE_PARTS_PER_YEAR", 1)
+
+    async def scenario():
+        for day in ["2024-03-11", "2024-03-12", "2024-03-13"]:
+            await storage.save_price_data(_price_rows([day]), "AAPL")
+        return await storage.get_price_table("AAPL", columns=["date"])
+
+    table = asyncio.run(scenario())
+
+    assert _price_keys(s3_client, storage.bucket_name) == ["daily_prices_AAPL_2024.parquet"]
+    assert [d.day for d in table["date"].to_pylist()] == [11, 12, 13]
+
+
+def test_price_coverage_counts_appended_parts(storage, s3_client):
+    async def scenario():
+        await storage.save_price_data(_price_rows(["2024-03-11", "2024-03-12"]), "AAPL")
+        # Strictly later rows land in an appended part instead of rewriting the yearly file
+        await storage.save_price_data(_price_rows(["2024-03-15", "2024-03-18", "2024-03-19"]), "AAPL")
+        return await storage.get_price_coverage(["AAPL", "ZZZZ"])
+
+    coverage = asyncio.run(scenario())
+
+    listed = s3_client.list_objects_v2(Bucket=storage.bucket_name, Prefix="market-data/")["Contents"]
+    assert [obj["Key"] for obj in listed] == [
+        "market-data/daily_prices/year=2024/daily_prices_AAPL_2024.parquet",
+        "market-data/daily_prices/year=2024/daily_prices_AAPL_2024_part-20240315.parquet",
+    ]
+    assert coverage == {
+        "AAPL": {"record_count": 5, "earliest_date": date(2024, 3, 11), "latest_date": date(2024, 3, 19)},
+        "ZZZZ": {"record_count": 0, "earliest_date": None, "latest_date": None},
+    }
@@ -0,0 +1,43 @@
+from datetime import date
+
+import pyarrow as pa
+
+from app.domains.data_collection.clients.tiingo_client import _parse_csv_price_chunk
+from app.domains.data_collection.models.market_data import PriceDataPoint
+
+_HEADER = b"date,close,high,low,open,volume,adjClose,adjHigh,adjLow,adjOpen,adjVolume,divCash,splitFactor"
+
+
+def test_parses_csv_rows_into_price_columns():
+    csv_chunk = b"\n".join([
+        _HEADER,
+        b"2024-01-02T00:00:00.000Z,185.64,188.44,183.885,187.15,82488674,184.93,187.72,183.18,186.43,82488674,0.0,1.0",
+        b"2024-01-03,184.25,185.88,183.43,184.22,58414460,183.54,185.17,182.73,183.51,58414460,0.24,1.0",
+    ])
+
+    table = _parse_csv_price_chunk("AAPL", csv_chunk)
+
+    assert table.column_names == list(PriceDataPoint.model_fields)
+    assert table["ticker"].to_pylist() == ["AAPL", "AAPL"]
+    assert table.schema.field("date").type == pa.date32()
+    assert table["date"].to_pylist() == [date(2024, 1, 2), date(2024, 1, 3)]
+    assert table.schema.field("volume").type == pa.int64()
+    assert table["volume"].to_pylist() == [82488674, 58414460]
+    assert table["close"].to_pylist() == [185.64, 184.25]
+    # A zero dividend means no dividend
+    assert table["dividend_cash"].to_pylist() == [None, 0.24]
+
+
+def test_skips_malformed_rows_and_fills_missing_columns():
+    csv_chunk = b"\n".join([
+        b"date,close,volume",
+        b"2024-01-02,185.64,82488674",
+        b"2024-01-03,184.25",
+        b"2024-01-04,181.91,71983570",
+    ])
+
+    table = _parse_csv_price_chunk("AAPL", csv_chunk)
+
+    assert table["date"].to_pylist() == [date(2024, 1, 2), date(2024, 1, 4)]
+    assert table["close"].to_pylist() == [185.64, 181.91]
+    assert table["adj_close"].null_count == 2
@@ -0,0 +1,90 @@
+import asyncio
+import json
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+pytest.importorskip("statsmodels")
+
+from app.domains.price_prediction.api import public_endpoints
+from app.shared.response_utils import ARROW_STREAM_MEDIA_TYPE, NDJSON_MEDIA_TYPE, PARQUET_MEDIA_TYPE
+
+
+def _save_prices(storage, days, close=100.0):
+    asyncio.run(storage.save_price_data(
+        [{"ticker": "AAPL", "date": day, "close": close + i, "volume": 10 + i} for i, day in enumerate(days)],
+        "AAPL"
+    ))
+
+
+@pytest.fixture
+def client(storage, monkeypatch):
+    monkeypatch.setattr(public_endpoints, "get_s3_storage_service", lambda: storage)
+    _save_prices(storage, ["2024-03-11", "2024-03-12", "2024-03-13"])
+    app = FastAPI()
+    app.include_router(public_endpoints.router, prefix="/predict")
+    return TestClient(app)
+
+
+def test_unknown_history_column_is_a_bad_request(client):
+    response = client.get("/predict/history/AAPL", params={"columns": "date,closing_price"})
+
+    assert response.status_code == 400
+    assert "closing_price" in response.json()["detail"]
+
+
+def test_unknown_batch_history_column_is_a_bad_request(client):
+    response = client.post("/predict/history/batch", json={"tickers": ["AAPL"], "columns": ["date", "bogus"]})
+
+    assert response.status_code == 400
+
+
+def test_history_revalidates_with_etag(client, storage):
+    first = client.get("/predict/history/AAPL")
+    etag = first.headers["etag"]
+
+    cached = client.get("/predict/history/AAPL", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+
+    _save_prices(storage, ["2024-03-14"], close=200.0)
+    changed = client.get("/predict/history/AAPL", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+
+
+def test_history_etag_varies_with_the_requested_format(client):
+    ndjson = client.get("/predict/history/AAPL")
+    arrow = client.get("/predict/history/AAPL", headers={"Accept": ARROW_STREAM_MEDIA_TYPE})
+
+    assert ndjson.headers["etag"] != arrow.headers["etag"]
+    assert ndjson.headers["vary"] == "Accept"
+
+
+def test_history_defaults_to_ndjson(client):
+    response = client.get("/predict/history/AAPL", params={"columns": "date,close"})
+
+    assert response.headers["content-type"].startswith(NDJSON_MEDIA_TYPE)
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["close"] for row in rows] == [100.0, 101.0, 102.0]
+    assert set(rows[0]) == {"date", "close"}
+
+
+def test_history_negotiates_arrow_and_honours_explicit_formats(client):
+    arrow = client.get("/predict/history/AAPL", headers={"Accept": ARROW_STREAM_MEDIA_TYPE})
+    assert arrow.headers["content-type"] == ARROW_STREAM_MEDIA_TYPE
+    assert pa.ipc.open_stream(arrow.content).read_all().num_rows == 3
+
+    parquet = client.get("/predict/history/AAPL", params={"format": "parquet", "limit": 2})
+    assert parquet.headers["content-type"] == PARQUET_MEDIA_TYPE
+    assert pq.read_table(pa.BufferReader(parquet.content)).num_rows == 2
+
+    columns = client.get(
+        "/predict/history/AAPL",
+        params={"format": "columns", "columns": "close"},
+        headers={"Accept": ARROW_STREAM_MEDIA_TYPE}
+    )
+    assert columns.json() == {"close": [100.0, 101.0, 102.0]}
@@ -0,0 +1,64 @@
+import asyncio
+from collections import OrderedDict
+
+import pytest
+
+pytest.importorskip("statsmodels")
+
+from app.domains.price_prediction import price_prediction_service
+from app.domains.price_prediction.price_prediction_service import PricePredictionService
+
+
+@pytest.fixture
+def service(monkeypatch):
+    # Skip __init__: the real collaborators open API and S3 clients
+    service = PricePredictionService.__new__(PricePredictionService)
+    service._prediction_cache = OrderedDict()
+    service.fits = []
+
+    async def fake_train_and_predict(ticker, days_ahead, model_type):
+        service.fits.append((ticker, days_ahead))
+        return {"success": True, "data": {"ticker": ticker, "predictions": [1.0] * days_ahead}}
+
+    monkeypatch.setattr(service, "_train_and_predict", fake_train_and_predict)
+    return service
+
+
+def test_cached_forecasts_are_returned_as_copies(service):
+    async def scenario():
+        first = await service.train_and_predict("AAPL", 3)
+        first["data"]["predictions"].append(99.0)
+        return await service.train_and_predict("AAPL", 3)
+
+    second = asyncio.run(scenario())
+
+    assert service.fits == [("AAPL", 3)]
+    assert second["data"]["predictions"] == [1.0, 1.0, 1.0]
+
+
+def test_expired_forecasts_are_evicted(service, monkeypatch):
+    clock = [1000.0]
+    monkeypatch.setattr(price_prediction_service.time, "monotonic", lambda: clock[0])
+
+    async def scenario():
+        await service.train_and_predict("AAPL", 3)
+        clock[0] += price_prediction_service._PREDICTION_CACHE_TTL_SECONDS
+        await service.train_and_predict("MSFT", 3)
+        return list(service._prediction_cache)
+
+    assert asyncio.run(scenario()) == [("MSFT", 3, "arima")]
+    assert service.fits == [("AAPL", 3), ("MSFT", 3)]
+
+
+def test_cache_keeps_only_the_newest_forecasts(service, monkeypatch):
+    monkeypatch.setattr(price_prediction_service, "_PREDICTION_CACHE_MAX_ENTRIES", 2)
+
+    async def scenario():
+        for days_ahead in (1, 2, 3):
+            await service.train_and_predict("AAPL", days_ahead)
+        await service.train_and_predict("AAPL", 1)
+
+    asyncio.run(scenario())
+
+    assert service.fits == [("AAPL", 1), ("AAPL", 2), ("AAPL", 3), ("AAPL", 1)]
+    assert list(service._prediction_cache) == [("AAPL", 3, "arima"), ("AAPL", 1, "arima")]
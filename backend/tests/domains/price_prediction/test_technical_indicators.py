@@ -0,0 +1,74 @@
+import numpy as np
+import pandas as pd
+
+from app.domains.price_prediction.features.technical_indicators import (
+    _downcast_features,
+    _obv,
+    technical_indicators_generator,
+)
+
+
+def test_obv_adds_volume_on_up_closes_and_subtracts_on_down_closes():
+    close = np.array([10.0, 11.0, 11.0, 10.0, 12.0])
+    volume = np.array([100.0, 200.0, 300.0, 400.0, 500.0])
+
+    assert _obv(close, volume).tolist() == [0.0, 200.0, 200.0, -200.0, 300.0]
+
+
+def test_obv_treats_missing_closes_as_flat_bars():
+    close = np.array([10.0, np.nan, 12.0, 13.0])
+    volume = np.array([100.0, 200.0, 300.0, 400.0])
+
+    assert _obv(close, volume).tolist() == [0.0, 0.0, 0.0, 400.0]
+
+
+def test_volume_roc_matches_ten_day_change_with_gaps_carried_forward():
+    volume = pd.Series([float(100 + 10 * i) for i in range(25)])
+    volume[12] = np.nan
+    prices = pd.DataFrame({"close": np.linspace(10, 20, 25), "volume": volume})
+
+    roc = technical_indicators_generator._calculate_volume_indicators(prices)["volume_roc"]
+
+    filled = volume.ffill()
+    expected = filled / filled.shift(10) - 1
+    pd.testing.assert_series_equal(roc, expected, check_names=False)
+
+
+def test_volume_scaled_indicators_keep_float64():
+    prices = pd.DataFrame({"close": np.arange(1.0, 41.0), "volume": np.full(40, 3e9)})
+
+    features = _downcast_features(technical_indicators_generator.generate_features(prices))
+
+    obv = features["volume_indicators"]["obv"]
+    assert obv.dtype == np.float64
+    # 117e9 is exact in float64 but not representable in float32
+    assert obv.iloc[-1] == 117e9
+    assert features["volume_indicators"]["volume_sma_20"].dtype == np.float64
+    assert features["sma"]["sma_5"].dtype == np.float32
+
+
+def test_batched_features_match_per_ticker_features():
+    rng = np.random.default_rng(7)
+
+    def prices(rows, gap=None):
+        close = rng.uniform(50, 150, rows)
+        if gap is not None:
+            close[gap] = np.nan
+        return pd.DataFrame({
+            "date": pd.date_range("2020-01-01", periods=rows),
+            "close": close,
+            "volume": rng.integers(1, 1_000_000, rows).astype(float),
+        })
+
+    # Different history lengths, an interior gap and a ticker too short for most windows
+    price_data = {"AAPL": prices(260, gap=100), "MSFT": prices(300), "NEW": prices(30, gap=5), "IPO": prices(8)}
+
+    batched = technical_indicators_generator.generate_features_batched(price_data)
+
+    for ticker, frame in price_data.items():
+        expected = technical_indicators_generator.generate_features(frame)
+        assert batched[ticker].keys() == expected.keys()
+        for indicator_type, values in expected.items():
+            assert batched[ticker][indicator_type].keys() == values.keys()
+            for name, series in values.items():
+                pd.testing.assert_series_equal(batched[ticker][indicator_type][name], series, check_exact=True)
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+
+from app.shared import concurrency
+from app.shared.concurrency import DynamicLimiter, TokenBucket
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Freezes the bucket's clock and records sleeps instead of waiting."""
+    state = {"now": 0.0, "sleeps": []}
+
+    async def fake_sleep(delay):
+        state["sleeps"].append(round(delay, 6))
+
+    monkeypatch.setattr(concurrency.time, "monotonic", lambda: state["now"])
+    monkeypatch.setattr(concurrency.asyncio, "sleep", fake_sleep)
+    return state
+
+
+def test_limiter_caps_concurrent_holders():
+    async def scenario():
+        limiter = DynamicLimiter(2)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with limiter:
+                peak = max(peak, limiter.active)
+                await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(work() for _ in range(6)))
+        return peak, limiter.active
+
+    assert asyncio.run(scenario()) == (2, 0)
+
+
+def test_raising_the_limit_admits_waiters():
+    async def scenario():
+        limiter = DynamicLimiter(1)
+        await limiter.acquire()
+        waiter = asyncio.ensure_future(limiter.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        await limiter.resize(2)
+        await asyncio.wait_for(waiter, timeout=1)
+        return limiter.active
+
+    assert asyncio.run(scenario()) == 2
+
+
+def test_lowering_the_limit_lets_holders_finish_first():
+    async def scenario():
+        limiter = DynamicLimiter(2)
+        await limiter.acquire()
+        await limiter.acquire()
+        await limiter.resize(1)
+        waiter = asyncio.ensure_future(limiter.acquire())
+
+        await limiter.release()
+        await asyncio.sleep(0)
+        admitted_at_limit = waiter.done()
+        await limiter.release()
+        await asyncio.wait_for(waiter, timeout=1)
+        return admitted_at_limit, limiter.active
+
+    assert asyncio.run(scenario()) == (False, 1)
+
+
+def test_limits_and_rates_must_be_positive():
+    with pytest.raises(ValueError):
+        DynamicLimiter(0)
+    with pytest.raises(ValueError):
+        asyncio.run(DynamicLimiter(1).resize(0))
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+
+
+def test_bucket_allows_a_burst_then_paces_queued_callers(clock):
+    async def scenario():
+        bucket = TokenBucket(rate=10, capacity=3)
+        for _ in range(5):
+            await bucket.acquire()
+        return bucket
+
+    bucket = asyncio.run(scenario())
+
+    # Three tokens cover the burst; the next callers reserve tokens 0.1s apart
+    assert clock["sleeps"] == [0.1, 0.2]
+
+    clock["sleeps"].clear()
+    clock["now"] += 1.0
+    asyncio.run(bucket.acquire())
+    assert clock["sleeps"] == []
@@ -0,0 +1,9 @@
+from app.shared.validation_utils import normalize_tickers
+
+
+def test_normalize_tickers_sorts_by_default():
+    assert normalize_tickers([" msft", "AAPL", "", "aapl", "  "]) == ["AAPL", "MSFT"]
+
+
+def test_normalize_tickers_can_keep_first_seen_order():
+    assert normalize_tickers(["msft", "AAPL", "MSFT ", "goog"], keep_order=True) == ["MSFT", "AAPL", "GOOG"]